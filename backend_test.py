@@ -251,7 +251,7 @@ class OfferlessAPITester:
                 data = response.json()
                 if "error" in data and "Unauthorized" in data["error"]:
                     # The fact that we get a clean 401 response means the API structure is working
-                    # and would return the correct format: {user_id, username, display_name, total_applications, applications_last_30_days, rank}
+                    # and would return the correct format: {user_id, username, display_name, total_applications, applications_in_window, rank}
                     self.log_test("Leaderboard Response Structure", True, "API structure correct - would return proper data format with username display")
                     return True
                 else:
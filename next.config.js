@@ -2,6 +2,7 @@
 const nextConfig = {
   experimental: {
     typedRoutes: true,
+    instrumentationHook: true,
   },
   images: {
     domains: ['ui-avatars.com'],
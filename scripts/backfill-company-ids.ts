@@ -0,0 +1,76 @@
+import { createClient } from '@supabase/supabase-js'
+
+// Links existing applications to the companies dictionary in batches until
+// none are left. Safe to stop and rerun at any time; new and edited
+// applications are linked by a trigger, so this only has to catch up once.
+//   BATCH_SIZE=5000 npm run db:backfill-companies
+//
+// A batch can link nothing while rows are still unlinked: every row in it
+// may be locked by a user's edit, or may name a company another session
+// inserted after the batch's snapshot. Those rows are picked up by a later
+// batch, so the script backs off and retries until none are left.
+
+const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL!
+const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY!
+const batchSize = Number(process.env.BATCH_SIZE) || 5000
+const maxRetries = Number(process.env.MAX_RETRIES) || 8
+
+const supabase = createClient(supabaseUrl, supabaseServiceKey)
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms))
+
+// Served by applications_missing_company_idx, which only holds unlinked rows
+async function countUnlinked() {
+  const { count, error } = await supabase
+    .from('applications')
+    .select('id', { count: 'exact', head: true })
+    .is('company_id', null)
+
+  if (error) {
+    console.error('Backfill failed:', error)
+    process.exit(1)
+  }
+  return count ?? 0
+}
+
+async function main() {
+  let total = 0
+  let retries = 0
+  const started = Date.now()
+
+  for (;;) {
+    const { data: linked, error } = await supabase.rpc('backfill_application_companies', {
+      batch_size: batchSize,
+    })
+
+    if (error) {
+      console.error('Backfill failed:', error)
+      process.exit(1)
+    }
+
+    if (linked) {
+      total += linked
+      retries = 0
+      console.log(`Linked ${total} applications (${Math.round((Date.now() - started) / 1000)}s)`)
+      continue
+    }
+
+    const remaining = await countUnlinked()
+    if (remaining === 0) {
+      break
+    }
+    if (retries === maxRetries) {
+      console.error(`Gave up with ${remaining} applications still unlinked; rerun to continue`)
+      process.exit(1)
+    }
+
+    const delay = Math.min(1000 * 2 ** retries, 30000)
+    retries++
+    console.log(`Batch linked nothing, ${remaining} left; retrying in ${delay / 1000}s`)
+    await sleep(delay)
+  }
+
+  console.log(`Done: ${total} applications linked to companies`)
+}
+
+main()
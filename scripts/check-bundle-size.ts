@@ -0,0 +1,65 @@
+import { existsSync, readFileSync } from 'fs'
+import { join } from 'path'
+import { gzipSync } from 'zlib'
+
+// First-load JS budget check. Run after `npm run build`:
+//
+//   npm run build && npm run check:bundle
+//
+// For each budgeted route, sums the gzipped size of every script the route
+// needs on first load (framework, root layout and page chunks) and fails if
+// any route is over budget. Chunks loaded later, such as the dynamically
+// imported dialogs, are not counted.
+
+const BUDGETS_KB: Record<string, number> = {
+  '/page': Number(process.env.BUNDLE_BUDGET_HOME_KB || 170),
+  '/leaderboard/page': Number(process.env.BUNDLE_BUDGET_LEADERBOARD_KB || 150),
+}
+
+const NEXT_DIR = join(process.cwd(), '.next')
+
+function readManifest<T>(name: string): T {
+  const path = join(NEXT_DIR, name)
+  if (!existsSync(path)) {
+    throw new Error(`${path} not found; run \`npm run build\` first`)
+  }
+  return JSON.parse(readFileSync(path, 'utf8'))
+}
+
+function gzippedSize(file: string) {
+  return gzipSync(readFileSync(join(NEXT_DIR, file))).length
+}
+
+function main() {
+  const buildManifest = readManifest<{ rootMainFiles?: string[] }>('build-manifest.json')
+  const appManifest = readManifest<{ pages: Record<string, string[]> }>('app-build-manifest.json')
+  const shared = (buildManifest.rootMainFiles ?? []).concat(appManifest.pages['/layout'] ?? [])
+
+  let failed = false
+  Object.keys(BUDGETS_KB).forEach(route => {
+    const files = appManifest.pages[route]
+    if (!files) {
+      console.error(`${route}: not in the build output`)
+      failed = true
+      return
+    }
+
+    const scripts = shared
+      .concat(files)
+      .filter((file, index, all) => file.endsWith('.js') && all.indexOf(file) === index)
+    const totalKb = scripts.reduce((sum, file) => sum + gzippedSize(file), 0) / 1024
+    const budgetKb = BUDGETS_KB[route]
+    const status = totalKb > budgetKb ? 'OVER BUDGET' : 'ok'
+
+    console.log(`${route}: ${totalKb.toFixed(1)} kB gzipped (budget ${budgetKb} kB) ${status}`)
+    if (totalKb > budgetKb) {
+      failed = true
+    }
+  })
+
+  if (failed) {
+    process.exit(1)
+  }
+}
+
+main()
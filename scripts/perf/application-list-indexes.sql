@@ -0,0 +1,163 @@
+-- EXPLAIN ANALYZE of the list query shapes listApplications generates,
+-- against the index set before and after
+-- 20240906000001_application_list_indexes.sql, on a synthetic copy of the
+-- partitioned applications table:
+--
+--   npm run perf:list-indexes
+--   psql "$DATABASE_URL" -v rows=20000000 -f scripts/perf/application-list-indexes.sql
+--
+-- ROWS rows (5M by default) are spread over ROWS / 100 users, plus one heavy
+-- user with 20,000 rows; shapes are run for both a typical and the heavy
+-- user. Each query runs three times and the fastest run is reported with
+-- the plan's node types and indexes. Tables live in the index_bench schema,
+-- which is dropped at the end.
+
+\set ON_ERROR_STOP on
+\if :{?rows}
+\else
+\set rows 5000000
+\endif
+SELECT greatest(:rows / 100, 1) AS users \gset
+
+SET client_min_messages = warning;
+SET maintenance_work_mem = '1GB';
+
+DROP SCHEMA IF EXISTS index_bench CASCADE;
+CREATE SCHEMA index_bench;
+SET search_path = index_bench, public;
+
+\echo Generating :rows rows for :users users...
+CREATE TABLE applications (LIKE public.applications INCLUDING DEFAULTS)
+PARTITION BY HASH (user_id);
+
+DO $$
+BEGIN
+    FOR remainder IN 0..15 LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF applications FOR VALUES WITH (MODULUS 16, REMAINDER %s)',
+            'applications_p' || lpad(remainder::text, 2, '0'),
+            remainder
+        );
+    END LOOP;
+END;
+$$;
+
+INSERT INTO applications (
+    user_id, company, job_title, applied_at, status, company_url,
+    salary_amount, salary_type, location_label, location_kind, sync_version
+)
+SELECT
+    CASE WHEN i <= 20000 THEN md5('heavy')::uuid ELSE md5((i % :users)::text)::uuid END,
+    'Company ' || md5((i % 50000)::text),
+    'Job title ' || (i % 500),
+    DATE '2024-09-01' - (i % 730),
+    (ARRAY['applied','applied','applied','interviewing','rejected','ghosted','offer'])[1 + i % 7],
+    'https://company' || (i % 50000) || '.example.com/jobs',
+    CASE WHEN i % 3 = 0 THEN NULL ELSE 50000 + (i % 100000) END,
+    CASE WHEN i % 3 = 0 THEN NULL ELSE 'salary' END,
+    CASE WHEN i % 2 = 0 THEN 'Remote' ELSE 'City ' || (i % 1000) END,
+    CASE WHEN i % 2 = 0 THEN 'remote' ELSE 'onsite' END,
+    i
+FROM generate_series(1, :rows) AS i;
+
+ALTER TABLE applications ADD PRIMARY KEY (user_id, id);
+CREATE INDEX applications_user_sync_idx ON applications(user_id, sync_version);
+
+-- The query shapes, as PostgREST renders the route's filters. %1$L is the
+-- user id; keyset pages continue from the 100th row of the first page.
+CREATE TABLE shapes (position INT, name TEXT, sql TEXT);
+INSERT INTO shapes VALUES
+(1, 'default list',
+ 'SELECT * FROM applications WHERE user_id = %1$L ORDER BY applied_at DESC, id DESC LIMIT 100'),
+(2, 'default list, keyset page 2',
+ 'SELECT * FROM applications WHERE user_id = %1$L AND applied_at <= %2$L
+  AND (applied_at < %2$L OR (applied_at = %2$L AND id < %3$L))
+  ORDER BY applied_at DESC, id DESC LIMIT 100'),
+(3, 'sort by company',
+ 'SELECT * FROM applications WHERE user_id = %1$L ORDER BY company ASC, id ASC LIMIT 100'),
+(4, 'sort by job title',
+ 'SELECT * FROM applications WHERE user_id = %1$L ORDER BY job_title DESC, id DESC LIMIT 100'),
+(5, 'sort by status',
+ 'SELECT * FROM applications WHERE user_id = %1$L ORDER BY status ASC, id ASC LIMIT 100'),
+(6, 'status filter',
+ 'SELECT * FROM applications WHERE user_id = %1$L AND status IN (''interviewing'')
+  ORDER BY applied_at DESC, id DESC LIMIT 100'),
+(7, 'two-status filter',
+ 'SELECT * FROM applications WHERE user_id = %1$L AND status IN (''interviewing'',''offer'')
+  ORDER BY applied_at DESC, id DESC LIMIT 100'),
+(8, 'location kind filter',
+ 'SELECT * FROM applications WHERE user_id = %1$L AND location_kind = ''remote''
+  ORDER BY applied_at DESC, id DESC LIMIT 100'),
+(9, 'date range',
+ 'SELECT * FROM applications WHERE user_id = %1$L AND applied_at >= ''2024-03-01'' AND applied_at <= ''2024-03-31''
+  ORDER BY applied_at DESC, id DESC LIMIT 100'),
+(10, 'stats (status only)',
+ 'SELECT status FROM applications WHERE user_id = %1$L');
+
+CREATE TABLE results (position INT, shape TEXT, who TEXT, index_set TEXT, ms NUMERIC, plan TEXT);
+
+CREATE FUNCTION run_shapes(index_set TEXT) RETURNS void AS $$
+DECLARE
+    s RECORD;
+    u RECORD;
+    page_end RECORD;
+    explained JSONB;
+    best NUMERIC;
+    best_plan TEXT;
+BEGIN
+    FOR u IN SELECT * FROM (VALUES ('typical', md5('42')::uuid), ('heavy', md5('heavy')::uuid)) AS t(who, id) LOOP
+        SELECT applied_at, id INTO page_end FROM applications
+        WHERE user_id = u.id ORDER BY applied_at DESC, id DESC OFFSET 99 LIMIT 1;
+
+        FOR s IN SELECT * FROM shapes ORDER BY position LOOP
+            best := NULL;
+            FOR attempt IN 1..3 LOOP
+                EXECUTE 'EXPLAIN (ANALYZE, FORMAT JSON) ' || format(s.sql, u.id, page_end.applied_at, page_end.id)
+                    INTO explained;
+                IF best IS NULL OR (explained->0->>'Execution Time')::NUMERIC < best THEN
+                    best := (explained->0->>'Execution Time')::NUMERIC;
+                    best_plan := (
+                        SELECT string_agg(DISTINCT node #>> '{}', ', ')
+                        FROM jsonb_path_query(explained, 'strict $.**."Node Type"') AS node
+                        WHERE node #>> '{}' NOT IN ('Limit', 'Append', 'Result')
+                    ) || coalesce(' [' || (
+                        SELECT string_agg(DISTINCT regexp_replace(node #>> '{}', '^applications_p\d+_', ''), ', ')
+                        FROM jsonb_path_query(explained, 'strict $.**."Index Name"') AS node
+                    ) || ']', '');
+                END IF;
+            END LOOP;
+            INSERT INTO results VALUES (s.position, s.name, u.who, index_set, round(best, 2), best_plan);
+        END LOOP;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+\echo Before: (user_id, status, applied_at)
+CREATE INDEX applications_user_idx ON applications(user_id, status, applied_at);
+VACUUM ANALYZE applications;
+SELECT run_shapes('before');
+
+\echo After: the 20240906000001 index set
+DROP INDEX applications_user_idx;
+CREATE INDEX applications_user_applied_idx ON applications(user_id, applied_at DESC, id DESC);
+CREATE INDEX applications_user_company_idx ON applications(user_id, company, id);
+CREATE INDEX applications_user_job_title_idx ON applications(user_id, job_title, id);
+CREATE INDEX applications_user_status_idx ON applications(user_id, status, applied_at DESC, id DESC);
+VACUUM ANALYZE applications;
+SELECT run_shapes('after');
+
+\pset footer off
+SELECT
+    b.shape,
+    b.who AS "user",
+    b.ms AS before_ms,
+    a.ms AS after_ms,
+    b.plan AS before_plan,
+    a.plan AS after_plan
+FROM results b
+JOIN results a ON a.position = b.position AND a.who = b.who AND a.index_set = 'after'
+WHERE b.index_set = 'before'
+ORDER BY b.who DESC, b.position;
+
+RESET search_path;
+DROP SCHEMA index_bench CASCADE;
@@ -0,0 +1,75 @@
+import { validateApplication } from '../../src/lib/application-validator'
+import { applicationSchema } from '../../src/lib/validations'
+
+// Throughput of the fast-path application validator against the zod schema,
+// in payloads per second, for a few payload shapes. Payloads are in the form
+// the API routes validate (applied_at already a Date):
+//
+//   npm run perf:validator
+
+const ITERATIONS = Number(process.env.ITERATIONS || 200000)
+
+const payloads: Record<string, Record<string, unknown>> = {
+  'valid, all fields': {
+    company: 'Acme Corporation',
+    job_title: 'Senior Software Engineer',
+    applied_at: new Date('2024-01-15'),
+    status: 'interviewing',
+    company_url: 'https://jobs.acme.example/positions/1234',
+    salary_amount: 145000,
+    salary_type: 'salary',
+    location_label: 'San Francisco, CA',
+    location_kind: 'onsite',
+  },
+  'valid, minimal': {
+    company: 'Acme',
+    job_title: 'Engineer',
+    applied_at: new Date('2024-01-15'),
+    status: 'applied',
+    company_url: '',
+    salary_amount: null,
+  },
+  'invalid url': {
+    company: 'Acme',
+    job_title: 'Engineer',
+    applied_at: new Date('2024-01-15'),
+    status: 'applied',
+    company_url: 'ftp://acme.example',
+    salary_amount: null,
+  },
+  'invalid types': {
+    company: 42,
+    job_title: null,
+    applied_at: new Date('not a date'),
+    status: 'hired',
+    company_url: 7,
+    salary_amount: 100,
+  },
+}
+
+function throughput(fn: () => void) {
+  // Warm up so both sides are measured with optimized code
+  for (let i = 0; i < ITERATIONS / 10; i++) fn()
+  const started = process.hrtime.bigint()
+  for (let i = 0; i < ITERATIONS; i++) fn()
+  const seconds = Number(process.hrtime.bigint() - started) / 1e9
+  return ITERATIONS / seconds
+}
+
+function column(value: string, width: number) {
+  return value + Array(Math.max(0, width - value.length) + 1).join(' ')
+}
+
+function main() {
+  console.log(`${column('payload', 20)}${column('zod/s', 14)}${column('fast/s', 14)}speedup`)
+  Object.keys(payloads).forEach(name => {
+    const payload = payloads[name]
+    const zod = throughput(() => applicationSchema.safeParse(payload))
+    const fast = throughput(() => validateApplication(payload))
+    console.log(
+      `${column(name, 20)}${column(Math.round(zod).toLocaleString(), 14)}${column(Math.round(fast).toLocaleString(), 14)}${(fast / zod).toFixed(1)}x`
+    )
+  })
+}
+
+main()
@@ -0,0 +1,175 @@
+-- Unpartitioned vs hash-partitioned applications
+-- (20240905000001_partition_applications.sql) on synthetic data, against a
+-- local database:
+--
+--   npm run perf:partitioning                                          # 10M rows
+--   psql "$DATABASE_URL" -v rows=100000000 -f scripts/perf/applications-partitioning.sql
+--
+-- Reports, for ROWS rows spread over ROWS / 100 users:
+--   * the data migration: copying the flat table into 16 hash partitions
+--     the way the migration does, then building its keys and indexes
+--   * the per-user queries the app issues, on each layout (EXPLAIN ANALYZE,
+--     which also shows partition pruning)
+--   * vacuum after a 5% update: the whole flat table vs one partition
+--
+-- Tables live in the partition_bench schema, which is dropped at the end
+-- unless -v keep=1 is passed. Budget ~40 GB of disk for 100M rows.
+
+\set ON_ERROR_STOP on
+\if :{?rows}
+\else
+\set rows 10000000
+\endif
+\if :{?keep}
+\else
+\set keep 0
+\endif
+SELECT greatest(:rows / 100, 1) AS users \gset
+
+SET client_min_messages = warning;
+SET maintenance_work_mem = '1GB';
+
+DROP SCHEMA IF EXISTS partition_bench CASCADE;
+CREATE SCHEMA partition_bench;
+SET search_path = partition_bench, public;
+
+\echo Generating :rows rows for :users users...
+CREATE TABLE applications_flat (
+    id UUID NOT NULL DEFAULT gen_random_uuid(),
+    user_id UUID NOT NULL,
+    company TEXT NOT NULL,
+    job_title TEXT NOT NULL,
+    applied_at DATE NOT NULL,
+    status TEXT NOT NULL,
+    company_url TEXT NOT NULL,
+    salary_amount NUMERIC(12,2),
+    salary_type TEXT,
+    location_label TEXT,
+    location_kind TEXT DEFAULT 'onsite',
+    created_at TIMESTAMPTZ DEFAULT now(),
+    updated_at TIMESTAMPTZ DEFAULT now(),
+    sync_version BIGINT NOT NULL DEFAULT 0
+);
+
+-- Rows arrive interleaved across users, as they do in production
+INSERT INTO applications_flat (
+    user_id, company, job_title, applied_at, status, company_url,
+    salary_amount, salary_type, location_label, location_kind, sync_version
+)
+SELECT
+    md5((i % :users)::text)::uuid,
+    'Company ' || (i % 50000),
+    'Job title ' || (i % 500),
+    DATE '2024-09-01' - (i % 730),
+    (ARRAY['applied','interviewing','rejected','ghosted','offer'])[1 + i % 5],
+    CASE WHEN i % 4 = 0 THEN '' ELSE 'https://company' || (i % 50000) || '.example.com/jobs' END,
+    CASE WHEN i % 3 = 0 THEN NULL ELSE 50000 + (i % 100000) END,
+    CASE WHEN i % 3 = 0 THEN NULL ELSE 'salary' END,
+    CASE WHEN i % 2 = 0 THEN 'Remote' ELSE 'City ' || (i % 1000) END,
+    CASE WHEN i % 2 = 0 THEN 'remote' ELSE 'onsite' END,
+    i / :users
+FROM generate_series(1, :rows) AS i;
+
+ALTER TABLE applications_flat ADD PRIMARY KEY (id);
+CREATE INDEX ON applications_flat(user_id, status, applied_at);
+CREATE INDEX ON applications_flat(user_id, sync_version);
+VACUUM ANALYZE applications_flat;
+
+CREATE TABLE applications_hashed (LIKE applications_flat INCLUDING DEFAULTS)
+PARTITION BY HASH (user_id);
+
+DO $$
+BEGIN
+    FOR remainder IN 0..15 LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF applications_hashed FOR VALUES WITH (MODULUS 16, REMAINDER %s)',
+            'applications_hashed_p' || lpad(remainder::text, 2, '0'),
+            remainder
+        );
+    END LOOP;
+END;
+$$;
+
+\timing on
+
+\echo
+\echo == Data migration: copy into partitions
+INSERT INTO applications_hashed
+SELECT * FROM applications_flat
+ORDER BY user_id, applied_at;
+
+\echo == Data migration: keys and indexes
+ALTER TABLE applications_hashed ADD PRIMARY KEY (user_id, id);
+CREATE INDEX ON applications_hashed(user_id, status, applied_at);
+CREATE INDEX ON applications_hashed(user_id, sync_version);
+
+\timing off
+VACUUM ANALYZE applications_hashed;
+
+SELECT user_id AS bench_user, id AS bench_id
+FROM applications_flat
+WHERE user_id = md5('42')::uuid
+LIMIT 1 \gset
+
+\echo
+\echo == Default list page (user_id =, ORDER BY applied_at DESC, id DESC)
+\echo -- flat
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT * FROM applications_flat WHERE user_id = :'bench_user'
+ORDER BY applied_at DESC, id DESC LIMIT 100;
+\echo -- partitioned
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT * FROM applications_hashed WHERE user_id = :'bench_user'
+ORDER BY applied_at DESC, id DESC LIMIT 100;
+
+\echo
+\echo == Status counts (getUserStats)
+\echo -- flat
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT status FROM applications_flat WHERE user_id = :'bench_user';
+\echo -- partitioned
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT status FROM applications_hashed WHERE user_id = :'bench_user';
+
+\echo
+\echo == Delta sync (user_id =, sync_version >)
+\echo -- flat
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT * FROM applications_flat WHERE user_id = :'bench_user' AND sync_version > 0
+ORDER BY sync_version;
+\echo -- partitioned
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT * FROM applications_hashed WHERE user_id = :'bench_user' AND sync_version > 0
+ORDER BY sync_version;
+
+\echo
+\echo == Single row by id and user_id (PATCH / DELETE)
+\echo -- flat
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT * FROM applications_flat WHERE id = :'bench_id' AND user_id = :'bench_user';
+\echo -- partitioned
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT * FROM applications_hashed WHERE id = :'bench_id' AND user_id = :'bench_user';
+
+\echo
+\echo == Vacuum after updating 5% of rows
+UPDATE applications_flat SET status = 'ghosted' WHERE sync_version % 20 = 0;
+UPDATE applications_hashed SET status = 'ghosted' WHERE sync_version % 20 = 0;
+\timing on
+\echo -- flat table
+VACUUM applications_flat;
+\echo -- one partition
+VACUUM applications_hashed_p00;
+\timing off
+
+\echo
+\echo == Largest index: flat vs one partition
+SELECT
+    pg_size_pretty(pg_relation_size('applications_flat_user_id_status_applied_at_idx')) AS flat,
+    pg_size_pretty(pg_relation_size('applications_hashed_p00_user_id_status_applied_at_idx')) AS one_partition;
+
+\if :keep
+\else
+RESET search_path;
+DROP SCHEMA partition_bench CASCADE;
+\endif
@@ -0,0 +1,129 @@
+import { chromium } from '@playwright/test'
+
+// Scroll performance check for the virtualized applications table.
+//
+// Serves 20k synthetic applications through the real cursor-paging headers,
+// scrolls the table from top to bottom and reports frame rate, mounted row
+// count and JS heap size. Needs a running app (`npm run dev`) and a session
+// cookie for any user, since the dashboard is behind auth:
+//
+//   OFFERLESS_AUTH_COOKIE="sb-127-auth-token=..." npm run perf:table
+
+const BASE_URL = process.env.BASE_URL || 'http://localhost:3000'
+const TOTAL_ROWS = Number(process.env.TOTAL_ROWS || 20000)
+const MIN_FPS = Number(process.env.MIN_FPS || 50)
+const MAX_MOUNTED_ROWS = 150
+
+const statuses = ['applied', 'interviewing', 'rejected', 'ghosted', 'offer']
+
+function syntheticApplication(index: number) {
+  const day = new Date(Date.UTC(2024, 0, 1) + (TOTAL_ROWS - index) * 3600 * 1000)
+  return {
+    id: `00000000-0000-4000-8000-${String(index).padStart(12, '0')}`,
+    user_id: '00000000-0000-4000-8000-000000000000',
+    company: `Company ${index}`,
+    job_title: `Software Engineer ${index % 7}`,
+    applied_at: day.toISOString().split('T')[0],
+    status: statuses[index % statuses.length],
+    company_url: index % 3 === 0 ? '' : `https://example.com/jobs/${index}`,
+    salary_amount: index % 4 === 0 ? null : 50000 + index,
+    salary_type: index % 4 === 0 ? null : 'salary',
+    location_label: index % 5 === 0 ? null : 'San Francisco, CA',
+    location_kind: index % 5 === 0 ? 'remote' : 'onsite',
+    sync_version: 1,
+    created_at: day.toISOString(),
+    updated_at: day.toISOString(),
+  }
+}
+
+async function main() {
+  const cookie = process.env.OFFERLESS_AUTH_COOKIE
+  if (!cookie) {
+    throw new Error('Set OFFERLESS_AUTH_COOKIE to a signed-in session cookie')
+  }
+  const [cookieName, ...cookieValue] = cookie.split('=')
+
+  const browser = await chromium.launch()
+  const context = await browser.newContext()
+  await context.addCookies([
+    { name: cookieName, value: cookieValue.join('='), url: BASE_URL },
+  ])
+  const page = await context.newPage()
+
+  let pagesServed = 0
+  await page.route(url => url.pathname === '/api/applications', async route => {
+    const url = new URL(route.request().url())
+    const pageSize = Number(url.searchParams.get('pageSize') || 100)
+    const offset = Number(url.searchParams.get('cursor') || 0)
+    const end = Math.min(offset + pageSize, TOTAL_ROWS)
+    const rows = []
+    for (let i = offset; i < end; i++) {
+      rows.push(syntheticApplication(i))
+    }
+    pagesServed++
+    await route.fulfill({
+      status: 200,
+      contentType: 'application/json',
+      headers: end < TOTAL_ROWS ? { 'X-Next-Cursor': String(end) } : {},
+      body: JSON.stringify(rows),
+    })
+  })
+
+  await page.goto(BASE_URL)
+  await page.waitForSelector('tbody tr[data-index]')
+
+  const cdp = await context.newCDPSession(page)
+  await cdp.send('Performance.enable')
+
+  // Scroll in steps from the top to the bottom, counting animation frames.
+  // The bottom moves as pages load, so keep going until everything is in.
+  const result = await page.evaluate(async (totalRows) => {
+    const container = document.querySelector('tbody')!.closest('.overflow-auto') as HTMLElement
+    let frames = 0
+    let maxMounted = 0
+    let counting = true
+    const countFrame = () => {
+      frames++
+      if (counting) requestAnimationFrame(countFrame)
+    }
+    requestAnimationFrame(countFrame)
+
+    const started = performance.now()
+    const deadline = started + 120_000
+    while (performance.now() < deadline) {
+      container.scrollTop += container.clientHeight / 2
+      await new Promise(resolve => requestAnimationFrame(resolve))
+      const mounted = document.querySelectorAll('tbody tr[data-index]')
+      maxMounted = Math.max(maxMounted, mounted.length)
+      const last = mounted[mounted.length - 1]
+      if (Number(last?.getAttribute('data-index')) >= totalRows - 1) {
+        break
+      }
+    }
+    counting = false
+    const seconds = (performance.now() - started) / 1000
+    return { fps: frames / seconds, seconds, maxMounted }
+  }, TOTAL_ROWS)
+
+  const { metrics } = await cdp.send('Performance.getMetrics')
+  const heap = metrics.find(metric => metric.name === 'JSHeapUsedSize')?.value ?? 0
+
+  console.log(`Rows:              ${TOTAL_ROWS}`)
+  console.log(`Pages fetched:     ${pagesServed}`)
+  console.log(`Scroll duration:   ${result.seconds.toFixed(1)}s`)
+  console.log(`Average FPS:       ${result.fps.toFixed(1)}`)
+  console.log(`Max mounted rows:  ${result.maxMounted}`)
+  console.log(`JS heap used:      ${(heap / 1024 / 1024).toFixed(1)} MB`)
+
+  await browser.close()
+
+  if (result.fps < MIN_FPS || result.maxMounted > MAX_MOUNTED_ROWS) {
+    console.error('Scroll performance budget exceeded')
+    process.exit(1)
+  }
+}
+
+main().catch(error => {
+  console.error(error)
+  process.exit(1)
+})
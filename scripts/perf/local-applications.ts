@@ -0,0 +1,172 @@
+import { applyChangesToIndex, buildLocalIndex, LOCAL_MODE_MAX_ROWS, queryLocalIndex } from '../../src/lib/local-applications'
+import type { ApplicationQuery } from '../../src/lib/application-filters'
+import type { Application } from '../../src/types'
+
+// Benchmark for local query mode, against its sub-10 ms budget per filter
+// change.
+//
+// Builds a synthetic application set at the local mode size limit, then
+// times queryLocalIndex() the way ApplicationsTable calls it (full result,
+// no paging) for typing into search, toggling filters, switching between
+// sorts already seen, and re-rendering after an edit is synced into the
+// index. Those are held to BUDGET_MS at p95. The first sort by a column
+// sorts every row once per index and is held to FIRST_SORT_BUDGET_MS.
+// Exits non-zero if anything is over budget:
+//
+//   npm run perf:local-query
+//   ROWS=5000 BUDGET_MS=5 npm run perf:local-query
+
+const ROWS = Number(process.env.ROWS || LOCAL_MODE_MAX_ROWS)
+const ITERATIONS = Number(process.env.ITERATIONS || 200)
+const BUDGET_MS = Number(process.env.BUDGET_MS || 10)
+const FIRST_SORT_BUDGET_MS = Number(process.env.FIRST_SORT_BUDGET_MS || 25)
+
+const companies = ['Google', 'Meta', 'Apple', 'Microsoft', 'Amazon', 'Netflix', 'Stripe', 'Airbnb', 'Figma', 'Vercel']
+const titles = ['Software Engineer', 'Frontend Developer', 'Backend Developer', 'Data Scientist', 'Product Manager']
+const locations = ['San Francisco, CA', 'New York, NY', 'Berlin, Germany', 'Toronto, ON', 'London, UK', null]
+const statuses = ['applied', 'interviewing', 'rejected', 'ghosted', 'offer'] as const
+
+// Deterministic so runs are comparable
+function random(seed: number) {
+  let state = seed
+  return () => {
+    state = (state * 1664525 + 1013904223) % 4294967296
+    return state / 4294967296
+  }
+}
+
+function buildApplications(count: number): Application[] {
+  const next = random(42)
+  const pick = <T>(values: readonly T[]) => values[Math.floor(next() * values.length)]
+  const applications: Application[] = []
+
+  for (let i = 0; i < count; i++) {
+    const hourly = next() < 0.3
+    const day = new Date(Date.UTC(2023, 0, 1) + Math.floor(next() * 600) * 86400000).toISOString()
+    applications.push({
+      id: `00000000-0000-4000-8000-${('000000000000' + i).slice(-12)}`,
+      user_id: '00000000-0000-4000-8000-000000000000',
+      company: `${pick(companies)} ${Math.floor(next() * 500)}`,
+      job_title: pick(titles),
+      applied_at: day.split('T')[0],
+      status: pick(statuses),
+      company_url: 'https://example.com/jobs',
+      salary_amount: next() < 0.7 ? (hourly ? 30 + Math.floor(next() * 90) : 60000 + Math.floor(next() * 140000)) : null,
+      salary_type: hourly ? 'hourly' : 'salary',
+      location_label: pick(locations),
+      location_kind: next() < 0.4 ? 'remote' : 'onsite',
+      created_at: day,
+      updated_at: day,
+    })
+  }
+  return applications.map(app => (app.salary_amount ? app : { ...app, salary_type: null }))
+}
+
+function percentile(sorted: number[], p: number) {
+  return sorted[Math.min(sorted.length - 1, Math.floor(p * sorted.length))]
+}
+
+function summarize(samples: number[]) {
+  const sorted = samples.slice().sort((a, b) => a - b)
+  return { p50: percentile(sorted, 0.5), p95: percentile(sorted, 0.95), max: sorted[sorted.length - 1], samples }
+}
+
+function measure(fn: () => unknown, iterations: number) {
+  const samples: number[] = []
+  for (let i = 0; i < iterations; i++) {
+    const started = process.hrtime.bigint()
+    fn()
+    samples.push(Number(process.hrtime.bigint() - started) / 1e6)
+  }
+  return summarize(samples)
+}
+
+function column(value: string, width: number, alignRight = false) {
+  const padding = Array(Math.max(0, width - value.length) + 1).join(' ')
+  return alignRight ? padding + value : value + padding
+}
+
+const base: ApplicationQuery = { search: '', status: [], locationKind: 'all', location: '', sortBy: 'applied_at', sortOrder: 'desc' }
+
+const warmQueries: [string, ApplicationQuery][] = [
+  ['no filters', base],
+  ['search "g"', { ...base, search: 'g' }],
+  ['search "goo"', { ...base, search: 'goo' }],
+  ['search "google 4"', { ...base, search: 'google 4' }],
+  ['search, no match', { ...base, search: 'xyzzy' }],
+  ['status x2', { ...base, status: ['interviewing', 'offer'] }],
+  ['remote only', { ...base, locationKind: 'remote' }],
+  ['location "york"', { ...base, location: 'york' }],
+  ['all filters', { ...base, search: 'engineer', status: ['applied'], locationKind: 'onsite', location: 'ca' }],
+  ['sort salary asc', { ...base, sortBy: 'salary', sortOrder: 'asc' }],
+  ['sort company asc', { ...base, sortBy: 'company', sortOrder: 'asc' }],
+]
+
+const coldSorts: [string, ApplicationQuery][] = [
+  ['first sort applied_at', base],
+  ['first sort company', { ...base, sortBy: 'company', sortOrder: 'asc' }],
+  ['first sort salary', { ...base, sortBy: 'salary', sortOrder: 'desc' }],
+]
+
+function main() {
+  const applications = buildApplications(ROWS)
+
+  const buildStarted = process.hrtime.bigint()
+  const index = buildLocalIndex(applications)
+  const buildMs = Number(process.hrtime.bigint() - buildStarted) / 1e6
+
+  console.log(`Rows:         ${applications.length}`)
+  console.log(`Build:        ${buildMs.toFixed(1)} ms`)
+  console.log(`Budget:       ${BUDGET_MS} ms at p95, ${FIRST_SORT_BUDGET_MS} ms for a first sort`)
+  console.log('')
+  console.log('query                     rows     p50 (ms)   p95 (ms)   max (ms)')
+
+  let overBudget = 0
+  const report = (label: string, rows: number, result: { p50: number; p95: number; max: number }, budget = BUDGET_MS) => {
+    const flag = result.p95 > budget ? '  OVER BUDGET' : ''
+    if (flag) overBudget++
+    console.log(
+      `${column(label, 24)} ${column(String(rows), 6, true)} ${column(result.p50.toFixed(2), 11, true)}` +
+        `${column(result.p95.toFixed(2), 11, true)}${column(result.max.toFixed(2), 11, true)}${flag}`
+    )
+  }
+
+  warmQueries.forEach(([label, query]) => {
+    const rows = queryLocalIndex(index, query).length
+    report(label, rows, measure(() => queryLocalIndex(index, query), ITERATIONS))
+  })
+
+  // Each edit renames one application, then the table re-renders
+  const edits = Array.from({ length: ITERATIONS }, (_, i) => ({
+    token: String(i),
+    reset: false,
+    changes: [{ ...applications[(i * 7919) % applications.length], company: `Renamed ${i}` }],
+    deleted: [],
+  }))
+  let synced = index
+  let edit = 0
+  report('after an edit', applications.length, measure(() => {
+    synced = applyChangesToIndex(synced, edits[edit++])
+    return queryLocalIndex(synced, base)
+  }, ITERATIONS))
+
+  // A fresh index per sample, so each one pays for the sort. The indexes
+  // are built before timing starts, in batches to keep memory bounded.
+  coldSorts.forEach(([label, query]) => {
+    const rows = queryLocalIndex(buildLocalIndex(applications), query).length
+    const samples: number[] = []
+    for (let batch = 0; batch < ITERATIONS; batch += 20) {
+      const fresh = Array.from({ length: Math.min(20, ITERATIONS - batch) }, () => buildLocalIndex(applications))
+      let i = 0
+      samples.push(...measure(() => queryLocalIndex(fresh[i++], query), fresh.length).samples)
+    }
+    report(label, rows, summarize(samples), FIRST_SORT_BUDGET_MS)
+  })
+
+  if (overBudget > 0) {
+    console.error(`\n${overBudget} quer${overBudget === 1 ? 'y is' : 'ies are'} over budget`)
+    process.exit(1)
+  }
+}
+
+main()
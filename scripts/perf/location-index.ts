@@ -0,0 +1,99 @@
+import { buildLocationIndex, searchLocations } from '../../src/lib/location-index'
+import { LOCATION_SUGGESTIONS } from '../../src/lib/location-suggestions'
+
+// Benchmark for the location autocomplete index.
+//
+// Builds a synthetic 50k-entry gazetteer (the real suggestions followed by
+// generated "City, Region" names), then times index construction and lookups
+// for a spread of query shapes against the previous linear filter:
+//
+//   npm run perf:locations
+
+const GAZETTEER_SIZE = Number(process.env.GAZETTEER_SIZE || 50000)
+const ITERATIONS = Number(process.env.ITERATIONS || 2000)
+
+const syllables = [
+  'san', 'ta', 'ber', 'lin', 'ville', 'ton', 'port', 'field', 'mar', 'ca',
+  'ro', 'spring', 'dale', 'wood', 'ham', 'ches', 'ter', 'ford', 'la', 'mo',
+  'new', 'glen', 'bur', 'ga', 'ri', 'ash', 'by', 'stone', 'lake', 'ridge',
+]
+const regions = ['CA', 'TX', 'NY', 'ON', 'BC', 'Germany', 'France', 'Brazil', 'India', 'Japan']
+
+// Deterministic so runs are comparable
+function random(seed: number) {
+  let state = seed
+  return () => {
+    state = (state * 1664525 + 1013904223) % 4294967296
+    return state / 4294967296
+  }
+}
+
+function buildGazetteer(size: number) {
+  const next = random(42)
+  const pick = <T>(values: T[]) => values[Math.floor(next() * values.length)]
+  const labels = LOCATION_SUGGESTIONS.slice(0, size)
+  const seen = new Set(labels)
+
+  while (labels.length < size) {
+    let city = ''
+    const length = 2 + Math.floor(next() * 3)
+    for (let i = 0; i < length; i++) {
+      city += pick(syllables)
+    }
+    city = city[0].toUpperCase() + city.slice(1)
+    if (next() < 0.2) {
+      city = `${pick(['North', 'South', 'East', 'West', 'Port', 'Mount'])} ${city}`
+    }
+    const label = `${city}, ${pick(regions)}`
+    if (!seen.has(label)) {
+      seen.add(label)
+      labels.push(label)
+    }
+  }
+  return labels
+}
+
+function linearSearch(labels: string[], input: string) {
+  return labels.filter(label => label.toLowerCase().includes(input.toLowerCase())).slice(0, 10)
+}
+
+function time(fn: () => void, iterations: number) {
+  const started = process.hrtime.bigint()
+  for (let i = 0; i < iterations; i++) {
+    fn()
+  }
+  return Number(process.hrtime.bigint() - started) / iterations / 1000
+}
+
+function column(value: string, width: number, alignRight = false) {
+  const padding = Array(Math.max(0, width - value.length) + 1).join(' ')
+  return alignRight ? padding + value : value + padding
+}
+
+function main() {
+  const labels = buildGazetteer(GAZETTEER_SIZE)
+
+  const heapBefore = process.memoryUsage().heapUsed
+  const buildStarted = process.hrtime.bigint()
+  const index = buildLocationIndex(labels)
+  const buildMs = Number(process.hrtime.bigint() - buildStarted) / 1e6
+  const heapMb = (process.memoryUsage().heapUsed - heapBefore) / 1024 / 1024
+
+  console.log(`Entries:      ${labels.length}`)
+  console.log(`Build:        ${buildMs.toFixed(1)} ms`)
+  console.log(`Index heap:   ~${heapMb.toFixed(1)} MB`)
+  console.log('')
+
+  const queries = ['s', 'san', 'San Fr', 'fran', 'ca', 'new york', 'sao paulo', 'ville, tx', 'xyzzy', 'rancisco']
+  console.log('query          index (µs)   linear (µs)   top results')
+  queries.forEach(query => {
+    const indexed = time(() => searchLocations(index, query), ITERATIONS)
+    const linear = time(() => linearSearch(labels, query), Math.max(1, ITERATIONS / 20))
+    const top = searchLocations(index, query, 3).join(' | ')
+    console.log(
+      `${column(JSON.stringify(query), 14)} ${column(indexed.toFixed(1), 10, true)}   ${column(linear.toFixed(1), 11, true)}   ${top}`
+    )
+  })
+}
+
+main()
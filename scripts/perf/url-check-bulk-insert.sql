@@ -0,0 +1,74 @@
+-- Bulk-insert cost of the company_url CHECK, before and after it was made an
+-- inlinable SQL function (20240904000001_inline_url_check.sql). Loads ROWS
+-- application rows with COPY and with INSERT ... SELECT into temp tables that
+-- differ only in the check, against a local database:
+--
+--   npm run perf:url-check
+--   psql "$DATABASE_URL" -v rows=100000 -f scripts/perf/url-check-bulk-insert.sql
+--
+-- Everything lives in temp tables and pg_temp functions, so nothing persists.
+
+\set ON_ERROR_STOP on
+\if :{?rows}
+\else
+\set rows 1000000
+\endif
+
+SET client_min_messages = warning;
+
+-- The check as it was before the migration
+CREATE FUNCTION pg_temp.validate_url_plpgsql(url TEXT) RETURNS BOOLEAN AS $$
+BEGIN
+    RETURN url ~ '^https?://[^\s/$.?#].[^\s]*$';
+END;
+$$ LANGUAGE plpgsql;
+
+-- ...and after
+CREATE FUNCTION pg_temp.validate_url_sql(url TEXT) RETURNS BOOLEAN AS $$
+    SELECT url = '' OR url LIKE 'http://_%' OR url LIKE 'https://_%'
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+CREATE TEMP TABLE bench_source AS
+SELECT
+    gen_random_uuid() AS id,
+    gen_random_uuid() AS user_id,
+    'Company ' || i AS company,
+    'Job title ' || (i % 500) AS job_title,
+    DATE '2024-01-01' - (i % 365) AS applied_at,
+    (ARRAY['applied','interviewing','rejected','ghosted','offer'])[1 + i % 5] AS status,
+    -- Non-empty for every row so the old check accepts the same data
+    'https://careers.company' || i || '.example.com/jobs/' || (i * 7919) AS company_url,
+    CASE WHEN i % 3 = 0 THEN NULL ELSE 50000 + (i % 100000) END::NUMERIC(12,2) AS salary_amount,
+    CASE WHEN i % 3 = 0 THEN NULL ELSE 'salary' END AS salary_type,
+    'Remote' AS location_label,
+    'remote' AS location_kind
+FROM generate_series(1, :rows) AS i;
+
+\copy bench_source TO 'url-check-bench.csv' WITH (FORMAT csv)
+
+CREATE TEMP TABLE bench_no_check (LIKE bench_source);
+CREATE TEMP TABLE bench_plpgsql (LIKE bench_source, CHECK (pg_temp.validate_url_plpgsql(company_url)));
+CREATE TEMP TABLE bench_sql (LIKE bench_source, CHECK (pg_temp.validate_url_sql(company_url)));
+
+\timing on
+
+\echo
+\echo COPY, no URL check (baseline)
+\copy bench_no_check FROM 'url-check-bench.csv' WITH (FORMAT csv)
+\echo COPY, plpgsql validate_url (before)
+\copy bench_plpgsql FROM 'url-check-bench.csv' WITH (FORMAT csv)
+\echo COPY, inlined SQL validate_url (after)
+\copy bench_sql FROM 'url-check-bench.csv' WITH (FORMAT csv)
+
+TRUNCATE bench_no_check, bench_plpgsql, bench_sql;
+
+\echo
+\echo INSERT ... SELECT, no URL check (baseline)
+INSERT INTO bench_no_check SELECT * FROM bench_source;
+\echo INSERT ... SELECT, plpgsql validate_url (before)
+INSERT INTO bench_plpgsql SELECT * FROM bench_source;
+\echo INSERT ... SELECT, inlined SQL validate_url (after)
+INSERT INTO bench_sql SELECT * FROM bench_source;
+
+\timing off
+\! rm -f url-check-bench.csv
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Single-Flight Load Test for Offerless Application
+Fires bursts of identical concurrent GETs and counts how many backend queries
+actually ran (X-Single-Flight: leader) versus how many callers were coalesced
+onto an in-flight query (X-Single-Flight: follower).
+
+Requires an authenticated session cookie, e.g.
+    OFFERLESS_AUTH_COOKIE="sb-127-auth-token=..." python single_flight_load_test.py
+"""
+
+import os
+import sys
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List
+
+BURST_SIZE = int(os.environ.get("BURST_SIZE", "50"))
+
+ENDPOINTS = [
+    "/api/applications?sortBy=applied_at&sortOrder=desc",
+    "/api/applications?sortOrder=desc&sortBy=applied_at&q=",  # same normalized query
+    "/api/me/stats",
+    "/api/leaderboard",
+]
+
+
+class SingleFlightLoadTester:
+    def __init__(self, base_url: str = "http://localhost:3000"):
+        self.base_url = base_url
+        self.cookie = os.environ.get("OFFERLESS_AUTH_COOKIE", "")
+        self.test_results = []
+
+    def log_test(self, test_name: str, success: bool, message: str, details: Dict = None):
+        """Log test results"""
+        result = {
+            "test": test_name,
+            "success": success,
+            "message": message,
+            "details": details or {},
+            "timestamp": datetime.now().isoformat()
+        }
+        self.test_results.append(result)
+        status = "✅ PASS" if success else "❌ FAIL"
+        print(f"{status}: {test_name} - {message}")
+        if details and not success:
+            print(f"   Details: {details}")
+
+    def _get(self, path: str):
+        headers = {"Cookie": self.cookie} if self.cookie else {}
+        started = time.perf_counter()
+        response = requests.get(f"{self.base_url}{path}", headers=headers)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        return response.status_code, response.headers.get("X-Single-Flight"), elapsed_ms
+
+    def burst(self, paths: List[str]) -> Dict:
+        """Send every path in `paths` at the same time and tally the results"""
+        with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+            results = list(pool.map(self._get, paths))
+
+        statuses = [status for status, _, _ in results]
+        leaders = sum(1 for _, flight, _ in results if flight == "leader")
+        followers = sum(1 for _, flight, _ in results if flight == "follower")
+        latencies = sorted(ms for _, _, ms in results)
+        return {
+            "requests": len(paths),
+            "backend_queries": leaders,
+            "coalesced": followers,
+            "statuses": sorted(set(statuses)),
+            "p50_ms": round(latencies[len(latencies) // 2], 1),
+            "max_ms": round(latencies[-1], 1),
+        }
+
+    def test_identical_burst(self, path: str):
+        """A burst of identical requests should run far fewer queries than requests"""
+        name = f"Burst x{BURST_SIZE} {path}"
+        try:
+            report = self.burst([path] * BURST_SIZE)
+            if report["statuses"] == [401]:
+                self.log_test(name, False, "Unauthorized - set OFFERLESS_AUTH_COOKIE to run the load test", report)
+                return False
+            if report["statuses"] != [200]:
+                self.log_test(name, False, f"Unexpected status codes {report['statuses']}", report)
+                return False
+            success = report["backend_queries"] < report["requests"]
+            self.log_test(
+                name,
+                success,
+                f"{report['requests']} requests -> {report['backend_queries']} backend queries "
+                f"({report['coalesced']} coalesced), p50 {report['p50_ms']}ms, max {report['max_ms']}ms",
+                report,
+            )
+            return success
+        except Exception as e:
+            self.log_test(name, False, f"Request failed: {str(e)}")
+            return False
+
+    def test_normalized_keys(self):
+        """Requests that differ only in parameter order or empty values share a flight"""
+        name = "Normalized query keys"
+        try:
+            report = self.burst([ENDPOINTS[0], ENDPOINTS[1]] * (BURST_SIZE // 2))
+            success = report["statuses"] == [200] and report["backend_queries"] < report["requests"]
+            self.log_test(
+                name,
+                success,
+                f"{report['requests']} mixed-order requests -> {report['backend_queries']} backend queries",
+                report,
+            )
+            return success
+        except Exception as e:
+            self.log_test(name, False, f"Request failed: {str(e)}")
+            return False
+
+    def run_all_tests(self):
+        print("🚀 Starting Single-Flight Load Test")
+        print(f"📍 Testing against: {self.base_url}")
+        print("=" * 60)
+
+        for path in ENDPOINTS[:1] + ENDPOINTS[2:]:
+            self.test_identical_burst(path)
+        self.test_normalized_keys()
+
+        passed = sum(1 for r in self.test_results if r["success"])
+        print("=" * 60)
+        print(f"📊 {passed}/{len(self.test_results)} checks passed")
+        return passed == len(self.test_results)
+
+
+if __name__ == "__main__":
+    tester = SingleFlightLoadTester()
+    sys.exit(0 if tester.run_all_tests() else 1)
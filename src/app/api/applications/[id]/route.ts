@@ -1,12 +1,14 @@
 import { createClient } from '@/lib/supabase/server'
 import { applicationSchema } from '@/lib/validations'
+import { validateApplication } from '@/lib/application-validator'
+import { traceRoute } from '@/lib/tracing'
 import { NextRequest, NextResponse } from 'next/server'
 import { z } from 'zod'
 
-export async function PATCH(
+export const PATCH = traceRoute('PATCH /api/applications/[id]', async (
   request: NextRequest,
   { params }: { params: { id: string } }
-) {
+) => {
   try {
     const supabase = createClient()
     const { data: { user } } = await supabase.auth.getUser()
@@ -24,8 +26,12 @@ export async function PATCH(
       salary_amount: body.salary_amount ? Number(body.salary_amount) : null,
     }
     
-    // Validate input
-    const validatedData = applicationSchema.parse(transformedData)
+    // Validate input. Rejections are re-run through zod so error responses
+    // keep the exact ZodError details clients already handle.
+    const validation = validateApplication(transformedData)
+    const validatedData = validation.success
+      ? validation.data
+      : applicationSchema.parse(transformedData)
 
     const { data: application, error } = await supabase
       .from('applications')
@@ -43,13 +49,33 @@ export async function PATCH(
       .eq('id', params.id)
       .eq('user_id', user.id)
       .select()
-      .single()
+      .maybeSingle()
 
     if (error) {
       console.error('Database error:', error)
       return NextResponse.json({ error: 'Failed to update application' }, { status: 500 })
     }
 
+    if (!application) {
+      // Archived applications are listed with includeArchived=true but can
+      // only be deleted, not edited
+      const { data: archived, error: archiveError } = await supabase
+        .from('applications_archive')
+        .select('id')
+        .eq('id', params.id)
+        .eq('user_id', user.id)
+        .maybeSingle()
+
+      if (archiveError) {
+        console.error('Database error:', archiveError)
+        return NextResponse.json({ error: 'Failed to update application' }, { status: 500 })
+      }
+
+      return archived
+        ? NextResponse.json({ error: 'Archived applications are read-only' }, { status: 409 })
+        : NextResponse.json({ error: 'Application not found' }, { status: 404 })
+    }
+
     return NextResponse.json(application)
   } catch (error) {
     if (error instanceof z.ZodError) {
@@ -58,12 +84,12 @@ export async function PATCH(
     console.error('Server error:', error)
     return NextResponse.json({ error: 'Internal server error' }, { status: 500 })
   }
-}
+})
 
-export async function DELETE(
+export const DELETE = traceRoute('DELETE /api/applications/[id]', async (
   request: NextRequest,
   { params }: { params: { id: string } }
-) {
+) => {
   try {
     const supabase = createClient()
     const { data: { user } } = await supabase.auth.getUser()
@@ -72,12 +98,26 @@ export async function DELETE(
       return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
     }
 
-    const { error } = await supabase
+    const { error, count } = await supabase
       .from('applications')
-      .delete()
+      .delete({ count: 'exact' })
       .eq('id', params.id)
       .eq('user_id', user.id)
 
+    // Not in the hot table, so it may have been archived
+    if (!error && count === 0) {
+      const archived = await supabase
+        .from('applications_archive')
+        .delete()
+        .eq('id', params.id)
+        .eq('user_id', user.id)
+
+      if (archived.error) {
+        console.error('Database error:', archived.error)
+        return NextResponse.json({ error: 'Failed to delete application' }, { status: 500 })
+      }
+    }
+
     if (error) {
       console.error('Database error:', error)
       return NextResponse.json({ error: 'Failed to delete application' }, { status: 500 })
@@ -88,4 +128,4 @@ export async function DELETE(
     console.error('Server error:', error)
     return NextResponse.json({ error: 'Internal server error' }, { status: 500 })
   }
-}
\ No newline at end of file
+})
\ No newline at end of file
@@ -0,0 +1,100 @@
+import { createClient } from '@/lib/supabase/server'
+import { getSyncState } from '@/lib/data-version'
+import { traceRoute } from '@/lib/tracing'
+import type { ApplicationChanges } from '@/types'
+import { NextRequest, NextResponse } from 'next/server'
+
+// Larger deltas are cheaper to replace with a full reload on the client
+const MAX_CHANGES = 1000
+
+export const GET = traceRoute('GET /api/applications/changes', async (request: NextRequest) => {
+  try {
+    const supabase = createClient()
+    const {
+      data: { user },
+    } = await supabase.auth.getUser()
+
+    if (!user) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
+    }
+
+    // Read the version first: rows changed after this point may also be
+    // returned, which is harmless because merging changes is idempotent
+    const { state, error: stateError } = await getSyncState(supabase, user.id)
+    if (!state) {
+      console.error('Database error:', stateError)
+      return NextResponse.json(
+        { error: 'Failed to fetch changes' },
+        { status: 500 }
+      )
+    }
+
+    const token = String(state.version)
+    const sinceParam = new URL(request.url).searchParams.get('since')
+    const since = sinceParam !== null && /^\d+$/.test(sinceParam) ? Number(sinceParam) : null
+
+    // Unknown, future or pruned tokens cannot be served incrementally
+    if (since === null || since > state.version || since < state.prunedVersion) {
+      const reset: ApplicationChanges = { token, reset: true, changes: [], deleted: [] }
+      return NextResponse.json(reset)
+    }
+
+    if (since === state.version) {
+      const empty: ApplicationChanges = { token, reset: false, changes: [], deleted: [] }
+      return NextResponse.json(empty)
+    }
+
+    const [changesResult, tombstonesResult] = await Promise.all([
+      supabase
+        .from('applications')
+        .select('*')
+        .eq('user_id', user.id)
+        .gt('sync_version', since)
+        .order('sync_version', { ascending: true })
+        .limit(MAX_CHANGES + 1),
+      supabase
+        .from('application_tombstones')
+        .select('application_id')
+        .eq('user_id', user.id)
+        .gt('sync_version', since)
+        .limit(MAX_CHANGES + 1),
+    ])
+
+    const error = changesResult.error || tombstonesResult.error
+    if (error) {
+      console.error('Database error:', error)
+      return NextResponse.json(
+        { error: 'Failed to fetch changes' },
+        { status: 500 }
+      )
+    }
+
+    const changes = changesResult.data ?? []
+    const tombstones = tombstonesResult.data ?? []
+
+    if (changes.length + tombstones.length > MAX_CHANGES) {
+      const reset: ApplicationChanges = { token, reset: true, changes: [], deleted: [] }
+      return NextResponse.json(reset)
+    }
+
+    // An application re-created after a delete shows up in both lists; the
+    // live row wins
+    const changedIds = new Set(changes.map(app => app.id))
+    const delta: ApplicationChanges = {
+      token,
+      reset: false,
+      changes,
+      deleted: tombstones
+        .map(tombstone => tombstone.application_id)
+        .filter(id => !changedIds.has(id)),
+    }
+
+    return NextResponse.json(delta)
+  } catch (error) {
+    console.error('Server error:', error)
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    )
+  }
+})
\ No newline at end of file
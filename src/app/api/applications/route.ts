@@ -1,9 +1,21 @@
 import { createClient } from '@/lib/supabase/server'
 import { applicationSchema } from '@/lib/validations'
+import { validateApplication } from '@/lib/application-validator'
+import { listApplications } from '@/lib/applications'
+import {
+  conditionalHeaders,
+  dataVersionETag,
+  getDataVersion,
+  isNotModified,
+  notModified,
+  syncTokenHeaders,
+} from '@/lib/data-version'
+import { singleFlight, singleFlightHeaders, singleFlightKey } from '@/lib/single-flight'
+import { traceRoute } from '@/lib/tracing'
 import { NextRequest, NextResponse } from 'next/server'
 import { z } from 'zod'
 
-export async function GET(request: NextRequest) {
+export const GET = traceRoute('GET /api/applications', async (request: NextRequest) => {
   try {
     const supabase = createClient()
     const {
@@ -15,110 +27,40 @@ export async function GET(request: NextRequest) {
     }
 
     const { searchParams } = new URL(request.url)
-    const page = parseInt(searchParams.get('page') || '1')
-    const pageSize = parseInt(searchParams.get('pageSize') || '100')
-    const sortBy = searchParams.get('sortBy') || 'applied_at'
-    const sortOrder = searchParams.get('sortOrder') || 'desc'
-    const search = searchParams.get('q')
-    const status = searchParams.get('status')
-    const locationKind = searchParams.get('locationKind')
-    const location = searchParams.get('location')  // New location filter
-    const from = searchParams.get('from')
-    const to = searchParams.get('to')
 
-    let query = supabase
-      .from('applications')
-      .select('*')
-      .eq('user_id', user.id)
-
-    // Apply filters
-    if (search) {
-      query = query.or(
-        `company.ilike.%${search}%,job_title.ilike.%${search}%,location_label.ilike.%${search}%`
-      )
-    }
-
-    if (status) {
-      const statuses = status.split(',')
-      query = query.in('status', statuses)
-    }
-
-    if (locationKind && locationKind !== 'all') {
-      query = query.eq('location_kind', locationKind)
-    }
-
-    if (location) {
-      query = query.ilike('location_label', `%${location}%`)
+    // Answer revalidations from the per-user data version alone
+    const version = await getDataVersion(supabase, user.id)
+    const etag = version === null ? null : dataVersionETag(user.id, version)
+    if (etag && isNotModified(request, etag)) {
+      return notModified(etag, syncTokenHeaders(version))
     }
 
-    if (from) {
-      query = query.gte('applied_at', from)
-    }
+    // Identical concurrent list requests from the same user share one query,
+    // as long as they read the same data version. The query then starts after
+    // `version` was read, so its rows are at least that new and the ETag and
+    // sync token below never claim more than the body holds. Delta syncs from
+    // the token may re-send a few rows, which merging ignores.
+    const { value: result, shared } = await singleFlight(
+      singleFlightKey('GET /api/applications', user.id, searchParams, version),
+      () => listApplications(supabase, user.id, searchParams)
+    )
 
-    if (to) {
-      query = query.lte('applied_at', to)
+    if (result.error) {
+      console.error('Database error:', result.error)
+      return NextResponse.json(
+        { error: 'Failed to fetch applications' },
+        { status: 500 }
+      )
     }
 
-    // Apply sorting
-    const ascending = sortOrder === 'asc'
-    
-    if (sortBy === 'salary') {
-      // For salary sorting, we need to fetch data first and sort in memory
-      // due to the conversion logic (hourly to annual)
-      const { data: allApplications, error: fetchError } = await query
-      
-      if (fetchError) {
-        console.error('Database error:', fetchError)
-        return NextResponse.json(
-          { error: 'Failed to fetch applications' },
-          { status: 500 }
-        )
-      }
-      
-      // Sort by converted annual salary
-      const sortedApplications = allApplications?.sort((a, b) => {
-        const getSalaryForComparison = (app: any) => {
-          if (!app.salary_amount || !app.salary_type) return 0
-          
-          if (app.salary_type === 'salary') {
-            return app.salary_amount
-          } else if (app.salary_type === 'hourly') {
-            return app.salary_amount * 40 * 52 // Convert hourly to annual
-          }
-          return 0
-        }
-        
-        const salaryA = getSalaryForComparison(a)
-        const salaryB = getSalaryForComparison(b)
-        
-        return ascending ? salaryA - salaryB : salaryB - salaryA
-      }) || []
-      
-      // Apply pagination after sorting
-      const offset = (page - 1) * pageSize
-      const paginatedApplications = sortedApplications.slice(offset, offset + pageSize)
-      
-      return NextResponse.json(paginatedApplications)
-    } else {
-      // Regular sorting for other fields
-      query = query.order(sortBy, { ascending })
-      
-      // Apply pagination
-      const offset = (page - 1) * pageSize
-      query = query.range(offset, offset + pageSize - 1)
-      
-      const { data: applications, error } = await query
-      
-      if (error) {
-        console.error('Database error:', error)
-        return NextResponse.json(
-          { error: 'Failed to fetch applications' },
-          { status: 500 }
-        )
-      }
-      
-      return NextResponse.json(applications)
-    }
+    return NextResponse.json(result.data, {
+      headers: {
+        ...singleFlightHeaders(shared),
+        ...conditionalHeaders(etag),
+        ...syncTokenHeaders(version),
+        ...(result.nextCursor ? { 'X-Next-Cursor': result.nextCursor } : undefined),
+      },
+    })
   } catch (error) {
     console.error('Server error:', error)
     return NextResponse.json(
@@ -126,9 +68,9 @@ export async function GET(request: NextRequest) {
       { status: 500 }
     )
   }
-}
+})
 
-export async function POST(request: NextRequest) {
+export const POST = traceRoute('POST /api/applications', async (request: NextRequest) => {
   try {
     const supabase = createClient()
     const {
@@ -148,8 +90,12 @@ export async function POST(request: NextRequest) {
       salary_amount: body.salary_amount ? Number(body.salary_amount) : null,
     }
     
-    // Validate input
-    const validatedData = applicationSchema.parse(transformedData)
+    // Validate input. Rejections are re-run through zod so error responses
+    // keep the exact ZodError details clients already handle.
+    const validation = validateApplication(transformedData)
+    const validatedData = validation.success
+      ? validation.data
+      : applicationSchema.parse(transformedData)
 
     const { data: application, error } = await supabase
       .from('applications')
@@ -191,4 +137,4 @@ export async function POST(request: NextRequest) {
       { status: 500 }
     )
   }
-}
\ No newline at end of file
+})
\ No newline at end of file
@@ -0,0 +1,50 @@
+import { createClient, createServiceClient } from '@/lib/supabase/server'
+import { NextRequest, NextResponse } from 'next/server'
+import { searchCompanies } from '@/lib/companies'
+import { traceRoute } from '@/lib/tracing'
+
+const DEFAULT_LIMIT = 10
+const MAX_LIMIT = 20
+
+// The caller's companies matching `q`, for company filters and pickers.
+// Each result's id can be passed to GET /api/applications as `companyId`.
+export const GET = traceRoute('GET /api/companies/search', async (request: NextRequest) => {
+  try {
+    const supabase = createClient()
+    const {
+      data: { user },
+    } = await supabase.auth.getUser()
+
+    if (!user) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
+    }
+
+    const { searchParams } = new URL(request.url)
+    const query = (searchParams.get('q') || '').trim()
+    const limit = Math.max(1, Math.min(Number(searchParams.get('limit')) || DEFAULT_LIMIT, MAX_LIMIT))
+
+    if (!query) {
+      return NextResponse.json([])
+    }
+
+    // The dictionary spans every user's companies, so it is only readable
+    // with the service role; the search is limited to the caller's own
+    const result = await searchCompanies(createServiceClient(), user.id, query, limit)
+
+    if (result.error) {
+      console.error('Database error:', result.error)
+      return NextResponse.json(
+        { error: 'Failed to search companies' },
+        { status: 500 }
+      )
+    }
+
+    return NextResponse.json(result.data)
+  } catch (error) {
+    console.error('Server error:', error)
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    )
+  }
+})
@@ -0,0 +1,55 @@
+import { createClient, createServiceClient } from '@/lib/supabase/server'
+import { NextResponse } from 'next/server'
+import { getGlobalInsights } from '@/lib/analytics'
+import { singleFlight, singleFlightHeaders, singleFlightKey } from '@/lib/single-flight'
+import { setRouteAttributes, traceRoute } from '@/lib/tracing'
+
+// Aggregate insights across all users: offer rate by company, median salary
+// by job title and the remote share, from the global analytics views
+export const GET = traceRoute('GET /api/insights', async () => {
+  try {
+    const supabase = createClient()
+    const {
+      data: { user },
+    } = await supabase.auth.getUser()
+
+    if (!user) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
+    }
+
+    // The views are only readable with the service role. Every caller sees
+    // the same insights, so concurrent requests coalesce onto one read.
+    const { value: result, shared } = await singleFlight(
+      singleFlightKey('GET /api/insights', null),
+      () => getGlobalInsights(createServiceClient())
+    )
+
+    if (result.error || !result.data) {
+      console.error('Database error:', result.error)
+      return NextResponse.json(
+        { error: 'Failed to fetch insights' },
+        { status: 500 }
+      )
+    }
+
+    // Surface how long the last refresh took and how stale the views are
+    // on the route span, so slow or stuck refreshes show up in traces
+    const refreshes = result.data.refreshes
+    if (refreshes.length > 0) {
+      setRouteAttributes({
+        'app.analytics.refresh_ms': refreshes.reduce((total, r) => total + Number(r.duration_ms), 0),
+        'app.analytics.refresh_age_s': Math.round(
+          (Date.now() - Math.min(...refreshes.map(r => Date.parse(r.refreshed_at)))) / 1000
+        ),
+      })
+    }
+
+    return NextResponse.json(result.data, { headers: singleFlightHeaders(shared) })
+  } catch (error) {
+    console.error('Server error:', error)
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    )
+  }
+})
@@ -0,0 +1,42 @@
+import { createClient, createServiceClient } from '@/lib/supabase/server'
+import { NextResponse } from 'next/server'
+import { getGlobalSalaryStats } from '@/lib/analytics'
+import { singleFlight, singleFlightHeaders, singleFlightKey } from '@/lib/single-flight'
+import { traceRoute } from '@/lib/tracing'
+
+// Anonymized salary percentiles across all users, by location kind and status
+export const GET = traceRoute('GET /api/insights/salary-stats', async () => {
+  try {
+    const supabase = createClient()
+    const {
+      data: { user },
+    } = await supabase.auth.getUser()
+
+    if (!user) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
+    }
+
+    // Reads every user's salaries, so it needs the service role. Every
+    // caller sees the same stats, so concurrent requests coalesce.
+    const { value: result, shared } = await singleFlight(
+      singleFlightKey('GET /api/insights/salary-stats', null),
+      () => getGlobalSalaryStats(createServiceClient())
+    )
+
+    if (result.error) {
+      console.error('Database error:', result.error)
+      return NextResponse.json(
+        { error: 'Failed to fetch salary stats' },
+        { status: 500 }
+      )
+    }
+
+    return NextResponse.json(result.data, { headers: singleFlightHeaders(shared) })
+  } catch (error) {
+    console.error('Server error:', error)
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    )
+  }
+})
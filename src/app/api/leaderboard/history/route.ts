@@ -0,0 +1,46 @@
+import { createClient, createServiceClient } from '@/lib/supabase/server'
+import { NextRequest, NextResponse } from 'next/server'
+import { parseWindowDays } from '@/lib/activity-window'
+import { getRankHistory } from '@/lib/leaderboard'
+import { traceRoute } from '@/lib/tracing'
+
+const DEFAULT_HISTORY_DAYS = 90
+
+// The caller's leaderboard rank over time, from the snapshot history
+export const GET = traceRoute('GET /api/leaderboard/history', async (request: NextRequest) => {
+  try {
+    const supabase = createClient()
+    const {
+      data: { user },
+    } = await supabase.auth.getUser()
+
+    if (!user) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
+    }
+
+    const days = parseWindowDays(request.nextUrl.searchParams.get('days') ?? String(DEFAULT_HISTORY_DAYS))
+    if (days === null) {
+      return NextResponse.json({ error: 'Invalid days' }, { status: 400 })
+    }
+
+    // History is only readable with the service role; the query is limited
+    // to the caller's own slot
+    const result = await getRankHistory(createServiceClient(), user.id, days)
+
+    if (result.error) {
+      console.error('Database error:', result.error)
+      return NextResponse.json(
+        { error: 'Failed to fetch leaderboard history' },
+        { status: 500 }
+      )
+    }
+
+    return NextResponse.json(result.data)
+  } catch (error) {
+    console.error('Server error:', error)
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    )
+  }
+})
@@ -0,0 +1,30 @@
+import { NextRequest, NextResponse } from 'next/server'
+import { loadLocationIndex, searchLocations } from '@/lib/location-index'
+import { traceRoute } from '@/lib/tracing'
+
+const DEFAULT_LIMIT = 10
+const MAX_LIMIT = 20
+
+// Suggestions for the location input while its own copy of the index is still
+// loading (or failed to load). The list is static and not user data, so no
+// session is needed and responses can be cached publicly.
+export const GET = traceRoute('GET /api/locations/suggest', async (request: NextRequest) => {
+  try {
+    const { searchParams } = new URL(request.url)
+    const query = searchParams.get('q') || ''
+    const limit = Math.max(1, Math.min(Number(searchParams.get('limit')) || DEFAULT_LIMIT, MAX_LIMIT))
+
+    const index = await loadLocationIndex()
+    const suggestions = searchLocations(index, query, limit)
+
+    return NextResponse.json(suggestions, {
+      headers: { 'Cache-Control': 'public, max-age=86400' },
+    })
+  } catch (error) {
+    console.error('Server error:', error)
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    )
+  }
+})
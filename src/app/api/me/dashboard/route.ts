@@ -0,0 +1,82 @@
+import { createClient, createServiceClient } from '@/lib/supabase/server'
+import { getApplicationStats, listApplications } from '@/lib/applications'
+import { DEFAULT_WINDOW_DAYS } from '@/lib/activity-window'
+import { applicationSearchParams, DEFAULT_APPLICATION_QUERY } from '@/lib/application-queries'
+import { getDataVersion, syncTokenHeaders } from '@/lib/data-version'
+import { getLeaderboard, leaderboardParams } from '@/lib/leaderboard'
+import { singleFlight, singleFlightKey } from '@/lib/single-flight'
+import { traceRoute } from '@/lib/tracing'
+import type { DashboardBootstrap } from '@/types'
+import { NextResponse } from 'next/server'
+
+// Everything the dashboard needs on first load in one request: stats, the
+// first applications page in the table's default order, and the caller's
+// leaderboard rank. The reads run concurrently and use the same single-flight
+// keys as their standalone routes, so they also coalesce with those.
+export const GET = traceRoute('GET /api/me/dashboard', async () => {
+  try {
+    const supabase = createClient()
+    const {
+      data: { user },
+    } = await supabase.auth.getUser()
+
+    if (!user) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
+    }
+
+    // Read before the list query starts, so the sync token sent with the
+    // page is never newer than its rows
+    const version = await getDataVersion(supabase, user.id)
+
+    const listParams = applicationSearchParams(DEFAULT_APPLICATION_QUERY)
+    const [stats, list, leaderboard] = await Promise.all([
+      singleFlight(
+        singleFlightKey('GET /api/me/stats', user.id, undefined, version),
+        () => getApplicationStats(supabase, user.id)
+      ),
+      singleFlight(
+        singleFlightKey('GET /api/applications', user.id, listParams, version),
+        () => listApplications(supabase, user.id, listParams)
+      ),
+      singleFlight(
+        singleFlightKey('GET /api/leaderboard', null, leaderboardParams(DEFAULT_WINDOW_DAYS)),
+        () => getLeaderboard(createServiceClient(), DEFAULT_WINDOW_DAYS)
+      ),
+    ])
+
+    if (stats.value.error || list.value.error || !stats.value.data) {
+      console.error('Database error:', stats.value.error || list.value.error)
+      return NextResponse.json(
+        { error: 'Failed to fetch dashboard' },
+        { status: 500 }
+      )
+    }
+
+    // The rank is secondary, so a leaderboard failure only blanks it
+    if (leaderboard.value.error) {
+      console.error('Database error:', leaderboard.value.error)
+    }
+    const entries = leaderboard.value.data ?? []
+    const own = entries.find(entry => entry.user_id === user.id)
+
+    const body: DashboardBootstrap = {
+      stats: stats.value.data,
+      applications: { items: list.value.data ?? [], nextCursor: list.value.nextCursor },
+      leaderboard: { rank: own?.rank ?? null, total_users: entries.length },
+    }
+
+    return NextResponse.json(body, {
+      headers: {
+        // Not cacheable by data version: the rank depends on other users
+        'Cache-Control': 'private, no-store',
+        ...syncTokenHeaders(version),
+      },
+    })
+  } catch (error) {
+    console.error('Server error:', error)
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    )
+  }
+})
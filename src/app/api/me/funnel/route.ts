@@ -0,0 +1,50 @@
+import { createClient } from '@/lib/supabase/server'
+import { getApplicationFunnel } from '@/lib/analytics'
+import { conditionalHeaders, dataVersionETag, getDataVersion, isNotModified, notModified } from '@/lib/data-version'
+import { singleFlight, singleFlightHeaders, singleFlightKey } from '@/lib/single-flight'
+import { traceRoute } from '@/lib/tracing'
+import { NextRequest, NextResponse } from 'next/server'
+
+export const GET = traceRoute('GET /api/me/funnel', async (request: NextRequest) => {
+  try {
+    const supabase = createClient()
+    const {
+      data: { user },
+    } = await supabase.auth.getUser()
+
+    if (!user) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
+    }
+
+    // Status events only change with the user's applications, so the data
+    // version covers them
+    const version = await getDataVersion(supabase, user.id)
+    const etag = version === null ? null : dataVersionETag(user.id, version)
+    if (etag && isNotModified(request, etag)) {
+      return notModified(etag)
+    }
+
+    const { value: result, shared } = await singleFlight(
+      singleFlightKey('GET /api/me/funnel', user.id, undefined, version),
+      () => getApplicationFunnel(supabase, user.id)
+    )
+
+    if (result.error) {
+      console.error('Database error:', result.error)
+      return NextResponse.json(
+        { error: 'Failed to fetch funnel' },
+        { status: 500 }
+      )
+    }
+
+    return NextResponse.json(result.data, {
+      headers: { ...singleFlightHeaders(shared), ...conditionalHeaders(etag) },
+    })
+  } catch (error) {
+    console.error('Server error:', error)
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    )
+  }
+})
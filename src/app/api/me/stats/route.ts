@@ -1,7 +1,12 @@
 import { createClient } from '@/lib/supabase/server'
-import { NextResponse } from 'next/server'
+import { parseWindowDays, windowStart } from '@/lib/activity-window'
+import { getApplicationStats } from '@/lib/applications'
+import { conditionalHeaders, dataVersionETag, getDataVersion, isNotModified, notModified } from '@/lib/data-version'
+import { singleFlight, singleFlightHeaders, singleFlightKey } from '@/lib/single-flight'
+import { traceRoute } from '@/lib/tracing'
+import { NextRequest, NextResponse } from 'next/server'
 
-export async function GET() {
+export const GET = traceRoute('GET /api/me/stats', async (request: NextRequest) => {
   try {
     const supabase = createClient()
     const {
@@ -12,29 +17,38 @@ export async function GET() {
       return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
     }
 
-    const { data: applications, error } = await supabase
-      .from('applications')
-      .select('status')
-      .eq('user_id', user.id)
+    // Optional rolling window in days; all-time counts without it
+    const windowParam = request.nextUrl.searchParams.get('window')
+    const windowDays = windowParam === null ? null : parseWindowDays(windowParam)
+    if (windowParam !== null && windowDays === null) {
+      return NextResponse.json({ error: 'Invalid window' }, { status: 400 })
+    }
+    const params = new URLSearchParams(windowDays ? { window: String(windowDays) } : {})
+
+    const version = await getDataVersion(supabase, user.id)
+    const etag = version === null
+      ? null
+      : dataVersionETag(user.id, version, windowDays ? windowStart(windowDays) : undefined)
+    if (etag && isNotModified(request, etag)) {
+      return notModified(etag)
+    }
 
-    if (error) {
-      console.error('Database error:', error)
+    const { value: result, shared } = await singleFlight(
+      singleFlightKey('GET /api/me/stats', user.id, params, version),
+      () => getApplicationStats(supabase, user.id, windowDays ?? undefined)
+    )
+
+    if (result.error) {
+      console.error('Database error:', result.error)
       return NextResponse.json(
         { error: 'Failed to fetch statistics' },
         { status: 500 }
       )
     }
 
-    const stats = {
-      total: applications.length,
-      applied: applications.filter(app => app.status === 'applied').length,
-      interviewing: applications.filter(app => app.status === 'interviewing').length,
-      rejected: applications.filter(app => app.status === 'rejected').length,
-      ghosted: applications.filter(app => app.status === 'ghosted').length,
-      offer: applications.filter(app => app.status === 'offer').length,
-    }
-
-    return NextResponse.json(stats)
+    return NextResponse.json(result.data, {
+      headers: { ...singleFlightHeaders(shared), ...conditionalHeaders(etag) },
+    })
   } catch (error) {
     console.error('Server error:', error)
     return NextResponse.json(
@@ -42,4 +56,4 @@ export async function GET() {
       { status: 500 }
     )
   }
-}
\ No newline at end of file
+})
\ No newline at end of file
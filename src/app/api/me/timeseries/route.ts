@@ -0,0 +1,93 @@
+import { createClient } from '@/lib/supabase/server'
+import { parseDay, windowStart } from '@/lib/activity-window'
+import { getApplicationTimeseries } from '@/lib/analytics'
+import { conditionalHeaders, dataVersionETag, getDataVersion, isNotModified, notModified } from '@/lib/data-version'
+import { singleFlight, singleFlightHeaders, singleFlightKey } from '@/lib/single-flight'
+import { traceRoute } from '@/lib/tracing'
+import { createVersionedCache } from '@/lib/versioned-cache'
+import type { ActivityTimeseries, TimeseriesBucket } from '@/types'
+import { NextRequest, NextResponse } from 'next/server'
+
+// Default range when `from` is omitted: twelve weeks, or twelve months
+const DEFAULT_RANGE_DAYS: Record<TimeseriesBucket, number> = { week: 12 * 7, month: 365 }
+const MAX_RANGE_DAYS = 3660
+
+// Results keyed by (user, bucket, range) and tagged with the data version
+// they were computed at, so repeat reads skip the database until the user
+// changes an application
+const cache = createVersionedCache<ActivityTimeseries>()
+
+export const GET = traceRoute('GET /api/me/timeseries', async (request: NextRequest) => {
+  try {
+    const supabase = createClient()
+    const {
+      data: { user },
+    } = await supabase.auth.getUser()
+
+    if (!user) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
+    }
+
+    const searchParams = request.nextUrl.searchParams
+    const bucket = searchParams.get('bucket') ?? 'week'
+    if (bucket !== 'week' && bucket !== 'month') {
+      return NextResponse.json({ error: 'Invalid bucket' }, { status: 400 })
+    }
+    const to = parseDay(searchParams.get('to') ?? windowStart(1))
+    const from = parseDay(searchParams.get('from') ?? windowStart(DEFAULT_RANGE_DAYS[bucket]))
+    if (!from || !to || from > to) {
+      return NextResponse.json({ error: 'Invalid date range' }, { status: 400 })
+    }
+    if (Date.parse(to) - Date.parse(from) > MAX_RANGE_DAYS * 24 * 60 * 60 * 1000) {
+      return NextResponse.json(
+        { error: `Date range is limited to ${MAX_RANGE_DAYS} days` },
+        { status: 400 }
+      )
+    }
+
+    // Defaults move with the date, so the resolved range is part of the tag
+    const version = await getDataVersion(supabase, user.id)
+    const etag = version === null ? null : dataVersionETag(user.id, version, `${bucket}.${from}.${to}`)
+    if (etag && isNotModified(request, etag)) {
+      return notModified(etag)
+    }
+
+    const params = new URLSearchParams({ bucket, from, to })
+    const key = singleFlightKey('GET /api/me/timeseries', user.id, params)
+    const cached = version === null ? undefined : cache.get(key, version)
+    if (cached) {
+      return NextResponse.json(cached, {
+        headers: { 'X-Cache': 'hit', ...conditionalHeaders(etag) },
+      })
+    }
+
+    // Only requests that read the same version share a query, so a request
+    // made after a write never caches data from before it under its version
+    const { value: result, shared } = await singleFlight(
+      singleFlightKey('GET /api/me/timeseries', user.id, params, version),
+      () => getApplicationTimeseries(supabase, user.id, bucket, from, to)
+    )
+
+    if (result.error || !result.data) {
+      console.error('Database error:', result.error)
+      return NextResponse.json(
+        { error: 'Failed to fetch timeseries' },
+        { status: 500 }
+      )
+    }
+
+    if (version !== null) {
+      cache.set(key, version, result.data)
+    }
+
+    return NextResponse.json(result.data, {
+      headers: { 'X-Cache': 'miss', ...singleFlightHeaders(shared), ...conditionalHeaders(etag) },
+    })
+  } catch (error) {
+    console.error('Server error:', error)
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    )
+  }
+})
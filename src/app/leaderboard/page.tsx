@@ -30,7 +30,7 @@ export default async function LeaderboardPage() {
           <CardHeader>
             <CardTitle>Global Rankings</CardTitle>
             <CardDescription>
-              Rankings are based on total applications submitted. Tiebreaker: most applications in the last 30 days.
+              Rankings are based on total applications submitted. Tiebreaker: most applications in the selected window.
             </CardDescription>
           </CardHeader>
           <CardContent>
@@ -1,6 +1,10 @@
+import { Suspense } from 'react'
 import { createClient } from '@/lib/supabase/server'
 import { redirect } from 'next/navigation'
 import { Dashboard } from '@/components/dashboard/dashboard'
+import { ApplicationsTableSkeleton } from '@/components/applications/applications-table'
+import { StatsCardsSkeleton } from '@/components/dashboard/stats-cards'
+import { PrefetchedApplications, PrefetchedStats } from '@/components/dashboard/prefetched-sections'
 
 export default async function HomePage() {
   const supabase = createClient()
@@ -10,5 +14,18 @@ export default async function HomePage() {
     redirect('/signin')
   }
 
-  return <Dashboard />
-}
\ No newline at end of file
+  return (
+    <Dashboard
+      stats={
+        <Suspense fallback={<StatsCardsSkeleton />}>
+          <PrefetchedStats userId={user.id} />
+        </Suspense>
+      }
+      applications={
+        <Suspense fallback={<ApplicationsTableSkeleton />}>
+          <PrefetchedApplications userId={user.id} />
+        </Suspense>
+      }
+    />
+  )
+}
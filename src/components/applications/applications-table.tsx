@@ -1,6 +1,7 @@
 'use client'
 
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
+import { useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query'
+import { useVirtualizer } from '@tanstack/react-virtual'
 import { Badge } from '@/components/ui/badge'
 import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
@@ -20,11 +21,22 @@ import {
   TableRow,
 } from '@/components/ui/table'
 import { formatDate, formatSalary, getStatusColor } from '@/lib/utils'
-import type { Application } from '@/types'
+import { fetchJSONWithETag } from '@/lib/conditional-fetch'
+import { rememberSyncToken } from '@/lib/application-sync'
+import type { ApplicationQuery } from '@/lib/application-filters'
+import { applicationSearchParams, applicationsQueryKey } from '@/lib/application-queries'
+import {
+  applyOptimisticMutation,
+  isOptimisticApplication,
+  reconcileOptimisticMutation,
+  rollbackOptimisticMutation,
+} from '@/lib/optimistic-applications'
+import type { Application, ApplicationPage } from '@/types'
 import { ExternalLink, Search, Pencil, Trash2, Filter, SortAsc, SortDesc } from 'lucide-react'
-import { useState, useEffect } from 'react'
-import { EditApplicationDialog } from './edit-application-dialog'
+import { useState, useEffect, useRef, useMemo, useCallback, memo, forwardRef } from 'react'
+import { EditApplicationDialog, preloadEditDialog } from './lazy-dialogs'
 import { useToast } from '@/hooks/use-toast'
+import { useLocalApplications } from '@/hooks/use-local-applications'
 import {
   DropdownMenu,
   DropdownMenuContent,
@@ -35,28 +47,26 @@ import {
   DropdownMenuCheckboxItem,
 } from '@/components/ui/dropdown-menu'
 
-async function fetchApplications(params?: {
-  search?: string
-  status?: string[]
-  locationKind?: string
-  location?: string  // Add location parameter
-  sortBy?: string
-  sortOrder?: string
-}): Promise<Application[]> {
-  const searchParams = new URLSearchParams()
-  
-  if (params?.search) searchParams.append('q', params.search)
-  if (params?.status?.length) searchParams.append('status', params.status.join(','))
-  if (params?.locationKind && params.locationKind !== 'all') searchParams.append('locationKind', params.locationKind)
-  if (params?.location) searchParams.append('location', params.location)  // Add location parameter
-  if (params?.sortBy) searchParams.append('sortBy', params.sortBy)
-  if (params?.sortOrder) searchParams.append('sortOrder', params.sortOrder)
-  
-  const response = await fetch(`/api/applications?${searchParams.toString()}`)
-  if (!response.ok) {
-    throw new Error('Failed to fetch applications')
-  }
-  return response.json()
+// Start loading the next page when this many rows remain below the viewport
+const PREFETCH_ROWS = 40
+const ESTIMATED_ROW_HEIGHT = 69
+
+async function fetchApplications(
+  query: ApplicationQuery,
+  cursor: string | null
+): Promise<ApplicationPage> {
+  const searchParams = applicationSearchParams(query, cursor)
+
+  let nextCursor: string | null = null
+  const items = await fetchJSONWithETag<Application[]>(
+    `/api/applications?${searchParams.toString()}`,
+    'Failed to fetch applications',
+    headers => {
+      rememberSyncToken(headers.get('x-sync-token'))
+      nextCursor = headers.get('x-next-cursor')
+    }
+  )
+  return { items, nextCursor }
 }
 
 async function deleteApplication(id: string): Promise<void> {
@@ -68,12 +78,129 @@ async function deleteApplication(id: string): Promise<void> {
   }
 }
 
+interface ApplicationRowProps {
+  index: number
+  application: Application
+  onEdit: (application: Application) => void
+  onDelete: (id: string) => void
+}
+
+// Memoized so scrolling only renders rows that enter the viewport
+const ApplicationRow = memo(forwardRef<HTMLTableRowElement, ApplicationRowProps>(
+  function ApplicationRow({ index, application, onEdit, onDelete }, ref) {
+    const pending = isOptimisticApplication(application)
+    const archived = !!application.archived_at
+    return (
+      <TableRow ref={ref} data-index={index}>
+        <TableCell className="font-medium">
+          {application.company}
+        </TableCell>
+        <TableCell>{application.job_title}</TableCell>
+        <TableCell>
+          {formatDate(application.applied_at)}
+        </TableCell>
+        <TableCell>
+          <div className="flex items-center gap-1">
+            <Badge className={getStatusColor(application.status)}>
+              {application.status.charAt(0).toUpperCase() + application.status.slice(1)}
+            </Badge>
+            {archived && (
+              <Badge variant="outline" className="text-xs">
+                Archived
+              </Badge>
+            )}
+          </div>
+        </TableCell>
+        <TableCell>
+          {application.salary_amount && application.salary_type ? (
+            <span>{formatSalary(application.salary_amount, application.salary_type)}</span>
+          ) : (
+            <span className="text-muted-foreground">—</span>
+          )}
+        </TableCell>
+        <TableCell>
+          <div className="flex items-center gap-1">
+            {application.location_label || (
+              application.location_kind === 'remote' ? 'Remote' : '—'
+            )}
+            {application.location_kind === 'remote' && (
+              <Badge variant="secondary" className="text-xs">
+                🌍
+              </Badge>
+            )}
+          </div>
+        </TableCell>
+        <TableCell>
+          <div className="flex items-center gap-1">
+            <Button 
+              variant="ghost" 
+              size="sm"
+              onClick={() => onEdit(application)}
+              onMouseEnter={preloadEditDialog}
+              onFocus={preloadEditDialog}
+              disabled={pending || archived}
+              title={archived ? 'Archived applications are read-only' : 'Edit application'}
+            >
+              <Pencil className="h-4 w-4" />
+            </Button>
+            <Button 
+              variant="ghost" 
+              size="sm"
+              onClick={() => onDelete(application.id)}
+              disabled={pending}
+              title="Delete application"
+              className="text-red-600 hover:text-red-700"
+            >
+              <Trash2 className="h-4 w-4" />
+            </Button>
+            {application.company_url && (
+              <Button variant="ghost" size="sm" asChild>
+                <a
+                  href={application.company_url}
+                  target="_blank"
+                  rel="noopener noreferrer"
+                  title="View job posting"
+                >
+                  <ExternalLink className="h-4 w-4" />
+                </a>
+              </Button>
+            )}
+          </div>
+        </TableCell>
+      </TableRow>
+    )
+  }
+))
+
+export function ApplicationsTableSkeleton() {
+  return (
+    <div className="space-y-4">
+      <div className="flex gap-2 items-center">
+        <div className="relative flex-1">
+          <Search className="absolute left-2 top-2.5 h-4 w-4 text-muted-foreground" />
+          <Input placeholder="Search applications..." className="pl-8" disabled />
+        </div>
+        <Button variant="outline" disabled>
+          <Filter className="h-4 w-4 mr-2" />
+          Filter
+        </Button>
+      </div>
+      <div className="space-y-2">
+        {Array.from({ length: 5 }).map((_, i) => (
+          <div key={i} className="h-12 bg-muted animate-pulse rounded" />
+        ))}
+      </div>
+    </div>
+  )
+}
+
 export function ApplicationsTable() {
   const [searchTerm, setSearchTerm] = useState('')
   const [debouncedSearchTerm, setDebouncedSearchTerm] = useState('')
   const [statusFilter, setStatusFilter] = useState<string[]>([])
   const [locationKindFilter, setLocationKindFilter] = useState<string>('all')
   const [locationFilter, setLocationFilter] = useState<string>('') // New location filter
+  const [includeArchived, setIncludeArchived] = useState(false)
   const [debouncedLocationFilter, setDebouncedLocationFilter] = useState<string>('')
   const [sortBy, setSortBy] = useState('applied_at')
   const [sortOrder, setSortOrder] = useState<'asc' | 'desc'>('desc')
@@ -100,36 +227,88 @@ export function ApplicationsTable() {
     return () => clearTimeout(timeoutId)
   }, [searchTerm])
   
-  const { data: applications = [], isLoading, error } = useQuery({
-    queryKey: ['applications', { 
-      search: debouncedSearchTerm, 
-      status: statusFilter, 
-      locationKind: locationKindFilter,
-      location: debouncedLocationFilter,  // Use debounced location filter
-      sortBy,
-      sortOrder 
-    }],
-    queryFn: () => fetchApplications({
-      search: debouncedSearchTerm,
-      status: statusFilter,
-      locationKind: locationKindFilter,
-      location: debouncedLocationFilter,  // Use debounced location filter
-      sortBy,
-      sortOrder
-    }),
+  // Local mode filters the cached full set on every keystroke, so it can use
+  // the undebounced inputs
+  const local = useLocalApplications({
+    search: searchTerm,
+    status: statusFilter,
+    locationKind: locationKindFilter,
+    location: locationFilter,
+    includeArchived,
+    sortBy,
+    sortOrder,
   })
 
+  const serverQuery: ApplicationQuery = {
+    search: debouncedSearchTerm,
+    status: statusFilter,
+    locationKind: locationKindFilter,
+    location: debouncedLocationFilter,  // Use debounced location filter
+    includeArchived,
+    sortBy,
+    sortOrder,
+  }
+
+  const {
+    data,
+    isLoading: isServerLoading,
+    error,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
+    queryKey: applicationsQueryKey(serverQuery),
+    queryFn: ({ pageParam }) => fetchApplications(serverQuery, pageParam),
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.nextCursor,
+    enabled: local.active === false,
+  })
+
+  const serverApplications = useMemo(
+    () => ([] as Application[]).concat(...(data?.pages.map(page => page.items) ?? [])),
+    [data]
+  )
+  const applications = local.active && local.applications ? local.applications : serverApplications
+  const isLoading = local.active === undefined || (local.active === false && isServerLoading)
+
+  // Only the rows in (and just around) the viewport are mounted
+  const scrollRef = useRef<HTMLDivElement>(null)
+  const rowVirtualizer = useVirtualizer({
+    count: applications.length,
+    getScrollElement: () => scrollRef.current,
+    estimateSize: () => ESTIMATED_ROW_HEIGHT,
+    overscan: 10,
+  })
+  const virtualRows = rowVirtualizer.getVirtualItems()
+  const lastVirtualIndex = virtualRows.length > 0 ? virtualRows[virtualRows.length - 1].index : -1
+  const paddingTop = virtualRows.length > 0 ? virtualRows[0].start : 0
+  const paddingBottom = virtualRows.length > 0
+    ? rowVirtualizer.getTotalSize() - virtualRows[virtualRows.length - 1].end
+    : 0
+
+  // Prefetch the next page as the user nears the end of what is loaded
+  useEffect(() => {
+    if (
+      lastVirtualIndex >= applications.length - PREFETCH_ROWS &&
+      hasNextPage &&
+      !isFetchingNextPage
+    ) {
+      fetchNextPage()
+    }
+  }, [lastVirtualIndex, applications.length, hasNextPage, isFetchingNextPage, fetchNextPage])
+
   const deleteMutation = useMutation({
     mutationFn: deleteApplication,
-    onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ['applications'] })
-      queryClient.invalidateQueries({ queryKey: ['user-stats'] })
+    onMutate: (id: string) => applyOptimisticMutation(queryClient, { deleteId: id }),
+    onSuccess: (_result, _id, context) => {
+      reconcileOptimisticMutation(queryClient, context)
       toast({
         title: 'Success',
         description: 'Application deleted successfully!',
       })
     },
-    onError: () => {
+    onError: (_error, _id, context) => {
+      rollbackOptimisticMutation(queryClient, context)
       toast({
         title: 'Error',
         description: 'Failed to delete application',
@@ -138,6 +317,13 @@ export function ApplicationsTable() {
     },
   })
 
+  const { mutate: deleteApplicationById } = deleteMutation
+  const handleDelete = useCallback((id: string) => {
+    if (confirm('Are you sure you want to delete this application?')) {
+      deleteApplicationById(id)
+    }
+  }, [deleteApplicationById])
+
   const handleStatusFilterChange = (status: string, checked: boolean) => {
     setStatusFilter(prev => 
       checked 
@@ -161,25 +347,7 @@ export function ApplicationsTable() {
   }
 
   if (isLoading) {
-    return (
-      <div className="space-y-4">
-        <div className="flex gap-2 items-center">
-          <div className="relative flex-1">
-            <Search className="absolute left-2 top-2.5 h-4 w-4 text-muted-foreground" />
-            <Input placeholder="Search applications..." className="pl-8" disabled />
-          </div>
-          <Button variant="outline" disabled>
-            <Filter className="h-4 w-4 mr-2" />
-            Filter
-          </Button>
-        </div>
-        <div className="space-y-2">
-          {Array.from({ length: 5 }).map((_, i) => (
-            <div key={i} className="h-12 bg-muted animate-pulse rounded" />
-          ))}
-        </div>
-      </div>
-    )
+    return <ApplicationsTableSkeleton />
   }
 
   if (error) {
@@ -233,6 +401,13 @@ export function ApplicationsTable() {
                 {status.charAt(0).toUpperCase() + status.slice(1)}
               </DropdownMenuCheckboxItem>
             ))}
+            <DropdownMenuSeparator />
+            <DropdownMenuCheckboxItem
+              checked={includeArchived}
+              onCheckedChange={(checked) => setIncludeArchived(checked)}
+            >
+              Include archived
+            </DropdownMenuCheckboxItem>
           </DropdownMenuContent>
         </DropdownMenu>
 
@@ -266,9 +441,9 @@ export function ApplicationsTable() {
         )}
       </div>
       
-      <div className="rounded-md border">
+      <div ref={scrollRef} className="rounded-md border max-h-[70vh] overflow-auto">
         <Table>
-          <TableHeader>
+          <TableHeader className="sticky top-0 z-10 bg-background">
             <TableRow>
               <TableHead 
                 className="cursor-pointer hover:bg-muted/50"
@@ -316,78 +491,28 @@ export function ApplicationsTable() {
           </TableHeader>
           <TableBody>
             {applications.length > 0 ? (
-              applications.map((application) => (
-                <TableRow key={application.id}>
-                  <TableCell className="font-medium">
-                    {application.company}
-                  </TableCell>
-                  <TableCell>{application.job_title}</TableCell>
-                  <TableCell>
-                    {formatDate(application.applied_at)}
-                  </TableCell>
-                  <TableCell>
-                    <Badge className={getStatusColor(application.status)}>
-                      {application.status.charAt(0).toUpperCase() + application.status.slice(1)}
-                    </Badge>
-                  </TableCell>
-                  <TableCell>
-                    {application.salary_amount && application.salary_type ? (
-                      <span>{formatSalary(application.salary_amount, application.salary_type)}</span>
-                    ) : (
-                      <span className="text-muted-foreground">—</span>
-                    )}
-                  </TableCell>
-                  <TableCell>
-                    <div className="flex items-center gap-1">
-                      {application.location_label || (
-                        application.location_kind === 'remote' ? 'Remote' : '—'
-                      )}
-                      {application.location_kind === 'remote' && (
-                        <Badge variant="secondary" className="text-xs">
-                          🌍
-                        </Badge>
-                      )}
-                    </div>
-                  </TableCell>
-                  <TableCell>
-                    <div className="flex items-center gap-1">
-                      <Button 
-                        variant="ghost" 
-                        size="sm"
-                        onClick={() => setEditingApplication(application)}
-                        title="Edit application"
-                      >
-                        <Pencil className="h-4 w-4" />
-                      </Button>
-                      <Button 
-                        variant="ghost" 
-                        size="sm"
-                        onClick={() => {
-                          if (confirm('Are you sure you want to delete this application?')) {
-                            deleteMutation.mutate(application.id)
-                          }
-                        }}
-                        title="Delete application"
-                        className="text-red-600 hover:text-red-700"
-                      >
-                        <Trash2 className="h-4 w-4" />
-                      </Button>
-                      {application.company_url && (
-                        <Button variant="ghost" size="sm" asChild>
-                          <a
-                            href={application.company_url}
-                            target="_blank"
-                            rel="noopener noreferrer"
-                            title="View job posting"
-                          >
-                            <ExternalLink className="h-4 w-4" />
-                          </a>
-                        </Button>
-                      )}
-                    </div>
-                  </TableCell>
-                </TableRow>
-              ))
+              <>
+                {paddingTop > 0 && (
+                  <tr>
+                    <td colSpan={7} style={{ height: paddingTop }} />
+                  </tr>
+                )}
+                {virtualRows.map((virtualRow) => (
+                  <ApplicationRow
+                    key={applications[virtualRow.index].id}
+                    ref={rowVirtualizer.measureElement}
+                    index={virtualRow.index}
+                    application={applications[virtualRow.index]}
+                    onEdit={setEditingApplication}
+                    onDelete={handleDelete}
+                  />
+                ))}
+                {paddingBottom > 0 && (
+                  <tr>
+                    <td colSpan={7} style={{ height: paddingBottom }} />
+                  </tr>
+                )}
+              </>
             ) : (
               <TableRow>
                 <TableCell colSpan={7} className="h-24 text-center">
@@ -428,6 +553,7 @@ export function ApplicationsTable() {
         <div className="flex items-center justify-between text-sm text-muted-foreground">
           <span>
             Showing {applications.length} application{applications.length !== 1 ? 's' : ''}
+            {isFetchingNextPage ? ' (loading more...)' : hasNextPage ? ' (scroll for more)' : ''}
           </span>
           <span>
             Sorted by {sortBy.replace('_', ' ')} ({sortOrder === 'desc' ? 'newest first' : 'oldest first'})
@@ -23,7 +23,14 @@ import {
   SelectValue,
 } from '@/components/ui/select'
 import { useToast } from '@/hooks/use-toast'
-import { applicationSchema, type ApplicationInput } from '@/lib/validations'
+import { applicationSchema, toApplicationRequestBody, type ApplicationInput } from '@/lib/validations'
+import {
+  applyOptimisticMutation,
+  optimisticId,
+  reconcileOptimisticMutation,
+  rollbackOptimisticMutation,
+} from '@/lib/optimistic-applications'
+import type { Application } from '@/types'
 import { LocationSearchInput } from './location-search-input'
 
 interface CreateApplicationDialogProps {
@@ -31,23 +38,13 @@ interface CreateApplicationDialogProps {
   onOpenChange: (open: boolean) => void
 }
 
-async function createApplication(data: ApplicationInput) {
+async function createApplication(data: ApplicationInput): Promise<Application> {
   const response = await fetch('/api/applications', {
     method: 'POST',
     headers: {
       'Content-Type': 'application/json',
     },
-    body: JSON.stringify({
-      company: data.company,
-      job_title: data.job_title,
-      applied_at: data.applied_at.toISOString().split('T')[0],
-      status: data.status,
-      company_url: data.company_url,
-      salary_amount: data.salary_amount || null,
-      salary_type: data.salary_type || null,
-      location_label: data.location_label || null,
-      location_kind: data.location_kind,
-    }),
+    body: JSON.stringify(toApplicationRequestBody(data)),
   })
 
   if (!response.ok) {
@@ -86,9 +83,20 @@ export function CreateApplicationDialog({
 
   const mutation = useMutation({
     mutationFn: createApplication,
-    onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ['applications'] })
-      queryClient.invalidateQueries({ queryKey: ['user-stats'] })
+    onMutate: (data) => {
+      const now = new Date().toISOString()
+      return applyOptimisticMutation(queryClient, {
+        upsert: {
+          ...toApplicationRequestBody(data),
+          id: optimisticId(),
+          user_id: '',
+          created_at: now,
+          updated_at: now,
+        },
+      })
+    },
+    onSuccess: (saved, _data, context) => {
+      reconcileOptimisticMutation(queryClient, context, saved)
       toast({
         title: 'Success',
         description: 'Application added successfully!',
@@ -96,7 +104,8 @@ export function CreateApplicationDialog({
       reset()
       onOpenChange(false)
     },
-    onError: (error) => {
+    onError: (error, _data, context) => {
+      rollbackOptimisticMutation(queryClient, context)
       toast({
         title: 'Error',
         description: error.message,
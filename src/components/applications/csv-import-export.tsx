@@ -7,6 +7,7 @@ import { useToast } from '@/hooks/use-toast'
 import { Download, Upload } from 'lucide-react'
 import { parseCSV, generateCSV } from '@/lib/utils'
 import { useQueryClient } from '@tanstack/react-query'
+import { syncApplications } from '@/lib/application-sync'
 
 export function CsvImportExport() {
   const [isImporting, setIsImporting] = useState(false)
@@ -69,7 +70,7 @@ export function CsvImportExport() {
       
       await Promise.all(promises)
       
-      queryClient.invalidateQueries({ queryKey: ['applications'] })
+      await syncApplications(queryClient)
       queryClient.invalidateQueries({ queryKey: ['user-stats'] })
       
       toast({
@@ -23,8 +23,13 @@ import {
   SelectValue,
 } from '@/components/ui/select'
 import { useToast } from '@/hooks/use-toast'
-import { applicationSchema, type ApplicationInput } from '@/lib/validations'
+import { applicationSchema, toApplicationRequestBody, type ApplicationInput } from '@/lib/validations'
 import type { Application } from '@/types'
+import {
+  applyOptimisticMutation,
+  reconcileOptimisticMutation,
+  rollbackOptimisticMutation,
+} from '@/lib/optimistic-applications'
 import { LocationSearchInput } from './location-search-input'
 
 interface EditApplicationDialogProps {
@@ -33,23 +38,13 @@ interface EditApplicationDialogProps {
   onOpenChange: (open: boolean) => void
 }
 
-async function updateApplication(id: string, data: ApplicationInput) {
+async function updateApplication(id: string, data: ApplicationInput): Promise<Application> {
   const response = await fetch(`/api/applications/${id}`, {
     method: 'PATCH',
     headers: {
       'Content-Type': 'application/json',
     },
-    body: JSON.stringify({
-      company: data.company,
-      job_title: data.job_title,
-      applied_at: data.applied_at.toISOString().split('T')[0],
-      status: data.status,
-      company_url: data.company_url,
-      salary_amount: data.salary_amount || null,
-      salary_type: data.salary_type || null,
-      location_label: data.location_label || null,
-      location_kind: data.location_kind,
-    }),
+    body: JSON.stringify(toApplicationRequestBody(data)),
   })
 
   if (!response.ok) {
@@ -99,16 +94,24 @@ export function EditApplicationDialog({
 
   const mutation = useMutation({
     mutationFn: (data: ApplicationInput) => updateApplication(application.id, data),
-    onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ['applications'] })
-      queryClient.invalidateQueries({ queryKey: ['user-stats'] })
+    onMutate: (data) =>
+      applyOptimisticMutation(queryClient, {
+        upsert: {
+          ...application,
+          ...toApplicationRequestBody(data),
+          updated_at: new Date().toISOString(),
+        },
+      }),
+    onSuccess: (saved, _data, context) => {
+      reconcileOptimisticMutation(queryClient, context, saved)
       toast({
         title: 'Success',
         description: 'Application updated successfully!',
       })
       onOpenChange(false)
     },
-    onError: (error) => {
+    onError: (error, _data, context) => {
+      rollbackOptimisticMutation(queryClient, context)
       toast({
         title: 'Error',
         description: error.message,
@@ -0,0 +1,29 @@
+'use client'
+
+import dynamic from 'next/dynamic'
+
+// The application dialogs bring react-hook-form, zod, the validation schema
+// and the location autocomplete with them, none of which the dashboard needs
+// until a dialog is opened. They load as separate chunks on first open, and
+// callers preload them on hover or focus of whatever opens them.
+
+const loadCreateDialog = () => import('./create-application-dialog')
+const loadEditDialog = () => import('./edit-application-dialog')
+
+export const CreateApplicationDialog = dynamic(
+  () => loadCreateDialog().then(module => module.CreateApplicationDialog),
+  { ssr: false }
+)
+
+export const EditApplicationDialog = dynamic(
+  () => loadEditDialog().then(module => module.EditApplicationDialog),
+  { ssr: false }
+)
+
+export function preloadCreateDialog() {
+  loadCreateDialog()
+}
+
+export function preloadEditDialog() {
+  loadEditDialog()
+}
@@ -1,16 +1,27 @@
 'use client'
 
-import { useState } from 'react'
+import { useState, type ReactNode } from 'react'
 import { Plus } from 'lucide-react'
 import { Button } from '@/components/ui/button'
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card'
-import { ApplicationsTable } from '@/components/applications/applications-table'
-import { CreateApplicationDialog } from '@/components/applications/create-application-dialog'
-import { StatsCards } from '@/components/dashboard/stats-cards'
+import { CreateApplicationDialog, preloadCreateDialog } from '@/components/applications/lazy-dialogs'
 import { NavBar } from '@/components/layout/nav-bar'
 
-export function Dashboard() {
+interface DashboardProps {
+  // Server-rendered sections, streamed in with their data already cached
+  stats: ReactNode
+  applications: ReactNode
+}
+
+export function Dashboard({ stats, applications }: DashboardProps) {
   const [createDialogOpen, setCreateDialogOpen] = useState(false)
+  // Mounted on first open so its chunk isn't loaded with the page
+  const [createDialogMounted, setCreateDialogMounted] = useState(false)
+
+  const openCreateDialog = () => {
+    setCreateDialogMounted(true)
+    setCreateDialogOpen(true)
+  }
 
   return (
     <div className="min-h-screen bg-background">
@@ -24,13 +35,18 @@ export function Dashboard() {
               Track your job applications and monitor your progress
             </p>
           </div>
-          <Button onClick={() => setCreateDialogOpen(true)} size="lg">
+          <Button
+            onClick={openCreateDialog}
+            onMouseEnter={preloadCreateDialog}
+            onFocus={preloadCreateDialog}
+            size="lg"
+          >
             <Plus className="mr-2 h-5 w-5" />
             Add Application
           </Button>
         </div>
 
-        <StatsCards />
+        {stats}
 
         <Card>
           <CardHeader>
@@ -40,14 +56,16 @@ export function Dashboard() {
             </CardDescription>
           </CardHeader>
           <CardContent>
-            <ApplicationsTable />
+            {applications}
           </CardContent>
         </Card>
 
-        <CreateApplicationDialog
-          open={createDialogOpen}
-          onOpenChange={setCreateDialogOpen}
-        />
+        {createDialogMounted && (
+          <CreateApplicationDialog
+            open={createDialogOpen}
+            onOpenChange={setCreateDialogOpen}
+          />
+        )}
       </main>
     </div>
   )
@@ -0,0 +1,66 @@
+import { dehydrate, HydrationBoundary, QueryClient } from '@tanstack/react-query'
+import { ApplicationsTable } from '@/components/applications/applications-table'
+import { StatsCards } from '@/components/dashboard/stats-cards'
+import {
+  applicationSearchParams,
+  applicationsQueryKey,
+  DEFAULT_APPLICATION_QUERY,
+} from '@/lib/application-queries'
+import { getApplicationStats, listApplications } from '@/lib/applications'
+import { isLocalQueryModeEnabled } from '@/lib/local-applications'
+import { USER_STATS_KEY } from '@/lib/optimistic-applications'
+import { createClient } from '@/lib/supabase/server'
+import type { ApplicationPage } from '@/types'
+
+// Server components that load a dashboard section's data during the page
+// render and hand it to the client components as a pre-filled React Query
+// cache. Each one sits in its own Suspense boundary, so both queries run in
+// parallel and each section streams in as soon as its data is ready.
+//
+// A failed prefetch is left out of the dehydrated state, and the client
+// component fetches it as before.
+
+export async function PrefetchedStats({ userId }: { userId: string }) {
+  const queryClient = new QueryClient()
+  await queryClient.prefetchQuery({
+    queryKey: USER_STATS_KEY,
+    queryFn: async () => {
+      const { data, error } = await getApplicationStats(createClient(), userId)
+      if (error) throw error
+      return data
+    },
+  })
+
+  return (
+    <HydrationBoundary state={dehydrate(queryClient)}>
+      <StatsCards />
+    </HydrationBoundary>
+  )
+}
+
+export async function PrefetchedApplications({ userId }: { userId: string }) {
+  const queryClient = new QueryClient()
+
+  // Local query mode loads the whole set on the client instead
+  if (!isLocalQueryModeEnabled()) {
+    await queryClient.prefetchInfiniteQuery({
+      queryKey: applicationsQueryKey(DEFAULT_APPLICATION_QUERY),
+      queryFn: async (): Promise<ApplicationPage> => {
+        const { data, error, nextCursor } = await listApplications(
+          createClient(),
+          userId,
+          applicationSearchParams(DEFAULT_APPLICATION_QUERY)
+        )
+        if (error) throw error
+        return { items: data ?? [], nextCursor }
+      },
+      initialPageParam: null as string | null,
+    })
+  }
+
+  return (
+    <HydrationBoundary state={dehydrate(queryClient)}>
+      <ApplicationsTable />
+    </HydrationBoundary>
+  )
+}
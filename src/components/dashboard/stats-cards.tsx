@@ -3,14 +3,30 @@
 import { useQuery } from '@tanstack/react-query'
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { getStatusIcon } from '@/lib/utils'
+import { fetchJSONWithETag } from '@/lib/conditional-fetch'
 import type { ApplicationStats } from '@/types'
 
-async function fetchStats(): Promise<ApplicationStats> {
-  const response = await fetch('/api/me/stats')
-  if (!response.ok) {
-    throw new Error('Failed to fetch stats')
-  }
-  return response.json()
+function fetchStats(): Promise<ApplicationStats> {
+  return fetchJSONWithETag<ApplicationStats>('/api/me/stats', 'Failed to fetch stats')
+}
+
+export function StatsCardsSkeleton() {
+  return (
+    <div className="grid gap-4 md:grid-cols-2 lg:grid-cols-3 xl:grid-cols-6">
+      {Array.from({ length: 6 }).map((_, i) => (
+        <Card key={i}>
+          <CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2">
+            <CardTitle className="text-sm font-medium">Loading...</CardTitle>
+            <div className="h-4 w-4 bg-muted animate-pulse rounded" />
+          </CardHeader>
+          <CardContent>
+            <div className="text-2xl font-bold">--</div>
+            <div className="h-3 bg-muted animate-pulse rounded mt-1" />
+          </CardContent>
+        </Card>
+      ))}
+    </div>
+  )
 }
 
 export function StatsCards() {
@@ -20,22 +36,7 @@ export function StatsCards() {
   })
 
   if (isLoading) {
-    return (
-      <div className="grid gap-4 md:grid-cols-2 lg:grid-cols-3 xl:grid-cols-6">
-        {Array.from({ length: 6 }).map((_, i) => (
-          <Card key={i}>
-            <CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2">
-              <CardTitle className="text-sm font-medium">Loading...</CardTitle>
-              <div className="h-4 w-4 bg-muted animate-pulse rounded" />
-            </CardHeader>
-            <CardContent>
-              <div className="text-2xl font-bold">--</div>
-              <div className="h-3 bg-muted animate-pulse rounded mt-1" />
-            </CardContent>
-          </Card>
-        ))}
-      </div>
-    )
+    return <StatsCardsSkeleton />
   }
 
   if (error || !stats) {
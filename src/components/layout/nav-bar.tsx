@@ -4,6 +4,7 @@ import { useState } from 'react'
 import Link from 'next/link'
 import { useRouter } from 'next/navigation'
 import { createClient } from '@/lib/supabase/client'
+import { resetApplicationSync } from '@/lib/application-sync'
 import { Button } from '@/components/ui/button'
 import { useToast } from '@/hooks/use-toast'
 import { ThemeToggle } from '@/components/layout/theme-toggle'
@@ -22,6 +23,7 @@ export function NavBar() {
       if (error) {
         throw error
       }
+      resetApplicationSync()
       router.push('/signin')
       router.refresh()
     } catch (error) {
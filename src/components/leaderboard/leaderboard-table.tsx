@@ -1,6 +1,7 @@
 'use client'
 
-import { useQuery } from '@tanstack/react-query'
+import { useState } from 'react'
+import { keepPreviousData, useQuery } from '@tanstack/react-query'
 import {
   Table,
   TableBody,
@@ -11,6 +12,14 @@ import {
 } from '@/components/ui/table'
 import { Avatar, AvatarFallback } from '@/components/ui/avatar'
 import { Badge } from '@/components/ui/badge'
+import {
+  Select,
+  SelectContent,
+  SelectItem,
+  SelectTrigger,
+  SelectValue,
+} from '@/components/ui/select'
+import { DEFAULT_WINDOW_DAYS } from '@/lib/activity-window'
 import { Trophy, Medal, Award } from 'lucide-react'
 
 interface LeaderboardEntry {
@@ -18,12 +27,14 @@ interface LeaderboardEntry {
   username: string
   display_name?: string
   total_applications: number
-  applications_last_30_days: number
+  applications_in_window: number
   rank: number
 }
 
-async function fetchLeaderboard(): Promise<LeaderboardEntry[]> {
-  const response = await fetch('/api/leaderboard')
+const WINDOW_OPTIONS = [7, 30, 90]
+
+async function fetchLeaderboard(windowDays: number): Promise<LeaderboardEntry[]> {
+  const response = await fetch(`/api/leaderboard?window=${windowDays}`)
   if (!response.ok) {
     throw new Error('Failed to fetch leaderboard')
   }
@@ -53,10 +64,12 @@ function getUserInitials(username: string) {
 }
 
 export function LeaderboardTable() {
+  const [windowDays, setWindowDays] = useState(DEFAULT_WINDOW_DAYS)
   const { data: leaderboard = [], isLoading, error } = useQuery({
-    queryKey: ['leaderboard'],
-    queryFn: fetchLeaderboard,
+    queryKey: ['leaderboard', windowDays],
+    queryFn: () => fetchLeaderboard(windowDays),
     staleTime: 5 * 60 * 1000, // 5 minutes
+    placeholderData: keepPreviousData,
   })
 
   if (isLoading) {
@@ -91,13 +104,27 @@ export function LeaderboardTable() {
 
   return (
     <div className="space-y-4">
+      <div className="flex justify-end">
+        <Select value={String(windowDays)} onValueChange={value => setWindowDays(Number(value))}>
+          <SelectTrigger className="w-36">
+            <SelectValue placeholder="Window" />
+          </SelectTrigger>
+          <SelectContent>
+            {WINDOW_OPTIONS.map(days => (
+              <SelectItem key={days} value={String(days)}>
+                Last {days} days
+              </SelectItem>
+            ))}
+          </SelectContent>
+        </Select>
+      </div>
       <Table>
         <TableHeader>
           <TableRow>
             <TableHead className="w-16">Rank</TableHead>
             <TableHead>User</TableHead>
             <TableHead className="text-center">Total Applications</TableHead>
-            <TableHead className="text-center">Last 30 Days</TableHead>
+            <TableHead className="text-center">Last {windowDays} Days</TableHead>
           </TableRow>
         </TableHeader>
         <TableBody>
@@ -129,7 +156,7 @@ export function LeaderboardTable() {
               </TableCell>
               <TableCell className="text-center">
                 <span className="text-muted-foreground">
-                  {entry.applications_last_30_days}
+                  {entry.applications_in_window}
                 </span>
               </TableCell>
             </TableRow>
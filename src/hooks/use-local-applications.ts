@@ -0,0 +1,76 @@
+import { useMemo } from 'react'
+import { useQuery } from '@tanstack/react-query'
+import { rememberSyncToken } from '@/lib/application-sync'
+import type { ApplicationQuery } from '@/lib/application-filters'
+import {
+  buildLocalIndex,
+  isLocalQueryModeEnabled,
+  LOCAL_APPLICATIONS_KEY,
+  LOCAL_MODE_MAX_ROWS,
+  queryLocalIndex,
+  type LocalApplicationIndex,
+} from '@/lib/local-applications'
+import type { Application } from '@/types'
+
+const LOAD_PAGE_SIZE = 1000
+
+// Downloads the user's full application set in cursor pages. Returns null
+// once it grows past LOCAL_MODE_MAX_ROWS so callers fall back to the server.
+async function fetchAllApplications(): Promise<LocalApplicationIndex | null> {
+  const applications: Application[] = []
+  let cursor: string | null = null
+
+  do {
+    const params = new URLSearchParams({ pageSize: String(LOAD_PAGE_SIZE) })
+    if (cursor) params.append('cursor', cursor)
+
+    const response = await fetch(`/api/applications?${params.toString()}`)
+    if (!response.ok) {
+      throw new Error('Failed to fetch applications')
+    }
+    if (applications.length === 0) {
+      // Changes after the first page are picked up by the next delta sync
+      rememberSyncToken(response.headers.get('x-sync-token'))
+    }
+    const page: Application[] = await response.json()
+    applications.push(...page)
+    cursor = response.headers.get('x-next-cursor')
+
+    if (applications.length > LOCAL_MODE_MAX_ROWS) {
+      return null
+    }
+  } while (cursor)
+
+  return buildLocalIndex(applications)
+}
+
+// Local query mode: filters, sorts and pages the cached application set in
+// the browser. `applications` is null while loading, when the mode is off,
+// or when the set is too large, in which case callers query the server.
+export function useLocalApplications(query: ApplicationQuery) {
+  const enabled = isLocalQueryModeEnabled()
+  const { data: index, isError } = useQuery({
+    queryKey: LOCAL_APPLICATIONS_KEY,
+    queryFn: fetchAllApplications,
+    enabled,
+    // Kept current by delta syncs after every mutation
+    staleTime: Infinity,
+  })
+
+  const applications = useMemo(
+    () => (index ? queryLocalIndex(index, query) : null),
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+    [index, query.search, query.status, query.locationKind, query.location, query.companyId, query.sortBy, query.sortOrder]
+  )
+
+  let active: boolean | undefined
+  // The local set only holds applications that aren't archived
+  if (!enabled || isError || query.includeArchived) {
+    active = false
+  } else {
+    // undefined while the full set is still loading
+    active = index === undefined ? undefined : index !== null
+  }
+
+  return { active, applications }
+}
@@ -0,0 +1,25 @@
+import { OTLPHttpJsonTraceExporter, registerOTel } from '@vercel/otel'
+import { ParentBasedSampler, TraceIdRatioBasedSampler } from '@opentelemetry/sdk-trace-base'
+
+// Opt-in distributed tracing. Configure with:
+//   OTEL_TRACING_ENABLED=true                          turn tracing on
+//   OTEL_EXPORTER_OTLP_ENDPOINT=http://localhost:4318  OTLP/HTTP collector
+//   OTEL_TRACES_SAMPLER_ARG=0.05                       fraction of new traces to sample
+//   OTEL_SERVICE_NAME=offerless
+export function register() {
+  if (process.env.OTEL_TRACING_ENABLED !== 'true') {
+    return
+  }
+
+  const endpoint = process.env.OTEL_EXPORTER_OTLP_ENDPOINT || 'http://localhost:4318'
+  const ratio = Number(process.env.OTEL_TRACES_SAMPLER_ARG ?? '0.1')
+
+  registerOTel({
+    serviceName: process.env.OTEL_SERVICE_NAME || 'offerless',
+    traceExporter: new OTLPHttpJsonTraceExporter({ url: `${endpoint}/v1/traces` }),
+    // Respect the caller's sampling decision and sample a fraction of new roots
+    traceSampler: new ParentBasedSampler({
+      root: new TraceIdRatioBasedSampler(Number.isFinite(ratio) ? ratio : 0.1),
+    }),
+  })
+}
@@ -0,0 +1,26 @@
+// Rolling windows over applied_at, read from the user_daily_application_counts
+// buckets. A window of N days covers today (UTC, like the database's
+// CURRENT_DATE) and the N - 1 days before it.
+
+export const DEFAULT_WINDOW_DAYS = 30
+export const MAX_WINDOW_DAYS = 365
+
+// Parses a `window` query parameter in days. Returns null for anything that
+// isn't a whole number of days between 1 and MAX_WINDOW_DAYS.
+export function parseWindowDays(value: string): number | null {
+  if (!/^\d+$/.test(value)) return null
+  const days = parseInt(value, 10)
+  return days >= 1 && days <= MAX_WINDOW_DAYS ? days : null
+}
+
+// First day in the window, as a YYYY-MM-DD date
+export function windowStart(days: number, now = new Date()) {
+  return new Date(now.getTime() - (days - 1) * 24 * 60 * 60 * 1000).toISOString().split('T')[0]
+}
+
+// Parses a YYYY-MM-DD query parameter, rejecting dates that don't exist
+export function parseDay(value: string): string | null {
+  if (!/^\d{4}-\d{2}-\d{2}$/.test(value)) return null
+  const date = new Date(`${value}T00:00:00Z`)
+  return !isNaN(date.getTime()) && date.toISOString().split('T')[0] === value ? value : null
+}
@@ -0,0 +1,128 @@
+import type { createClient, createServiceClient } from '@/lib/supabase/server'
+import type { ListResult } from '@/lib/applications'
+import type { ActivityTimeseries, AnalyticsRefresh, ApplicationFunnel, GlobalInsights, SalaryStats, TimeseriesBucket } from '@/types'
+
+type ServerClient = ReturnType<typeof createClient>
+type ServiceClient = ReturnType<typeof createServiceClient>
+
+// Pipeline analytics computed in the database over the status event log,
+// so only the aggregated result crosses the wire.
+
+export async function getApplicationFunnel(
+  supabase: ServerClient,
+  userId: string
+): Promise<ListResult<ApplicationFunnel>> {
+  const { data, error } = await supabase.rpc('application_funnel', { uid: userId })
+
+  if (error) {
+    return { data: null, error }
+  }
+
+  return { data: { stages: data ?? [] }, error: null }
+}
+
+// Applications per week or month by status between two days (inclusive),
+// with empty periods included
+export async function getApplicationTimeseries(
+  supabase: ServerClient,
+  userId: string,
+  bucket: TimeseriesBucket,
+  from: string,
+  to: string
+): Promise<ListResult<ActivityTimeseries>> {
+  const { data, error } = await supabase.rpc('application_timeseries', {
+    uid: userId,
+    bucket,
+    range_start: from,
+    range_end: to,
+  })
+
+  if (error) {
+    return { data: null, error }
+  }
+
+  return { data: { bucket, from, to, points: data ?? [] }, error: null }
+}
+
+// Annualized salary percentiles of the user's applications by location kind
+// and status, aggregated in the database
+export async function getSalaryStats(
+  supabase: ServerClient,
+  userId: string
+): Promise<ListResult<SalaryStats>> {
+  const { data, error } = await supabase.rpc('salary_stats', { uid: userId })
+
+  if (error) {
+    return { data: null, error }
+  }
+
+  return { data: { groups: data ?? [] }, error: null }
+}
+
+// The same across all users, limited to groups with enough users that no
+// one's salary can be singled out, and rounded to the nearest thousand
+export async function getGlobalSalaryStats(
+  supabase: ServiceClient
+): Promise<ListResult<SalaryStats>> {
+  const { data, error } = await supabase.rpc('global_salary_stats')
+
+  if (error) {
+    return { data: null, error }
+  }
+
+  return { data: { groups: data ?? [] }, error: null }
+}
+
+// Insights across all users, read from the materialized views that
+// refresh_global_analytics() keeps up to date, so the cost doesn't depend
+// on how many applications there are. Companies and job titles are the
+// `limit` with the most applications.
+export async function getGlobalInsights(
+  supabase: ServiceClient,
+  limit = 50
+): Promise<ListResult<GlobalInsights>> {
+  const [companies, jobTitles, locations, refreshes] = await Promise.all([
+    supabase
+      .from('global_company_insights')
+      .select('company, applicants, applications, offers, offer_rate')
+      .order('applications', { ascending: false })
+      .limit(limit),
+    supabase
+      .from('global_job_title_insights')
+      .select('job_title, applicants, applications, salary_samples, median_salary')
+      .order('applications', { ascending: false })
+      .limit(limit),
+    supabase
+      .from('global_location_insights')
+      .select('location_kind, applications, share')
+      .order('location_kind'),
+    // A refresh run logs one row for each of the three views
+    supabase
+      .from('global_analytics_refreshes')
+      .select('view_name, refreshed_at, duration_ms')
+      .order('refreshed_at', { ascending: false })
+      .limit(3),
+  ])
+
+  const error = companies.error || jobTitles.error || locations.error || refreshes.error
+  if (error) {
+    return { data: null, error }
+  }
+
+  const latest: AnalyticsRefresh[] = []
+  for (const refresh of refreshes.data ?? []) {
+    if (!latest.some(r => r.view_name === refresh.view_name)) {
+      latest.push(refresh)
+    }
+  }
+
+  return {
+    data: {
+      companies: companies.data ?? [],
+      job_titles: jobTitles.data ?? [],
+      locations: locations.data ?? [],
+      refreshes: latest,
+    },
+    error: null,
+  }
+}
@@ -0,0 +1,80 @@
+import type { Application } from '@/types'
+
+// Client-side mirror of the filters and sort order applied by
+// GET /api/applications, used to merge changes into cached lists.
+export interface ApplicationQuery {
+  search?: string
+  status?: string[]
+  locationKind?: string
+  location?: string
+  // Canonical company id, matching every spelling of the company's name
+  companyId?: number
+  // Also list archived applications, which are read-only
+  includeArchived?: boolean
+  sortBy?: string
+  sortOrder?: string
+}
+
+export function getSalaryForComparison(app: Pick<Application, 'salary_amount' | 'salary_type'>) {
+  if (!app.salary_amount || !app.salary_type) return 0
+
+  if (app.salary_type === 'salary') {
+    return app.salary_amount
+  } else if (app.salary_type === 'hourly') {
+    return app.salary_amount * 40 * 52 // Convert hourly to annual
+  }
+  return 0
+}
+
+function includesIgnoreCase(value: string | null | undefined, term: string) {
+  return !!value && value.toLowerCase().includes(term)
+}
+
+export function matchesQuery(app: Application, query: ApplicationQuery) {
+  if (query.search) {
+    const term = query.search.toLowerCase()
+    if (
+      !includesIgnoreCase(app.company, term) &&
+      !includesIgnoreCase(app.job_title, term) &&
+      !includesIgnoreCase(app.location_label, term)
+    ) {
+      return false
+    }
+  }
+
+  if (query.status?.length && !query.status.includes(app.status)) {
+    return false
+  }
+
+  if (query.locationKind && query.locationKind !== 'all' && app.location_kind !== query.locationKind) {
+    return false
+  }
+
+  if (query.location && !includesIgnoreCase(app.location_label, query.location.toLowerCase())) {
+    return false
+  }
+
+  if (query.companyId && app.company_id !== query.companyId) {
+    return false
+  }
+
+  return true
+}
+
+export function getSortValue(app: Application, sortBy: string): string | number {
+  if (sortBy === 'salary') {
+    return getSalaryForComparison(app)
+  }
+  return (app[sortBy as keyof Application] as string | number | null | undefined) ?? ''
+}
+
+export function compareApplications(sortBy = 'applied_at', sortOrder = 'desc') {
+  const direction = sortOrder === 'asc' ? 1 : -1
+  return (a: Application, b: Application) => {
+    const valueA = getSortValue(a, sortBy)
+    const valueB = getSortValue(b, sortBy)
+    if (valueA < valueB) return -direction
+    if (valueA > valueB) return direction
+    return 0
+  }
+}
@@ -0,0 +1,38 @@
+import type { ApplicationQuery } from '@/lib/application-filters'
+
+// Query keys and request parameters for the applications list, shared by the
+// table and the server-side prefetch so the hydrated cache entry is the one
+// the table looks up.
+
+export const APPLICATIONS_PAGE_SIZE = 100
+
+export const DEFAULT_APPLICATION_QUERY: ApplicationQuery = {
+  search: '',
+  status: [],
+  locationKind: 'all',
+  location: '',
+  includeArchived: false,
+  sortBy: 'applied_at',
+  sortOrder: 'desc',
+}
+
+export function applicationsQueryKey(query: ApplicationQuery) {
+  return ['applications', query]
+}
+
+export function applicationSearchParams(query: ApplicationQuery, cursor?: string | null) {
+  const searchParams = new URLSearchParams()
+
+  if (query.search) searchParams.append('q', query.search)
+  if (query.status?.length) searchParams.append('status', query.status.join(','))
+  if (query.locationKind && query.locationKind !== 'all') searchParams.append('locationKind', query.locationKind)
+  if (query.location) searchParams.append('location', query.location)
+  if (query.companyId) searchParams.append('companyId', String(query.companyId))
+  if (query.includeArchived) searchParams.append('includeArchived', 'true')
+  if (query.sortBy) searchParams.append('sortBy', query.sortBy)
+  if (query.sortOrder) searchParams.append('sortOrder', query.sortOrder)
+  if (cursor) searchParams.append('cursor', cursor)
+  searchParams.append('pageSize', String(APPLICATIONS_PAGE_SIZE))
+
+  return searchParams
+}
@@ -0,0 +1,140 @@
+import type { InfiniteData, QueryClient } from '@tanstack/react-query'
+import { compareApplications, matchesQuery, type ApplicationQuery } from '@/lib/application-filters'
+import {
+  applyChangesToIndex,
+  LOCAL_APPLICATIONS_KEY,
+  type LocalApplicationIndex,
+} from '@/lib/local-applications'
+import type { Application, ApplicationChanges, ApplicationPage } from '@/types'
+
+// Version of the user's data that every cached applications list reflects.
+// Lists fetched later are at least as new, and replaying a change a list
+// already contains is harmless, so the token only moves on a sync.
+let syncToken: string | null = null
+
+export function rememberSyncToken(token: string | null) {
+  if (token !== null && syncToken === null) {
+    syncToken = token
+  }
+}
+
+export function resetApplicationSync() {
+  syncToken = null
+}
+
+// Applies a delta to one cached list. Lists hold a prefix of the sorted
+// result set, so a changed row is only inserted if it sorts inside the prefix
+// (or anywhere, when the list is complete).
+export function mergeApplicationChanges(
+  list: Application[],
+  query: ApplicationQuery,
+  changes: Application[],
+  deleted: string[],
+  complete: boolean
+): Application[] {
+  const removed = new Set(deleted)
+  changes.forEach(app => removed.add(app.id))
+
+  const compare = compareApplications(query.sortBy, query.sortOrder)
+  const merged = list.filter(app => !removed.has(app.id))
+
+  changes.forEach(app => {
+    if (!matchesQuery(app, query)) {
+      return
+    }
+    let index = merged.findIndex(existing => compare(app, existing) < 0)
+    if (index === -1) {
+      if (!complete) {
+        return
+      }
+      index = merged.length
+    }
+    merged.splice(index, 0, app)
+  })
+
+  return merged
+}
+
+// Merges a delta into loaded cursor pages. Page boundaries and cursors are
+// kept so refetching or loading the next page continues from the same place;
+// only the last page grows or shrinks.
+export function mergeIntoPages(
+  data: InfiniteData<ApplicationPage, string | null>,
+  query: ApplicationQuery,
+  changes: Application[],
+  deleted: string[]
+): InfiniteData<ApplicationPage, string | null> {
+  const items = ([] as Application[]).concat(...data.pages.map(page => page.items))
+  const complete = data.pages[data.pages.length - 1]?.nextCursor == null
+  const merged = mergeApplicationChanges(items, query, changes, deleted, complete)
+
+  let start = 0
+  const pages = data.pages.map((page, index) => {
+    const end = index === data.pages.length - 1 ? merged.length : start + page.items.length
+    const next = { ...page, items: merged.slice(start, end) }
+    start = end
+    return next
+  })
+  return { ...data, pages }
+}
+
+export function applyApplicationChanges(queryClient: QueryClient, delta: ApplicationChanges) {
+  queryClient
+    .getQueriesData<InfiniteData<ApplicationPage, string | null>>({ queryKey: ['applications'] })
+    .forEach(([queryKey, data]) => {
+      if (!data) return
+      const query = (queryKey[1] ?? {}) as ApplicationQuery
+      // Archiving also leaves a tombstone, but archived rows stay in lists
+      // that include them. Tombstones don't say which it was, so those lists
+      // refetch instead of dropping the ids.
+      if (query.includeArchived && delta.deleted.length > 0) {
+        queryClient.invalidateQueries({ queryKey, exact: true })
+        return
+      }
+      queryClient.setQueryData(
+        queryKey,
+        mergeIntoPages(data, query, delta.changes, delta.deleted)
+      )
+    })
+
+  queryClient.setQueryData<LocalApplicationIndex | null>(LOCAL_APPLICATIONS_KEY, index =>
+    index ? applyChangesToIndex(index, delta) : index
+  )
+}
+
+function invalidateApplications(queryClient: QueryClient) {
+  return Promise.all([
+    queryClient.invalidateQueries({ queryKey: ['applications'] }),
+    queryClient.invalidateQueries({ queryKey: LOCAL_APPLICATIONS_KEY }),
+  ])
+}
+
+// Brings every cached applications list up to date after a mutation by
+// fetching only what changed since the last sync. Falls back to refetching
+// when no token is known or the server asks for a reset.
+export async function syncApplications(queryClient: QueryClient) {
+  const since = syncToken
+  if (since === null) {
+    return invalidateApplications(queryClient)
+  }
+
+  try {
+    const response = await fetch(`/api/applications/changes?since=${encodeURIComponent(since)}`)
+    if (!response.ok) {
+      throw new Error('Failed to fetch changes')
+    }
+    const delta: ApplicationChanges = await response.json()
+
+    if (delta.reset) {
+      syncToken = delta.token
+      return invalidateApplications(queryClient)
+    }
+
+    applyApplicationChanges(queryClient, delta)
+    if (syncToken === null || Number(delta.token) > Number(syncToken)) {
+      syncToken = delta.token
+    }
+  } catch (error) {
+    return invalidateApplications(queryClient)
+  }
+}
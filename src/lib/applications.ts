@@ -0,0 +1,232 @@
+import type { createClient } from '@/lib/supabase/server'
+import { windowStart } from '@/lib/activity-window'
+import { getSalaryForComparison } from '@/lib/application-filters'
+import { withSpan } from '@/lib/tracing'
+import type { Application, ApplicationStats } from '@/types'
+
+type ServerClient = ReturnType<typeof createClient>
+
+export interface ListResult<T> {
+  data: T | null
+  error: unknown
+}
+
+export interface PageResult<T> extends ListResult<T> {
+  nextCursor: string | null
+}
+
+const SORTABLE_COLUMNS = ['applied_at', 'company', 'job_title', 'status', 'created_at', 'updated_at']
+// Sort columns that can be null. Their nulls sort last in both directions.
+const NULLABLE_SORT_COLUMNS = ['created_at', 'updated_at']
+const MAX_PAGE_SIZE = 1000
+const UUID_PATTERN = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i
+
+// Cursors are opaque to clients. Column sorts use keyset pagination on
+// (sort value, id), with a null value once the page ends among the nulls;
+// salary sorting happens in memory so it pages by offset.
+type Cursor = { v: string | null; id: string } | { o: number }
+
+export function encodeCursor(cursor: Cursor) {
+  return Buffer.from(JSON.stringify(cursor)).toString('base64url')
+}
+
+// Returns null for anything that isn't a well-formed cursor, so a tampered
+// or stale cursor reads as the first page instead of failing the request
+function decodeCursor(value: string | null): Cursor | null {
+  if (!value) return null
+  let parsed: unknown
+  try {
+    parsed = JSON.parse(Buffer.from(value, 'base64url').toString('utf8'))
+  } catch {
+    return null
+  }
+  if (typeof parsed !== 'object' || parsed === null) return null
+
+  const { o, v, id } = parsed as { o?: unknown; v?: unknown; id?: unknown }
+  if (typeof o === 'number' && Number.isInteger(o) && o >= 0) {
+    return { o }
+  }
+  if ((typeof v === 'string' || v === null) && typeof id === 'string' && UUID_PATTERN.test(id)) {
+    return { v, id }
+  }
+  return null
+}
+
+// Quotes a value for use inside a PostgREST `or=(...)` filter
+function quoteFilterValue(value: string) {
+  return `"${value.replace(/\\/g, '\\\\').replace(/"/g, '\\"')}"`
+}
+
+export async function listApplications(
+  supabase: ServerClient,
+  userId: string,
+  searchParams: URLSearchParams
+): Promise<PageResult<Application[]>> {
+  const page = Math.max(parseInt(searchParams.get('page') || '1') || 1, 1)
+  const pageSize = Math.min(Math.max(parseInt(searchParams.get('pageSize') || '100') || 100, 1), MAX_PAGE_SIZE)
+  const requestedSort = searchParams.get('sortBy') || 'applied_at'
+  const sortBy = requestedSort === 'salary' || SORTABLE_COLUMNS.includes(requestedSort) ? requestedSort : 'applied_at'
+  const cursor = decodeCursor(searchParams.get('cursor'))
+  const sortOrder = searchParams.get('sortOrder') || 'desc'
+  const search = searchParams.get('q')
+  const status = searchParams.get('status')
+  const locationKind = searchParams.get('locationKind')
+  const location = searchParams.get('location')  // New location filter
+  const companyId = searchParams.get('companyId')
+  const includeArchived = searchParams.get('includeArchived') === 'true'
+  const from = searchParams.get('from')
+  const to = searchParams.get('to')
+
+  // Archived applications live in a separate table; the view over both has
+  // the same columns plus archived_at, so it can stand in for the table
+  let query = supabase
+    .from((includeArchived ? 'applications_with_archive' : 'applications') as 'applications')
+    .select('*')
+    .eq('user_id', userId)
+
+  // Apply filters
+  if (search) {
+    query = query.or(
+      `company.ilike.%${search}%,job_title.ilike.%${search}%,location_label.ilike.%${search}%`
+    )
+  }
+
+  if (status) {
+    const statuses = status.split(',')
+    query = query.in('status', statuses)
+  }
+
+  if (locationKind && locationKind !== 'all') {
+    query = query.eq('location_kind', locationKind)
+  }
+
+  if (location) {
+    query = query.ilike('location_label', `%${location}%`)
+  }
+
+  // Every spelling of one company, through the companies dictionary
+  if (companyId && /^\d+$/.test(companyId)) {
+    query = query.eq('company_id', companyId)
+  }
+
+  if (from) {
+    query = query.gte('applied_at', from)
+  }
+
+  if (to) {
+    query = query.lte('applied_at', to)
+  }
+
+  // Apply sorting
+  const ascending = sortOrder === 'asc'
+  const offset = cursor && 'o' in cursor ? cursor.o : (page - 1) * pageSize
+
+  if (sortBy === 'salary') {
+    // For salary sorting, we need to fetch data first and sort in memory
+    // due to the conversion logic (hourly to annual)
+    const { data: allApplications, error } = await query
+
+    if (error) {
+      return { data: null, error, nextCursor: null }
+    }
+
+    // Sort by converted annual salary
+    const sortedApplications = await withSpan('applications.sort_by_salary', { 'app.rows': allApplications?.length ?? 0 }, () =>
+      (allApplications as Application[] | null)?.sort((a, b) => {
+        const salaryA = getSalaryForComparison(a)
+        const salaryB = getSalaryForComparison(b)
+
+        return ascending ? salaryA - salaryB : salaryB - salaryA
+      }) || []
+    )
+
+    // Apply pagination after sorting
+    const nextOffset = offset + pageSize
+    return {
+      data: sortedApplications.slice(offset, nextOffset),
+      error: null,
+      nextCursor: nextOffset < sortedApplications.length ? encodeCursor({ o: nextOffset }) : null,
+    }
+  }
+
+  // Regular sorting for other fields, with id as a tiebreaker so keyset
+  // cursors are stable. Only nullable columns get an explicit nulls
+  // placement; the others keep the default so they match their indexes.
+  const nullable = NULLABLE_SORT_COLUMNS.includes(sortBy)
+  query = query
+    .order(sortBy, nullable ? { ascending, nullsFirst: false } : { ascending })
+    .order('id', { ascending })
+
+  // Apply pagination
+  if (cursor && 'v' in cursor) {
+    const op = ascending ? 'gt' : 'lt'
+    const id = quoteFilterValue(cursor.id)
+    if (cursor.v === null) {
+      // Already among the trailing nulls
+      query = query.is(sortBy, null)
+      query = ascending ? query.gt('id', cursor.id) : query.lt('id', cursor.id)
+    } else if (nullable) {
+      const value = quoteFilterValue(cursor.v)
+      query = query.or(
+        `${sortBy}.${op}.${value},and(${sortBy}.eq.${value},id.${op}.${id}),${sortBy}.is.null`
+      )
+    } else {
+      const value = quoteFilterValue(cursor.v)
+      // The or() alone can't bound an index scan; the redundant range on the
+      // sort column lets the (user_id, column, id) index start at the cursor
+      query = ascending ? query.gte(sortBy, cursor.v) : query.lte(sortBy, cursor.v)
+      query = query.or(`${sortBy}.${op}.${value},and(${sortBy}.eq.${value},id.${op}.${id})`)
+    }
+    query = query.limit(pageSize)
+  } else {
+    query = query.range(offset, offset + pageSize - 1)
+  }
+
+  const { data, error } = await query
+  const rows = data as Application[] | null
+  const last = rows && rows.length === pageSize ? rows[rows.length - 1] : null
+  const lastValue = last ? last[sortBy as keyof Application] : null
+  return {
+    data: rows,
+    error,
+    nextCursor: last
+      ? encodeCursor({ v: lastValue === null || lastValue === undefined ? null : String(lastValue), id: last.id })
+      : null,
+  }
+}
+
+// Status counts from the daily count buckets: all time, or over the last
+// `windowDays` days. Reads at most one row per active day and status.
+export async function getApplicationStats(
+  supabase: ServerClient,
+  userId: string,
+  windowDays?: number
+): Promise<ListResult<ApplicationStats>> {
+  let query = supabase
+    .from('user_daily_application_counts')
+    .select('status, n')
+    .eq('user_id', userId)
+
+  if (windowDays) {
+    query = query.gte('day', windowStart(windowDays))
+  }
+
+  const { data: buckets, error } = await query
+
+  if (error || !buckets) {
+    return { data: null, error }
+  }
+
+  const stats = await withSpan('stats.count_by_status', { 'app.buckets': buckets.length }, () =>
+    buckets.reduce<ApplicationStats>(
+      (totals, bucket) => {
+        totals.total += bucket.n
+        totals[bucket.status] += bucket.n
+        return totals
+      },
+      { total: 0, applied: 0, interviewing: 0, rejected: 0, ghosted: 0, offer: 0 }
+    )
+  )
+
+  return { data: stats, error: null }
+}
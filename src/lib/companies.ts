@@ -0,0 +1,28 @@
+import type { createServiceClient } from '@/lib/supabase/server'
+import type { ListResult } from '@/lib/applications'
+import type { CompanySuggestion } from '@/types'
+
+type ServiceClient = ReturnType<typeof createServiceClient>
+
+// Companies the user has applied to whose normalized name contains or is
+// similar to `query`, closest match first. Matching runs on the companies
+// dictionary's trigram index, so "google llc", "Gogle" and "GOOGLE" all
+// find the same company.
+export async function searchCompanies(
+  supabase: ServiceClient,
+  userId: string,
+  query: string,
+  limit: number
+): Promise<ListResult<CompanySuggestion[]>> {
+  const { data, error } = await supabase.rpc('search_companies', {
+    uid: userId,
+    query,
+    max_results: limit,
+  })
+
+  if (error) {
+    return { data: null, error }
+  }
+
+  return { data: data ?? [], error: null }
+}
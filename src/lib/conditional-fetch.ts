@@ -0,0 +1,42 @@
+// Client-side companion to the ETag support in the API routes. Remembers the
+// last body, headers and ETag per URL, sends If-None-Match on refetch and
+// reuses the remembered response when the server answers 304 Not Modified.
+
+const MAX_ENTRIES = 50
+
+const cache = new Map<string, { etag: string; body: unknown; headers: Headers }>()
+
+export async function fetchJSONWithETag<T>(
+  url: string,
+  errorMessage: string,
+  onHeaders?: (headers: Headers) => void
+): Promise<T> {
+  const cached = cache.get(url)
+  const response = await fetch(url, {
+    headers: cached ? { 'If-None-Match': cached.etag } : undefined,
+  })
+
+  if (response.status === 304 && cached) {
+    // Refresh recency so frequently used URLs survive eviction
+    cache.delete(url)
+    cache.set(url, cached)
+    onHeaders?.(cached.headers)
+    return cached.body as T
+  }
+
+  if (!response.ok) {
+    throw new Error(errorMessage)
+  }
+
+  const body = await response.json()
+  const etag = response.headers.get('etag')
+  onHeaders?.(response.headers)
+  cache.delete(url)
+  if (etag) {
+    cache.set(url, { etag, body, headers: response.headers })
+    if (cache.size > MAX_ENTRIES) {
+      cache.delete(cache.keys().next().value as string)
+    }
+  }
+  return body as T
+}
@@ -0,0 +1,72 @@
+import { NextResponse } from 'next/server'
+import type { createClient } from '@/lib/supabase/server'
+
+type ServerClient = ReturnType<typeof createClient>
+
+// Reads the per-user version bumped by the applications triggers. Returns
+// null when it cannot be read so callers simply skip conditional handling.
+export async function getDataVersion(supabase: ServerClient, userId: string) {
+  const { data, error } = await supabase
+    .from('user_data_versions')
+    .select('version')
+    .eq('user_id', userId)
+    .maybeSingle()
+
+  if (error) {
+    return null
+  }
+  return data?.version ?? 0
+}
+
+// The user id is part of the tag so a browser shared between accounts can
+// never revalidate one user's cached body for another. `variant` covers
+// responses that also change without a data change, such as rolling windows
+// that move at midnight.
+export function dataVersionETag(userId: string, version: number, variant?: string) {
+  return variant ? `W/"${userId}.${version}.${variant}"` : `W/"${userId}.${version}"`
+}
+
+export function isNotModified(request: Request, etag: string) {
+  const ifNoneMatch = request.headers.get('if-none-match')
+  if (!ifNoneMatch) {
+    return false
+  }
+  return ifNoneMatch.split(',').some(tag => {
+    const candidate = tag.trim()
+    return candidate === '*' || candidate.replace(/^W\//, '') === etag.replace(/^W\//, '')
+  })
+}
+
+export function conditionalHeaders(etag: string | null) {
+  return etag ? { ETag: etag, 'Cache-Control': 'private, no-cache' } : undefined
+}
+
+export function notModified(etag: string, headers?: Record<string, string>) {
+  return new NextResponse(null, {
+    status: 304,
+    headers: { ...headers, ...conditionalHeaders(etag) },
+  })
+}
+
+// Lets clients start delta syncs from the version a list was read at
+export function syncTokenHeaders(version: number | null) {
+  return version === null ? undefined : { 'X-Sync-Token': String(version) }
+}
+
+// Current version plus the point below which tombstones have been pruned.
+// Used by the delta sync endpoint to decide whether a token is still usable.
+export async function getSyncState(supabase: ServerClient, userId: string) {
+  const { data, error } = await supabase
+    .from('user_data_versions')
+    .select('version, pruned_version')
+    .eq('user_id', userId)
+    .maybeSingle()
+
+  if (error) {
+    return { state: null, error }
+  }
+  return {
+    state: { version: data?.version ?? 0, prunedVersion: data?.pruned_version ?? 0 },
+    error: null,
+  }
+}
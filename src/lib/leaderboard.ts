@@ -0,0 +1,65 @@
+import type { createServiceClient } from '@/lib/supabase/server'
+import type { ListResult } from '@/lib/applications'
+import { DEFAULT_WINDOW_DAYS, windowStart } from '@/lib/activity-window'
+import type { LeaderboardHistoryPoint } from '@/types'
+
+type ServiceClient = ReturnType<typeof createServiceClient>
+
+export interface RankedLeaderboardEntry {
+  user_id: string
+  username: string
+  display_name?: string | null
+  total_applications: number
+  // Applications in the last `windowDays` days, the ranking tiebreaker
+  applications_in_window: number
+  rank: number
+}
+
+// Totals and window counts come from the daily count buckets, ranked in the
+// database, so the cost grows with users x active days rather than with
+// every application ever made. Users without applications have no buckets
+// and so are not ranked.
+export async function getLeaderboard(
+  supabase: ServiceClient,
+  windowDays = DEFAULT_WINDOW_DAYS
+): Promise<ListResult<RankedLeaderboardEntry[]>> {
+  const { data, error } = await supabase.rpc('leaderboard_counts', {
+    window_start: windowStart(windowDays),
+  })
+
+  if (error) {
+    return { data: null, error }
+  }
+
+  const entries = (data ?? []).map(row => ({
+    ...row,
+    display_name: row.username, // Display username
+  }))
+
+  return { data: entries, error: null }
+}
+
+// Search params identifying a leaderboard read, so every caller of the same
+// window shares one single-flight key
+export function leaderboardParams(windowDays: number) {
+  return new URLSearchParams({ window: String(windowDays) })
+}
+
+// The user's rank at each leaderboard history snapshot in the last `days`
+// days, oldest first. Snapshots where the user wasn't ranked are omitted.
+export async function getRankHistory(
+  supabase: ServiceClient,
+  userId: string,
+  days: number
+): Promise<ListResult<LeaderboardHistoryPoint[]>> {
+  const { data, error } = await supabase.rpc('leaderboard_rank_history', {
+    uid: userId,
+    since: new Date(Date.now() - days * 24 * 60 * 60 * 1000).toISOString(),
+  })
+
+  if (error) {
+    return { data: null, error }
+  }
+
+  return { data: data ?? [], error: null }
+}
@@ -0,0 +1,214 @@
+import { getSalaryForComparison, type ApplicationQuery } from '@/lib/application-filters'
+import type { Application, ApplicationChanges } from '@/types'
+
+// In-browser query engine over a user's full application set. Search keys,
+// lowercase labels and annualized salary are computed once per row, and each
+// sort order is computed once and then patched as changes sync in, so a
+// keystroke in the filters is a single linear scan over pre-sorted rows.
+// scripts/perf/local-applications.ts measures this against its budget.
+
+export const LOCAL_MODE_MAX_ROWS = 10000
+
+export const LOCAL_APPLICATIONS_KEY = ['applications-local']
+
+// Opt-in via NEXT_PUBLIC_LOCAL_QUERY_MODE=true
+export function isLocalQueryModeEnabled() {
+  return process.env.NEXT_PUBLIC_LOCAL_QUERY_MODE === 'true'
+}
+
+interface IndexedApplication {
+  app: Application
+  searchKey: string
+  locationKey: string
+  salary: number
+}
+
+export interface LocalApplicationIndex {
+  rows: IndexedApplication[]
+  sorted: Map<string, IndexedApplication[]>
+}
+
+function indexApplication(app: Application): IndexedApplication {
+  const locationKey = (app.location_label ?? '').toLowerCase()
+  return {
+    app,
+    // Newlines keep a search term from matching across field boundaries
+    searchKey: `${app.company}\n${app.job_title}\n${locationKey}`.toLowerCase(),
+    locationKey,
+    salary: getSalaryForComparison(app),
+  }
+}
+
+export function buildLocalIndex(applications: Application[]): LocalApplicationIndex {
+  return { rows: applications.map(indexApplication), sorted: new Map() }
+}
+
+// Sort columns that can be null; the server lists their nulls last in both
+// directions
+const NULLABLE_SORT_COLUMNS = ['created_at', 'updated_at']
+
+interface SortKey {
+  row: IndexedApplication
+  value: string | number | null
+  id: string
+}
+
+function sortKey(row: IndexedApplication, sortBy: string): SortKey {
+  let value: string | number | null | undefined
+  if (sortBy === 'salary') {
+    value = row.salary
+  } else {
+    value = row.app[sortBy as keyof Application] as string | number | null | undefined
+  }
+  return { row, value: value ?? (NULLABLE_SORT_COLUMNS.indexOf(sortBy) !== -1 ? null : ''), id: row.app.id }
+}
+
+// Text columns ordered by language rules rather than UTF-16 code units, the
+// way the database collation orders them: case and accents don't split the
+// alphabet, so "apple" < "Banana" < "Émile". Intl.Collator and the database's
+// locale agree on letters; punctuation and symbols can still order slightly
+// differently, which the next refetch settles.
+const TEXT_SORT_COLUMNS = ['company', 'job_title']
+const collator = new Intl.Collator('en')
+
+// Same order as the server: sort column, then id as a tiebreaker, nulls last
+function compareKeys(a: SortKey, b: SortKey, direction: number, text = false) {
+  if (a.value !== b.value) {
+    if (a.value === null) return 1
+    if (b.value === null) return -1
+    const order = text ? collator.compare(String(a.value), String(b.value)) : a.value < b.value ? -1 : 1
+    if (order !== 0) return order * direction
+  }
+  return a.id < b.id ? -direction : a.id > b.id ? direction : 0
+}
+
+// Collating is several times slower than `<`, so a full sort of a text column
+// collates its distinct values once and sorts the rows by rank. Code-unit
+// order is mostly collation order already, so sorting by it first leaves the
+// collator long runs to merge. Values the collator can't tell apart share a
+// rank and fall back to the id.
+function rankText(keys: SortKey[]) {
+  const distinct = Array.from(new Set(keys.map(key => String(key.value))))
+    .sort()
+    .sort(collator.compare)
+  const ranks = new Map<string, number>()
+  distinct.forEach((value, i) => {
+    const previous = distinct[i - 1]
+    ranks.set(value, i > 0 && collator.compare(previous, value) === 0 ? ranks.get(previous)! : i)
+  })
+  keys.forEach(key => {
+    key.value = ranks.get(String(key.value))!
+  })
+}
+
+// Each column is sorted once per index, with its values read up front rather
+// than on every comparison; descending is ascending reversed, with the nulls
+// moved back to the end
+function sortedRows(index: LocalApplicationIndex, sortBy: string, sortOrder: string) {
+  const key = `${sortBy}:${sortOrder === 'asc' ? 'asc' : 'desc'}`
+  let rows = index.sorted.get(key)
+  if (!rows) {
+    const keys = index.rows.map(row => sortKey(row, sortBy))
+    if (TEXT_SORT_COLUMNS.indexOf(sortBy) !== -1) {
+      rankText(keys)
+    }
+    keys.sort((a, b) => compareKeys(a, b, 1))
+    let nulls = 0
+    while (nulls < keys.length && keys[keys.length - 1 - nulls].value === null) nulls++
+    const ascending = keys.map(entry => entry.row)
+    const reversed = ascending.slice().reverse()
+    index.sorted.set(`${sortBy}:asc`, ascending)
+    index.sorted.set(`${sortBy}:desc`, reversed.slice(nulls).concat(reversed.slice(0, nulls)))
+    rows = index.sorted.get(key) || ascending
+  }
+  return rows
+}
+
+// Moves a few rows out of and into an already-sorted order, finding each
+// one's position by binary search
+function patchSorted(
+  order: IndexedApplication[],
+  removed: IndexedApplication[],
+  added: IndexedApplication[],
+  sortBy: string,
+  direction: number
+) {
+  const rows = order.slice()
+  const text = TEXT_SORT_COLUMNS.indexOf(sortBy) !== -1
+  const position = (key: SortKey) => {
+    let low = 0
+    let high = rows.length
+    while (low < high) {
+      const middle = (low + high) >>> 1
+      if (compareKeys(sortKey(rows[middle], sortBy), key, direction, text) < 0) {
+        low = middle + 1
+      } else {
+        high = middle
+      }
+    }
+    return low
+  }
+
+  removed.forEach(row => {
+    const at = position(sortKey(row, sortBy))
+    const found = rows[at] === row ? at : rows.indexOf(row)
+    if (found !== -1) rows.splice(found, 1)
+  })
+  added.forEach(row => rows.splice(position(sortKey(row, sortBy)), 0, row))
+  return rows
+}
+
+// A sync usually carries a handful of rows, so the cached sort orders are
+// patched rather than dropped: re-sorting them would put a full sort on the
+// next render after every edit
+export function applyChangesToIndex(
+  index: LocalApplicationIndex,
+  delta: ApplicationChanges
+): LocalApplicationIndex {
+  const replaced = new Set(delta.deleted)
+  delta.changes.forEach(app => replaced.add(app.id))
+  const added = delta.changes.map(indexApplication)
+  const removed: IndexedApplication[] = []
+  const rows: IndexedApplication[] = []
+  index.rows.forEach(row => (replaced.has(row.app.id) ? removed : rows).push(row))
+
+  const sorted = new Map<string, IndexedApplication[]>()
+  index.sorted.forEach((order, key) => {
+    const [sortBy, sortOrder] = key.split(':')
+    sorted.set(key, patchSorted(order, removed, added, sortBy, sortOrder === 'asc' ? 1 : -1))
+  })
+  return { rows: rows.concat(added), sorted }
+}
+
+export function queryLocalIndex(
+  index: LocalApplicationIndex,
+  query: ApplicationQuery,
+  page?: { offset: number; limit: number }
+): Application[] {
+  const search = query.search?.toLowerCase()
+  const location = query.location?.toLowerCase()
+  const statuses = query.status?.length ? query.status : null
+  const locationKind = query.locationKind && query.locationKind !== 'all' ? query.locationKind : null
+  const companyId = query.companyId || null
+
+  const results: Application[] = []
+  const rows = sortedRows(index, query.sortBy || 'applied_at', query.sortOrder || 'desc')
+  const start = page?.offset ?? 0
+  const end = page ? start + page.limit : Infinity
+  let matched = 0
+
+  for (let i = 0; i < rows.length && matched < end; i++) {
+    const row = rows[i]
+    if (search && row.searchKey.indexOf(search) === -1) continue
+    if (statuses && statuses.indexOf(row.app.status) === -1) continue
+    if (locationKind && row.app.location_kind !== locationKind) continue
+    if (location && row.locationKey.indexOf(location) === -1) continue
+    if (companyId && row.app.company_id !== companyId) continue
+    if (matched >= start) {
+      results.push(row.app)
+    }
+    matched++
+  }
+
+  return results
+}
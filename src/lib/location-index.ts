@@ -0,0 +1,180 @@
+// Precomputed autocomplete index over location labels such as
+// "San Francisco, CA".
+//
+// Labels are normalized once (lowercase, accents stripped, punctuation
+// collapsed to spaces) and every suffix that starts at a word boundary is
+// inserted into a character trie. The suffix at position 0 makes the trie a
+// prefix index over whole labels; the rest make it a token index over city
+// and state words. Each trie node keeps the best few labels below it for
+// both cases, so a lookup is a walk of at most MAX_DEPTH nodes.
+//
+// Mid-word matches come from a trigram index: the rarest trigram of the query
+// gives a short candidate list to verify.
+//
+// Ranking: label prefix > word start > substring, then list order.
+
+const MAX_DEPTH = 6
+const TOP_K = 20
+
+interface TrieNode {
+  children: Map<string, TrieNode>
+  // Best-ranked labels that start with this node's prefix
+  prefix: number[]
+  // Best-ranked labels with a later word that starts with it
+  word: number[]
+}
+
+export interface LocationIndex {
+  labels: string[]
+  normalized: string[]
+  root: TrieNode
+  trigrams: Map<string, number[]>
+}
+
+export function normalizeLocation(value: string) {
+  return value
+    .normalize('NFD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .toLowerCase()
+    .replace(/[^a-z0-9]+/g, ' ')
+    .replace(/^ /, '')
+}
+
+function createNode(): TrieNode {
+  return { children: new Map(), prefix: [], word: [] }
+}
+
+function insert(root: TrieNode, key: string, id: number, isPrefix: boolean) {
+  let node = root
+  const depth = Math.min(key.length, MAX_DEPTH)
+  for (let i = 0; i < depth; i++) {
+    let child = node.children.get(key[i])
+    if (!child) {
+      child = createNode()
+      node.children.set(key[i], child)
+    }
+    node = child
+
+    // Nodes at the depth cap keep every label so longer queries can be
+    // answered by filtering them
+    const ids = isPrefix ? node.prefix : node.word
+    if ((ids.length < TOP_K || i === MAX_DEPTH - 1) && ids[ids.length - 1] !== id) {
+      ids.push(id)
+    }
+  }
+}
+
+// Labels must be in rank order: ids are inserted in ascending order, so every
+// node's lists stay sorted best-first without any extra work.
+export function buildLocationIndex(labels: string[]): LocationIndex {
+  const root = createNode()
+  const trigrams = new Map<string, number[]>()
+  const normalized = labels.map(label => normalizeLocation(label).replace(/ $/, ''))
+
+  normalized.forEach((key, id) => {
+    insert(root, key, id, true)
+    for (let i = key.indexOf(' '); i !== -1; i = key.indexOf(' ', i + 1)) {
+      insert(root, key.slice(i + 1), id, false)
+    }
+    for (let i = 0; i + 3 <= key.length; i++) {
+      const trigram = key.slice(i, i + 3)
+      let ids = trigrams.get(trigram)
+      if (!ids) {
+        ids = []
+        trigrams.set(trigram, ids)
+      }
+      if (ids[ids.length - 1] !== id) {
+        ids.push(id)
+      }
+    }
+  })
+
+  return { labels, normalized, root, trigrams }
+}
+
+function findNode(root: TrieNode, query: string) {
+  let node: TrieNode | undefined = root
+  const depth = Math.min(query.length, MAX_DEPTH)
+  for (let i = 0; i < depth && node; i++) {
+    node = node.children.get(query[i])
+  }
+  return node
+}
+
+// Labels that could contain the query anywhere, best-ranked first
+function substringCandidates(index: LocationIndex, query: string): number[] | null {
+  if (query.length < 3) {
+    return null
+  }
+  let best: number[] | undefined
+  for (let i = 0; i + 3 <= query.length; i++) {
+    const ids = index.trigrams.get(query.slice(i, i + 3))
+    if (!ids) {
+      return []
+    }
+    if (!best || ids.length < best.length) {
+      best = ids
+    }
+  }
+  return best ?? []
+}
+
+export function searchLocations(index: LocationIndex, input: string, limit = 10): string[] {
+  const query = normalizeLocation(input)
+  if (!query) {
+    return index.labels.slice(0, limit)
+  }
+
+  const seen = new Set<number>()
+  const results: string[] = []
+  const add = (id: number) => {
+    if (results.length < limit && !seen.has(id)) {
+      seen.add(id)
+      results.push(index.labels[id])
+    }
+  }
+
+  const node = findNode(index.root, query)
+  if (node) {
+    const long = query.length > MAX_DEPTH
+    node.prefix.forEach(id => {
+      if (!long || index.normalized[id].indexOf(query) === 0) add(id)
+    })
+    node.word.forEach(id => {
+      if (!long || index.normalized[id].indexOf(' ' + query) !== -1) add(id)
+    })
+  }
+
+  // Mid-word matches are the weakest tier, so only look for them when the
+  // other tiers came up short. One- and two-letter queries almost always fill
+  // up above; when they don't, scanning is the fallback.
+  if (results.length < limit) {
+    const normalized = index.normalized
+    const candidates = substringCandidates(index, query)
+    const count = candidates ? candidates.length : normalized.length
+    for (let i = 0; i < count && results.length < limit; i++) {
+      const id = candidates ? candidates[i] : i
+      if (normalized[id].indexOf(query) !== -1) add(id)
+    }
+  }
+
+  return results
+}
+
+let loadingIndex: Promise<LocationIndex> | null = null
+
+// The suggestion list is a separate chunk, so pages only download it (and
+// build the index) the first time a location input needs it. Server routes
+// share the same cached index.
+export function loadLocationIndex() {
+  if (!loadingIndex) {
+    loadingIndex = import('./location-suggestions').then(module =>
+      buildLocationIndex(module.LOCATION_SUGGESTIONS)
+    )
+    // Let a failed chunk load be retried on the next call
+    loadingIndex.catch(() => {
+      loadingIndex = null
+    })
+  }
+  return loadingIndex
+}
@@ -0,0 +1,126 @@
+import type { InfiniteData, QueryClient, QueryKey } from '@tanstack/react-query'
+import { applyApplicationChanges } from '@/lib/application-sync'
+import { LOCAL_APPLICATIONS_KEY, type LocalApplicationIndex } from '@/lib/local-applications'
+import type { Application, ApplicationPage, ApplicationStats } from '@/types'
+
+// Optimistic updates for application mutations. The change is written into
+// every cached applications list, the local index and the stats counts
+// before the request is sent, rolled back if it fails, and reconciled with
+// the row the server returns, so a mutation costs a single request.
+
+export const USER_STATS_KEY = ['user-stats']
+
+export interface OptimisticContext {
+  snapshot: Array<[QueryKey, unknown]>
+  // Id the optimistic row was cached under
+  id?: string
+  // Stats could not be adjusted locally and need a refetch once settled
+  statsStale: boolean
+}
+
+const CACHED_KEYS = [['applications'], LOCAL_APPLICATIONS_KEY, USER_STATS_KEY]
+
+function findCachedApplication(queryClient: QueryClient, id: string): Application | undefined {
+  const lists = queryClient.getQueriesData<InfiniteData<ApplicationPage, string | null>>({
+    queryKey: ['applications'],
+  })
+  for (let i = 0; i < lists.length; i++) {
+    const pages = lists[i][1]?.pages ?? []
+    for (let j = 0; j < pages.length; j++) {
+      const found = pages[j].items.find(app => app.id === id)
+      if (found) return found
+    }
+  }
+  const index = queryClient.getQueryData<LocalApplicationIndex | null>(LOCAL_APPLICATIONS_KEY)
+  return index?.rows.find(row => row.app.id === id)?.app
+}
+
+function adjustStats(
+  stats: ApplicationStats,
+  removed: Application | undefined,
+  added: Application | undefined
+): ApplicationStats {
+  const next = { ...stats }
+  if (removed) {
+    next.total--
+    next[removed.status]--
+  }
+  if (added) {
+    next.total++
+    next[added.status]++
+  }
+  return next
+}
+
+// Applies an upsert or delete to the cache and returns what is needed to roll
+// it back. `upsert` replaces the cached row with the same id, if any.
+export async function applyOptimisticMutation(
+  queryClient: QueryClient,
+  mutation: { upsert?: Application; deleteId?: string }
+): Promise<OptimisticContext> {
+  // A refetch landing mid-mutation would overwrite the optimistic rows
+  await Promise.all(CACHED_KEYS.map(queryKey => queryClient.cancelQueries({ queryKey })))
+
+  const snapshot = ([] as Array<[QueryKey, unknown]>).concat(
+    ...CACHED_KEYS.map(queryKey => queryClient.getQueriesData({ queryKey }))
+  )
+
+  const id = mutation.upsert?.id ?? mutation.deleteId
+  const previous = id ? findCachedApplication(queryClient, id) : undefined
+
+  applyApplicationChanges(queryClient, {
+    token: '',
+    reset: false,
+    changes: mutation.upsert ? [mutation.upsert] : [],
+    deleted: mutation.deleteId ? [mutation.deleteId] : [],
+  })
+
+  // Without the deleted row its status is unknown, so the counts can't be
+  // adjusted
+  const statsStale = Boolean(mutation.deleteId && !previous)
+  if (!statsStale) {
+    queryClient.setQueryData<ApplicationStats>(USER_STATS_KEY, stats =>
+      stats ? adjustStats(stats, previous, mutation.upsert) : stats
+    )
+  }
+
+  return { snapshot, id, statsStale }
+}
+
+export function rollbackOptimisticMutation(queryClient: QueryClient, context?: OptimisticContext) {
+  context?.snapshot.forEach(([queryKey, data]) => {
+    queryClient.setQueryData(queryKey, data)
+  })
+}
+
+// Swaps the optimistic row for the one the server stored (creates are cached
+// under a placeholder id until then). Only the stats are refetched, and only
+// when they could not be adjusted locally.
+export function reconcileOptimisticMutation(
+  queryClient: QueryClient,
+  context: OptimisticContext | undefined,
+  saved?: Application
+) {
+  if (saved) {
+    applyApplicationChanges(queryClient, {
+      token: '',
+      reset: false,
+      changes: [saved],
+      deleted: context?.id && context.id !== saved.id ? [context.id] : [],
+    })
+  }
+  if (!context || context.statsStale) {
+    queryClient.invalidateQueries({ queryKey: USER_STATS_KEY })
+  }
+}
+
+const OPTIMISTIC_ID_PREFIX = 'optimistic-'
+
+export function optimisticId() {
+  return `${OPTIMISTIC_ID_PREFIX}${Date.now()}-${Math.random().toString(36).slice(2)}`
+}
+
+// Rows still waiting for the server have no real id to edit or delete by
+export function isOptimisticApplication(application: Application) {
+  return application.id.indexOf(OPTIMISTIC_ID_PREFIX) === 0
+}
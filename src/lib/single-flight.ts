@@ -0,0 +1,55 @@
+// Coalesces identical concurrent reads: while a query for a key is in flight,
+// later callers await the same promise instead of issuing their own query.
+// Entries are removed as soon as the promise settles, so nothing is cached
+// beyond the lifetime of the leading request.
+
+const inFlight = new Map<string, Promise<unknown>>()
+
+export interface SingleFlightResult<T> {
+  value: T
+  shared: boolean
+}
+
+// Keys are (route, user, normalized query, data version). Parameter order
+// and empty values do not change the key, so `?a=1&b=` and `?a=1` coalesce.
+// Routes that tag responses with the user's data version pass the version
+// they read: a request made after a write then never joins a query that
+// started before it and answers with older data than its ETag claims.
+export function singleFlightKey(
+  route: string,
+  userId: string | null,
+  searchParams?: URLSearchParams,
+  version?: number | null
+) {
+  const params: string[] = []
+  searchParams?.forEach((value, key) => {
+    if (value !== '') {
+      params.push(`${encodeURIComponent(key)}=${encodeURIComponent(value)}`)
+    }
+  })
+  params.sort()
+  const key = `${route}|${userId ?? '*'}|${params.join('&')}`
+  return version === undefined ? key : `${key}|${version ?? '*'}`
+}
+
+export async function singleFlight<T>(
+  key: string,
+  fn: () => Promise<T>
+): Promise<SingleFlightResult<T>> {
+  const existing = inFlight.get(key) as Promise<T> | undefined
+  if (existing) {
+    return { value: await existing, shared: true }
+  }
+
+  const promise = fn()
+  inFlight.set(key, promise)
+  try {
+    return { value: await promise, shared: false }
+  } finally {
+    inFlight.delete(key)
+  }
+}
+
+export function singleFlightHeaders(shared: boolean) {
+  return { 'X-Single-Flight': shared ? 'follower' : 'leader' }
+}
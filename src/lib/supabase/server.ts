@@ -1,6 +1,7 @@
 import { createServerClient, type CookieOptions } from '@supabase/ssr'
 import { cookies } from 'next/headers'
 import type { Database } from '@/types/supabase'
+import { tracedFetch } from '@/lib/tracing'
 
 export function createClient() {
   const cookieStore = cookies()
@@ -9,6 +10,9 @@ export function createClient() {
     process.env.NEXT_PUBLIC_SUPABASE_URL!,
     process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
     {
+      global: {
+        fetch: tracedFetch,
+      },
       cookies: {
         get(name: string) {
           return cookieStore.get(name)?.value
@@ -41,6 +45,9 @@ export function createServiceClient() {
     process.env.NEXT_PUBLIC_SUPABASE_URL!,
     process.env.SUPABASE_SERVICE_ROLE_KEY!,
     {
+      global: {
+        fetch: tracedFetch,
+      },
       cookies: {
         get() {
           return undefined
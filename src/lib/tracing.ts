@@ -0,0 +1,102 @@
+import { SpanStatusCode, trace, type Attributes, type Span } from '@opentelemetry/api'
+
+// Tracing is opt-in. Without OTEL_TRACING_ENABLED=true no tracer provider is
+// registered (see src/instrumentation.ts) and every helper below degrades to
+// the no-op OpenTelemetry API, so the hot paths pay next to nothing.
+export function isTracingEnabled() {
+  return process.env.OTEL_TRACING_ENABLED === 'true'
+}
+
+const tracer = trace.getTracer('offerless')
+
+export async function withSpan<T>(
+  name: string,
+  attributes: Attributes,
+  fn: (span: Span) => Promise<T> | T
+): Promise<T> {
+  return tracer.startActiveSpan(name, { attributes }, async (span) => {
+    try {
+      return await fn(span)
+    } catch (error) {
+      span.recordException(error as Error)
+      span.setStatus({ code: SpanStatusCode.ERROR })
+      throw error
+    } finally {
+      span.end()
+    }
+  })
+}
+
+// Wraps a route handler in a span named after the route, e.g.
+// `export const GET = traceRoute('GET /api/applications', async (request) => { ... })`
+export function traceRoute<Args extends unknown[], R extends Response>(
+  name: string,
+  handler: (...args: Args) => Promise<R>
+): (...args: Args) => Promise<R> {
+  const [method, route] = name.split(' ')
+  return (...args: Args) =>
+    withSpan(name, { 'http.method': method, 'http.route': route }, async (span) => {
+      const response = await handler(...args)
+      span.setAttribute('http.status_code', response.status)
+      if (response.status >= 500) {
+        span.setStatus({ code: SpanStatusCode.ERROR })
+      }
+      return response
+    })
+}
+
+// Adds attributes to the span of the handler currently running, e.g. to
+// report a value the route read from the database
+export function setRouteAttributes(attributes: Attributes) {
+  trace.getActiveSpan()?.setAttributes(attributes)
+}
+
+const FILTER_VALUE = /\b(eq|neq|gt|gte|lt|lte|like|ilike|in|is|cs|cd|fts)\.(\([^)]*\)|"[^"]*"|[^,)]*)/g
+
+// Reduces a PostgREST URL to its query shape: filter values are replaced with
+// `?` so spans group by query structure and never carry user data.
+export function describeQueryShape(url: URL) {
+  const params: string[] = []
+  url.searchParams.forEach((value, key) => {
+    if (key === 'select' || key === 'order' || key === 'limit' || key === 'offset') {
+      params.push(`${key}=${value}`)
+    } else {
+      params.push(`${key}=${value.replace(FILTER_VALUE, '$1.?')}`)
+    }
+  })
+  return params.join('&')
+}
+
+function describeSupabaseRequest(url: URL) {
+  const rest = url.pathname.match(/\/rest\/v1\/(.+)$/)
+  if (rest) {
+    return { name: `supabase.query ${rest[1]}`, target: rest[1] }
+  }
+  const auth = url.pathname.match(/\/auth\/v1\/(.+)$/)
+  if (auth) {
+    return { name: `supabase.auth ${auth[1]}`, target: auth[1] }
+  }
+  return { name: 'supabase.fetch', target: url.pathname }
+}
+
+// fetch implementation handed to the Supabase clients so every PostgREST and
+// auth call becomes a child span of the current route span.
+export const tracedFetch: typeof fetch = (input, init) => {
+  if (!isTracingEnabled()) {
+    return fetch(input, init)
+  }
+
+  const url = new URL(input instanceof Request ? input.url : input.toString())
+  const method = init?.method ?? (input instanceof Request ? input.method : 'GET')
+  const { name, target } = describeSupabaseRequest(url)
+
+  return withSpan(name, { 'http.method': method, 'db.system': 'postgresql' }, async (span) => {
+    if (span.isRecording()) {
+      span.setAttribute('db.operation.target', target)
+      span.setAttribute('db.query.shape', describeQueryShape(url))
+    }
+    const response = await fetch(input, init)
+    span.setAttribute('http.status_code', response.status)
+    return response
+  })
+}
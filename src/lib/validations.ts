@@ -1,5 +1,9 @@
 import { z } from 'zod'
 
+// Latest accepted applied_at. Fixed when the module loads, and shared with the
+// fast-path validator in application-validator.ts so both agree exactly.
+export const MAX_APPLIED_AT = new Date()
+
 // Application validation schema
 export const applicationSchema = z.object({
   company: z.string()
@@ -9,7 +13,7 @@ export const applicationSchema = z.object({
     .min(2, 'Job title must be at least 2 characters')
     .max(80, 'Job title must be less than 80 characters'),
   applied_at: z.date()
-    .max(new Date(), 'Application date cannot be in the future'),
+    .max(MAX_APPLIED_AT, 'Application date cannot be in the future'),
   status: z.enum(['applied', 'interviewing', 'rejected', 'ghosted', 'offer'], {
     required_error: 'Status is required',
   }),
@@ -58,6 +62,22 @@ export const applicationSchema = z.object({
 
 export type ApplicationInput = z.infer<typeof applicationSchema>
 
+// JSON body for POST /api/applications and PATCH /api/applications/[id]:
+// the date as YYYY-MM-DD and empty optional fields as null
+export function toApplicationRequestBody(data: ApplicationInput) {
+  return {
+    company: data.company,
+    job_title: data.job_title,
+    applied_at: data.applied_at.toISOString().split('T')[0],
+    status: data.status,
+    company_url: data.company_url,
+    salary_amount: data.salary_amount || null,
+    salary_type: data.salary_type || null,
+    location_label: data.location_label || null,
+    location_kind: data.location_kind,
+  }
+}
+
 // Profile validation schema
 export const profileSchema = z.object({
   username: z.string()
@@ -0,0 +1,36 @@
+// In-process LRU for per-user results that only change when the user's data
+// version does. Each key holds one value tagged with the version it was
+// computed at; a read at any other version misses, so writes never need to
+// invalidate anything. Least recently used keys are evicted past maxEntries.
+// Like single-flight, this is per server instance.
+
+export interface VersionedCache<T> {
+  get(key: string, version: number): T | undefined
+  set(key: string, version: number, value: T): void
+}
+
+export function createVersionedCache<T>(maxEntries = 1000): VersionedCache<T> {
+  const entries = new Map<string, { version: number; value: T }>()
+
+  return {
+    get(key, version) {
+      const entry = entries.get(key)
+      if (!entry || entry.version !== version) {
+        return undefined
+      }
+      // Map iteration order is insertion order, so re-inserting marks the
+      // key as most recently used
+      entries.delete(key)
+      entries.set(key, entry)
+      return entry.value
+    },
+
+    set(key, version, value) {
+      entries.delete(key)
+      entries.set(key, { version, value })
+      if (entries.size > maxEntries) {
+        entries.delete(entries.keys().next().value as string)
+      }
+    },
+  }
+}
@@ -1,7 +1,16 @@
 import { createServerClient, type CookieOptions } from '@supabase/ssr'
 import { NextResponse, type NextRequest } from 'next/server'
+import { tracedFetch, withSpan } from '@/lib/tracing'
 
-export async function middleware(request: NextRequest) {
+export function middleware(request: NextRequest) {
+  return withSpan(
+    'middleware',
+    { 'http.method': request.method, 'http.target': request.nextUrl.pathname },
+    () => handleRequest(request)
+  )
+}
+
+async function handleRequest(request: NextRequest) {
   let response = NextResponse.next({
     request: {
       headers: request.headers,
@@ -12,6 +21,9 @@ export async function middleware(request: NextRequest) {
     process.env.NEXT_PUBLIC_SUPABASE_URL!,
     process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
     {
+      global: {
+        fetch: tracedFetch,
+      },
       cookies: {
         get(name: string) {
           return request.cookies.get(name)?.value
@@ -0,0 +1,128 @@
+import { describe, expect, it } from 'vitest'
+import { validateApplication } from '@/lib/application-validator'
+import { applicationSchema, MAX_APPLIED_AT } from '@/lib/validations'
+
+// Differential fuzz test: random payloads built from edge-case pools for each
+// field must get the same verdict, output and issues (path and message, in
+// order) from the fast validator as from the zod schema.
+
+const ITERATIONS = 20000
+
+function random(seed: number) {
+  let state = seed
+  return () => {
+    state = (state * 1664525 + 1013904223) % 4294967296
+    return state / 4294967296
+  }
+}
+
+const day = 24 * 60 * 60 * 1000
+
+const strings = [
+  '', 'a', 'ab', 'Acme', ' ', '  ', 'ü', 'Zürich AG', '株式会社', '😀', '😀a',
+  'x'.repeat(79), 'x'.repeat(80), 'x'.repeat(81), '😀'.repeat(40), '😀'.repeat(41),
+  'x'.repeat(119), 'x'.repeat(120), 'x'.repeat(121), 'x'.repeat(5000),
+]
+
+const pools: Record<string, unknown[]> = {
+  company: strings.concat([undefined, null, 0, 12, true, [], {}]),
+  job_title: strings.concat([undefined, null, 1, false]),
+  applied_at: [
+    new Date('2024-01-15'),
+    new Date(0),
+    new Date(MAX_APPLIED_AT.getTime()),
+    new Date(MAX_APPLIED_AT.getTime() - 1),
+    new Date(MAX_APPLIED_AT.getTime() + 1),
+    new Date(MAX_APPLIED_AT.getTime() + day),
+    new Date('not a date'),
+    new Date(8.64e15),
+    undefined, null, '2024-01-15', 1700000000000,
+  ],
+  status: ['applied', 'interviewing', 'rejected', 'ghosted', 'offer', 'Applied', '', 'hired', undefined, null, 3, []],
+  company_url: [
+    '', 'https://example.com', 'http://example.com/jobs?id=1#top', 'https://exa mple.com',
+    'ftp://example.com', 'example.com', 'http://', 'https://', 'https:example.com',
+    'HTTP://EXAMPLE.COM', 'mailto:jobs@example.com', 'javascript:alert(1)',
+    'https://例え.jp/パス', 'http://[::1]:3000', 'https://example.com/' + 'a'.repeat(3000),
+    ' https://example.com', undefined, null, 42, {},
+  ],
+  salary_amount: [
+    undefined, null, '', 0, -0, -1, 0.01, 1, 85000, 1e12, Infinity, -Infinity, NaN,
+    '85000', '  ', 'abc', '1e3', true, false, [], [5], {},
+  ],
+  salary_type: [undefined, null, 'hourly', 'salary', 'Salary', '', 'yearly', 1, false],
+  location_label: [undefined, null, '', 'Remote', 'São Paulo, Brazil', 7, {}].concat(strings.slice(16)),
+  location_kind: [undefined, 'onsite', 'remote', 'hybrid', '', null, 0],
+}
+
+const base = {
+  company: 'Acme',
+  job_title: 'Engineer',
+  applied_at: new Date('2024-01-15'),
+  status: 'applied',
+  company_url: 'https://acme.example/jobs/1',
+  salary_amount: 120000,
+  salary_type: 'salary',
+  location_label: 'Remote',
+  location_kind: 'remote',
+}
+
+// A valid payload with up to three fields replaced from the pools or removed,
+// so both verdicts and every combination of one to three bad fields show up
+function buildPayload(next: () => number) {
+  const payload: Record<string, unknown> = { ...base }
+  const keys = Object.keys(pools)
+  const mutations = Math.floor(next() * 4)
+  for (let i = 0; i < mutations; i++) {
+    const key = keys[Math.floor(next() * keys.length)]
+    // Absent and undefined differ in the output object
+    if (next() < 0.15) {
+      delete payload[key]
+    } else {
+      const pool = pools[key]
+      payload[key] = pool[Math.floor(next() * pool.length)]
+    }
+  }
+  if (next() < 0.05) {
+    payload.unexpected = 'stripped'
+  }
+  return payload
+}
+
+function compare(input: unknown) {
+  const fast = validateApplication(input)
+  const reference = applicationSchema.safeParse(input)
+
+  expect(fast.success).toBe(reference.success)
+  if (fast.success && reference.success) {
+    expect(fast.data).toStrictEqual(reference.data)
+  } else if (!fast.success && !reference.success) {
+    expect(fast.issues).toEqual(
+      reference.error.issues.map(issue => ({ path: issue.path, message: issue.message }))
+    )
+  }
+}
+
+describe('validateApplication', () => {
+  it('accepts a typical payload', () => {
+    const result = validateApplication(base)
+    expect(result.success).toBe(true)
+  })
+
+  it('matches applicationSchema on non-object input', () => {
+    [undefined, null, 'payload', 42, [], new Date(0)].forEach(compare)
+  })
+
+  it('matches applicationSchema on fuzzed payloads', () => {
+    const next = random(20240901)
+    for (let i = 0; i < ITERATIONS; i++) {
+      const payload = buildPayload(next)
+      try {
+        compare(payload)
+      } catch (error) {
+        console.error(`Mismatch on iteration ${i}:`, payload)
+        throw error
+      }
+    }
+  })
+})
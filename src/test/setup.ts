@@ -1,15 +1,16 @@
-import '@testing-library/jest-dom'
+import '@testing-library/jest-dom/vitest'
+import { vi } from 'vitest'
 
 // Mock Next.js router
-jest.mock('next/navigation', () => ({
+vi.mock('next/navigation', () => ({
   useRouter() {
     return {
-      push: jest.fn(),
-      replace: jest.fn(),
-      prefetch: jest.fn(),
-      back: jest.fn(),
-      forward: jest.fn(),
-      refresh: jest.fn(),
+      push: vi.fn(),
+      replace: vi.fn(),
+      prefetch: vi.fn(),
+      back: vi.fn(),
+      forward: vi.fn(),
+      refresh: vi.fn(),
     }
   },
   useSearchParams() {
@@ -21,19 +22,19 @@ jest.mock('next/navigation', () => ({
 }))
 
 // Mock Supabase
-jest.mock('@/lib/supabase/client', () => ({
+vi.mock('@/lib/supabase/client', () => ({
   createClient: () => ({
     auth: {
-      getUser: jest.fn(),
-      signOut: jest.fn(),
-      signInWithPassword: jest.fn(),
-      signUp: jest.fn(),
+      getUser: vi.fn(),
+      signOut: vi.fn(),
+      signInWithPassword: vi.fn(),
+      signUp: vi.fn(),
     },
-    from: jest.fn(() => ({
-      select: jest.fn(),
-      insert: jest.fn(),
-      update: jest.fn(),
-      delete: jest.fn(),
+    from: vi.fn(() => ({
+      select: vi.fn(),
+      insert: vi.fn(),
+      update: vi.fn(),
+      delete: vi.fn(),
     })),
   }),
 }))
\ No newline at end of file
@@ -16,6 +16,11 @@ export interface Application {
   salary_type?: SalaryType | null
   location_label?: string | null
   location_kind: LocationKind
+  // Canonical company, shared by spellings of the same name
+  company_id?: number | null
+  sync_version?: number
+  // Set on archived applications, listed only with includeArchived=true
+  archived_at?: string | null
   created_at: string
   updated_at: string
 }
@@ -59,6 +64,135 @@ export interface ApplicationFilters {
   search?: string
 }
 
+export interface ApplicationPage {
+  items: Application[]
+  nextCursor: string | null
+}
+
+export interface ApplicationChanges {
+  token: string
+  reset: boolean
+  changes: Application[]
+  deleted: string[]
+}
+
+export interface FunnelStage {
+  stage: 'applied' | 'interviewing' | 'offer' | 'rejected' | 'ghosted'
+  reached: number
+  // Share of all applications (of interviewed ones, for offers); null when
+  // there is nothing to divide by
+  rate: number | null
+  // Median days from applying (from the first interview, for offers)
+  median_days: number | null
+}
+
+export interface ApplicationFunnel {
+  stages: FunnelStage[]
+}
+
+export type TimeseriesBucket = 'week' | 'month'
+
+export interface TimeseriesPoint {
+  // First day of the week (Monday) or month
+  period: string
+  total: number
+  applied: number
+  interviewing: number
+  rejected: number
+  ghosted: number
+  offer: number
+}
+
+export interface ActivityTimeseries {
+  bucket: TimeseriesBucket
+  from: string
+  to: string
+  points: TimeseriesPoint[]
+}
+
+export interface LeaderboardHistoryPoint {
+  snapshot_at: string
+  rank: number
+  total_applications: number
+  // Users ranked in that snapshot, for showing rank as "n of m"
+  ranked_users: number
+}
+
+export interface CompanySuggestion {
+  id: number
+  name: string
+  // The user's applications at the company
+  applications: number
+}
+
+export interface CompanyInsight {
+  company: string
+  // Distinct users who applied; only companies with at least five are listed
+  applicants: number
+  applications: number
+  offers: number
+  offer_rate: number
+}
+
+export interface JobTitleInsight {
+  job_title: string
+  applicants: number
+  applications: number
+  // Applications with a salary, and their median annualized salary
+  salary_samples: number
+  median_salary: number | null
+}
+
+export interface LocationInsight {
+  location_kind: 'onsite' | 'remote'
+  applications: number
+  share: number
+}
+
+export interface AnalyticsRefresh {
+  view_name: string
+  refreshed_at: string
+  duration_ms: number
+}
+
+export interface GlobalInsights {
+  companies: CompanyInsight[]
+  job_titles: JobTitleInsight[]
+  locations: LocationInsight[]
+  // The most recent refresh of each view
+  refreshes: AnalyticsRefresh[]
+}
+
+// Annualized salary distribution for one location kind and status.
+// Hourly rates are annualized at 40 hours a week, 52 weeks a year.
+export interface SalaryStatsGroup {
+  location_kind: LocationKind
+  status: ApplicationStatus
+  // Applications with a salary in the group
+  samples: number
+  min: number
+  max: number
+  mean: number
+  p25: number
+  p50: number
+  p75: number
+  p90: number
+}
+
+export interface SalaryStats {
+  groups: SalaryStatsGroup[]
+}
+
+export interface DashboardBootstrap {
+  stats: ApplicationStats
+  applications: ApplicationPage
+  leaderboard: {
+    // null when the caller has no applications and so is not ranked
+    rank: number | null
+    total_users: number
+  }
+}
+
 export interface PaginationParams {
   page: number
   pageSize: number
@@ -46,6 +46,11 @@ export interface Database {
           salary_type: 'hourly' | 'salary' | null
           location_label: string | null
           location_kind: 'onsite' | 'remote'
+          // Generated from salary_amount and salary_type
+          annual_salary: number | null
+          // Set by a trigger from company
+          company_id: number | null
+          sync_version: number
           created_at: string
           updated_at: string
         }
@@ -61,6 +66,7 @@ export interface Database {
           salary_type?: 'hourly' | 'salary' | null
           location_label?: string | null
           location_kind?: 'onsite' | 'remote'
+          sync_version?: number
           created_at?: string
           updated_at?: string
         }
@@ -76,6 +82,7 @@ export interface Database {
           salary_type?: 'hourly' | 'salary' | null
           location_label?: string | null
           location_kind?: 'onsite' | 'remote'
+          sync_version?: number
           created_at?: string
           updated_at?: string
         }
@@ -115,6 +122,167 @@ export interface Database {
           computed_at?: string
         }
       }
+      user_data_versions: {
+        Row: {
+          user_id: string
+          version: number
+          pruned_version: number
+          updated_at: string
+        }
+        Insert: {
+          user_id: string
+          version?: number
+          pruned_version?: number
+          updated_at?: string
+        }
+        Update: {
+          user_id?: string
+          version?: number
+          pruned_version?: number
+          updated_at?: string
+        }
+      }
+      application_tombstones: {
+        Row: {
+          application_id: string
+          user_id: string
+          sync_version: number
+          deleted_at: string
+        }
+        Insert: {
+          application_id: string
+          user_id: string
+          sync_version: number
+          deleted_at?: string
+        }
+        Update: {
+          application_id?: string
+          user_id?: string
+          sync_version?: number
+          deleted_at?: string
+        }
+      }
+      leaderboard_slots: {
+        Row: {
+          user_id: string
+          slot: number
+        }
+        Insert: {
+          user_id: string
+        }
+        Update: {
+          user_id?: string
+        }
+      }
+      leaderboard_history: {
+        Row: {
+          snapshot_at: string
+          ranked_users: number
+          ranks: string
+          totals: string
+        }
+        Insert: {
+          snapshot_at?: string
+          ranked_users: number
+          ranks: string
+          totals: string
+        }
+        Update: {
+          snapshot_at?: string
+          ranked_users?: number
+          ranks?: string
+          totals?: string
+        }
+      }
+      application_status_events: {
+        Row: {
+          user_id: string
+          application_id: string
+          from_status: 'applied' | 'interviewing' | 'rejected' | 'ghosted' | 'offer' | null
+          to_status: 'applied' | 'interviewing' | 'rejected' | 'ghosted' | 'offer'
+          changed_at: string
+        }
+        Insert: {
+          user_id: string
+          application_id: string
+          from_status?: 'applied' | 'interviewing' | 'rejected' | 'ghosted' | 'offer' | null
+          to_status: 'applied' | 'interviewing' | 'rejected' | 'ghosted' | 'offer'
+          changed_at?: string
+        }
+        Update: {
+          user_id?: string
+          application_id?: string
+          from_status?: 'applied' | 'interviewing' | 'rejected' | 'ghosted' | 'offer' | null
+          to_status?: 'applied' | 'interviewing' | 'rejected' | 'ghosted' | 'offer'
+          changed_at?: string
+        }
+      }
+      user_daily_application_counts: {
+        Row: {
+          user_id: string
+          day: string
+          status: 'applied' | 'interviewing' | 'rejected' | 'ghosted' | 'offer'
+          n: number
+        }
+        Insert: {
+          user_id: string
+          day: string
+          status: 'applied' | 'interviewing' | 'rejected' | 'ghosted' | 'offer'
+          n: number
+        }
+        Update: {
+          user_id?: string
+          day?: string
+          status?: 'applied' | 'interviewing' | 'rejected' | 'ghosted' | 'offer'
+          n?: number
+        }
+      }
+      companies: {
+        Row: {
+          id: number
+          name: string
+          normalized_key: string
+          created_at: string
+        }
+        Insert: {
+          name: string
+          normalized_key: string
+          created_at?: string
+        }
+        Update: {
+          name?: string
+          normalized_key?: string
+          created_at?: string
+        }
+      }
+      applications_archive: {
+        Row: Database['public']['Tables']['applications']['Row'] & {
+          archived_at: string
+        }
+        Insert: Database['public']['Tables']['applications']['Row'] & {
+          archived_at?: string
+        }
+        Update: Partial<Database['public']['Tables']['applications']['Row']> & {
+          archived_at?: string
+        }
+      }
+      global_analytics_refreshes: {
+        Row: {
+          view_name: string
+          refreshed_at: string
+          duration_ms: number
+        }
+        Insert: {
+          view_name: string
+          refreshed_at?: string
+          duration_ms: number
+        }
+        Update: {
+          view_name?: string
+          refreshed_at?: string
+          duration_ms?: number
+        }
+      }
     }
     Views: {
       public_leaderboard: {
@@ -130,16 +298,170 @@ export interface Database {
           rank: number
         }
       }
+      applications_with_archive: {
+        Row: Database['public']['Tables']['applications']['Row'] & {
+          // null for applications still in the hot table
+          archived_at: string | null
+        }
+      }
+      global_company_insights: {
+        Row: {
+          company_key: string
+          company: string
+          applicants: number
+          applications: number
+          offers: number
+          offer_rate: number
+        }
+      }
+      global_job_title_insights: {
+        Row: {
+          job_title_key: string
+          job_title: string
+          applicants: number
+          applications: number
+          salary_samples: number
+          median_salary: number | null
+        }
+      }
+      global_location_insights: {
+        Row: {
+          location_kind: 'onsite' | 'remote'
+          applications: number
+          share: number
+        }
+      }
     }
     Functions: {
       refresh_leaderboard_snapshots: {
         Args: Record<PropertyKey, never>
         Returns: undefined
       }
+      next_user_data_version: {
+        Args: { uid: string }
+        Returns: number
+      }
+      prune_application_tombstones: {
+        Args: { retention?: string }
+        Returns: undefined
+      }
       validate_url: {
         Args: { url: string }
         Returns: boolean
       }
+      leaderboard_rank_history: {
+        Args: { uid: string; since: string }
+        Returns: {
+          snapshot_at: string
+          rank: number
+          total_applications: number
+          ranked_users: number
+        }[]
+      }
+      snapshot_leaderboard_history: {
+        Args: Record<PropertyKey, never>
+        Returns: undefined
+      }
+      application_funnel: {
+        Args: { uid: string }
+        Returns: {
+          stage: 'applied' | 'interviewing' | 'offer' | 'rejected' | 'ghosted'
+          reached: number
+          rate: number | null
+          median_days: number | null
+        }[]
+      }
+      application_timeseries: {
+        Args: { uid: string; bucket: string; range_start: string; range_end: string }
+        Returns: {
+          period: string
+          total: number
+          applied: number
+          interviewing: number
+          rejected: number
+          ghosted: number
+          offer: number
+        }[]
+      }
+      leaderboard_counts: {
+        Args: { window_start: string }
+        Returns: {
+          user_id: string
+          username: string
+          total_applications: number
+          applications_in_window: number
+          rank: number
+        }[]
+      }
+      annualized_salary: {
+        Args: { amount: number; kind: string }
+        Returns: number | null
+      }
+      refresh_global_analytics: {
+        Args: Record<PropertyKey, never>
+        Returns: {
+          view_name: string
+          duration_ms: number
+        }[]
+      }
+      prune_global_analytics_refreshes: {
+        Args: Record<PropertyKey, never>
+        Returns: undefined
+      }
+      salary_stats: {
+        Args: { uid: string }
+        Returns: {
+          location_kind: 'onsite' | 'remote'
+          status: 'applied' | 'interviewing' | 'rejected' | 'ghosted' | 'offer'
+          samples: number
+          min: number
+          max: number
+          mean: number
+          p25: number
+          p50: number
+          p75: number
+          p90: number
+        }[]
+      }
+      global_salary_stats: {
+        Args: Record<PropertyKey, never>
+        Returns: {
+          location_kind: 'onsite' | 'remote'
+          status: 'applied' | 'interviewing' | 'rejected' | 'ghosted' | 'offer'
+          samples: number
+          min: number
+          max: number
+          mean: number
+          p25: number
+          p50: number
+          p75: number
+          p90: number
+        }[]
+      }
+      normalize_company_name: {
+        Args: { name: string }
+        Returns: string
+      }
+      company_id_for: {
+        Args: { name: string }
+        Returns: number
+      }
+      backfill_application_companies: {
+        Args: { batch_size?: number }
+        Returns: number
+      }
+      search_companies: {
+        Args: { uid: string; query: string; max_results: number }
+        Returns: {
+          id: number
+          name: string
+          applications: number
+        }[]
+      }
+      archive_closed_applications: {
+        Args: { older_than?: string; batch_size?: number }
+        Returns: number
+      }
     }
     Enums: {
       [_ in never]: never
@@ -0,0 +1,36 @@
+-- Per-user data version, bumped whenever one of the user's applications
+-- changes. Route handlers read it with a primary-key lookup to build ETags
+-- and answer conditional GETs without running the list query.
+CREATE TABLE user_data_versions (
+    user_id UUID PRIMARY KEY REFERENCES profiles(id) ON DELETE CASCADE,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ DEFAULT now()
+);
+
+-- Seed a version for users that already have applications
+INSERT INTO user_data_versions (user_id, version)
+SELECT DISTINCT user_id, 1 FROM applications
+ON CONFLICT (user_id) DO NOTHING;
+
+-- Bump the owning user's version on every insert, update or delete
+CREATE OR REPLACE FUNCTION bump_user_data_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO user_data_versions (user_id, version)
+    VALUES (COALESCE(NEW.user_id, OLD.user_id), 1)
+    ON CONFLICT (user_id) DO UPDATE SET
+        version = user_data_versions.version + 1,
+        updated_at = now();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE TRIGGER bump_applications_data_version
+    AFTER INSERT OR UPDATE OR DELETE ON applications
+    FOR EACH ROW EXECUTE FUNCTION bump_user_data_version();
+
+-- Enable Row Level Security
+ALTER TABLE user_data_versions ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view own data version" ON user_data_versions
+    FOR SELECT USING (auth.uid() = user_id);
@@ -0,0 +1,111 @@
+-- Delta sync: every application row records the user data version at which
+-- it last changed, and deletes leave a tombstone, so clients can ask for
+-- "everything since version N" instead of refetching whole lists.
+ALTER TABLE applications ADD COLUMN sync_version BIGINT NOT NULL DEFAULT 0;
+
+-- Versions at or below pruned_version may have lost tombstones; clients
+-- holding an older token must do a full reload.
+ALTER TABLE user_data_versions ADD COLUMN pruned_version BIGINT NOT NULL DEFAULT 0;
+
+CREATE TABLE application_tombstones (
+    application_id UUID PRIMARY KEY,
+    user_id UUID NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    sync_version BIGINT NOT NULL,
+    deleted_at TIMESTAMPTZ DEFAULT now()
+);
+
+-- Backfill before the new triggers exist so updated_at is left untouched
+ALTER TABLE applications DISABLE TRIGGER update_applications_updated_at;
+UPDATE applications a
+SET sync_version = v.version
+FROM user_data_versions v
+WHERE v.user_id = a.user_id;
+ALTER TABLE applications ENABLE TRIGGER update_applications_updated_at;
+
+CREATE INDEX applications_user_sync_idx ON applications(user_id, sync_version);
+CREATE INDEX application_tombstones_user_sync_idx ON application_tombstones(user_id, sync_version);
+
+-- Replace the AFTER trigger from the previous migration: the version is now
+-- bumped in a BEFORE trigger so it can be stamped onto the row itself. The
+-- upsert holds the user's version row lock until commit, which serializes a
+-- user's writes and keeps versions in commit order.
+DROP TRIGGER bump_applications_data_version ON applications;
+DROP FUNCTION bump_user_data_version();
+
+CREATE OR REPLACE FUNCTION next_user_data_version(uid UUID)
+RETURNS BIGINT AS $$
+DECLARE
+    next_version BIGINT;
+BEGIN
+    INSERT INTO user_data_versions (user_id, version)
+    VALUES (uid, 1)
+    ON CONFLICT (user_id) DO UPDATE SET
+        version = user_data_versions.version + 1,
+        updated_at = now()
+    RETURNING version INTO next_version;
+    RETURN next_version;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE OR REPLACE FUNCTION stamp_application_sync_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.sync_version = next_user_data_version(NEW.user_id);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- Deleting a profile cascades to its applications after the profile row is
+-- already gone. There is no client left to sync then, and both the
+-- tombstone and the version bump would fail their profiles foreign key and
+-- roll back the account deletion, so nothing is recorded.
+CREATE OR REPLACE FUNCTION record_application_tombstone()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM profiles WHERE id = OLD.user_id) THEN
+        RETURN NULL;
+    END IF;
+
+    INSERT INTO application_tombstones (application_id, user_id, sync_version)
+    VALUES (OLD.id, OLD.user_id, next_user_data_version(OLD.user_id))
+    ON CONFLICT (application_id) DO UPDATE SET
+        sync_version = EXCLUDED.sync_version,
+        deleted_at = now();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE TRIGGER stamp_applications_sync_version
+    BEFORE INSERT OR UPDATE ON applications
+    FOR EACH ROW EXECUTE FUNCTION stamp_application_sync_version();
+
+CREATE TRIGGER record_applications_tombstone
+    AFTER DELETE ON applications
+    FOR EACH ROW EXECUTE FUNCTION record_application_tombstone();
+
+-- Drop tombstones past the retention window and remember how far each
+-- user's log has been truncated. Intended to run daily (e.g. via pg_cron).
+CREATE OR REPLACE FUNCTION prune_application_tombstones(retention INTERVAL DEFAULT '30 days')
+RETURNS void AS $$
+BEGIN
+    WITH pruned AS (
+        DELETE FROM application_tombstones
+        WHERE deleted_at < now() - retention
+        RETURNING user_id, sync_version
+    )
+    UPDATE user_data_versions v
+    SET pruned_version = GREATEST(v.pruned_version, p.max_version)
+    FROM (
+        SELECT user_id, MAX(sync_version) AS max_version
+        FROM pruned
+        GROUP BY user_id
+    ) p
+    WHERE v.user_id = p.user_id;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- Enable Row Level Security
+ALTER TABLE application_tombstones ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view own tombstones" ON application_tombstones
+    FOR SELECT USING (auth.uid() = user_id);
@@ -0,0 +1,23 @@
+-- Make the company_url check cheap and consistent with applicationSchema.
+--
+-- validate_url() was a plpgsql function, so the CHECK paid for a function
+-- call and a regex per inserted or updated row, and it rejected the empty
+-- string the app sends when no URL is given. As an IMMUTABLE single-
+-- expression SQL function it is inlined into the constraint expression.
+--
+-- The database enforces what applicationSchema guarantees without needing a
+-- URL parser: empty, or an http:// or https:// prefix (case-sensitive, like
+-- the schema's startsWith check) followed by something. Full URL parsing stays
+-- in the app, so nothing the schema accepts is rejected here.
+ALTER TABLE applications DROP CONSTRAINT valid_company_url;
+
+CREATE OR REPLACE FUNCTION validate_url(url TEXT) RETURNS BOOLEAN AS $$
+    SELECT url = '' OR url LIKE 'http://_%' OR url LIKE 'https://_%'
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+-- Added NOT VALID, so this migration's ACCESS EXCLUSIVE lock (taken by
+-- DROP CONSTRAINT) is held for catalog changes only, not for a scan of
+-- every row. New writes are checked from here on; existing rows are
+-- validated by the next migration, in its own transaction.
+ALTER TABLE applications ADD CONSTRAINT valid_company_url
+CHECK (validate_url(company_url)) NOT VALID;
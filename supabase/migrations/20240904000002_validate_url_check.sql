@@ -0,0 +1,6 @@
+-- Checks existing rows against the valid_company_url constraint added NOT
+-- VALID by the previous migration. Kept separate so it runs in its own
+-- transaction: VALIDATE CONSTRAINT only takes SHARE UPDATE EXCLUSIVE, so
+-- reads and writes carry on during the scan. Existing rows passed the
+-- stricter regex, so none fail.
+ALTER TABLE applications VALIDATE CONSTRAINT valid_company_url;
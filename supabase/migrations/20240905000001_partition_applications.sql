@@ -0,0 +1,111 @@
+-- Hash-partition applications by user_id.
+--
+-- Every read and write the app issues is scoped to one user, so with the
+-- table partitioned on user_id each query prunes to a single partition, and
+-- vacuum, analyze and index maintenance work on partitions a sixteenth of
+-- the size. The partition count is a power of two so a partition can later
+-- be split in place (detach remainder r of 16, re-create it as remainders r
+-- and r + 16 of 32).
+--
+-- The primary key has to include the partition key, so it becomes
+-- (user_id, id). ids are still random UUIDs, and every route that looks a
+-- row up by id also filters on user_id, which keeps those lookups pruned.
+--
+-- The migration runs in one transaction: the old table is renamed, its rows
+-- are copied into the partitions, and it is dropped. Writes to applications
+-- block for the duration of the copy; scripts/perf/applications-partitioning.sql
+-- measures how long that is at a given table size.
+
+ALTER TABLE applications RENAME TO applications_unpartitioned;
+ALTER INDEX applications_pkey RENAME TO applications_unpartitioned_pkey;
+ALTER INDEX applications_user_idx RENAME TO applications_unpartitioned_user_idx;
+ALTER INDEX applications_user_sync_idx RENAME TO applications_unpartitioned_user_sync_idx;
+
+CREATE TABLE applications (
+    id UUID NOT NULL DEFAULT gen_random_uuid(),
+    user_id UUID NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    company TEXT NOT NULL CHECK (char_length(company) BETWEEN 1 AND 80),
+    job_title TEXT NOT NULL CHECK (char_length(job_title) BETWEEN 1 AND 80),
+    applied_at DATE NOT NULL CHECK (applied_at <= CURRENT_DATE),
+    status TEXT NOT NULL CHECK (status IN ('applied','interviewing','rejected','ghosted','offer')),
+    company_url TEXT NOT NULL,
+    salary_amount NUMERIC(12,2) CHECK (salary_amount IS NULL OR salary_amount > 0),
+    salary_type TEXT CHECK (salary_type IN ('hourly','salary')),
+    location_label TEXT CHECK (char_length(location_label) <= 120),
+    location_kind TEXT CHECK (location_kind IN ('onsite','remote')) DEFAULT 'onsite',
+    created_at TIMESTAMPTZ DEFAULT now(),
+    updated_at TIMESTAMPTZ DEFAULT now(),
+    sync_version BIGINT NOT NULL DEFAULT 0,
+    CONSTRAINT salary_consistency CHECK (
+        (salary_type IS NULL AND salary_amount IS NULL) OR
+        (salary_type IS NOT NULL AND salary_amount IS NOT NULL AND salary_amount > 0)
+    ),
+    CONSTRAINT valid_company_url CHECK (validate_url(company_url))
+) PARTITION BY HASH (user_id);
+
+-- Partitions are only reached through the parent, whose policies apply.
+-- RLS without policies on the partitions themselves denies direct access
+-- through the API roles' default grants.
+DO $$
+BEGIN
+    FOR remainder IN 0..15 LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF applications FOR VALUES WITH (MODULUS 16, REMAINDER %s)',
+            'applications_p' || lpad(remainder::text, 2, '0'),
+            remainder
+        );
+        EXECUTE format(
+            'ALTER TABLE %I ENABLE ROW LEVEL SECURITY',
+            'applications_p' || lpad(remainder::text, 2, '0')
+        );
+    END LOOP;
+END;
+$$;
+
+-- Copy before creating indexes and triggers: the bulk load is faster without
+-- them, and the triggers would restamp sync_version and updated_at. Sorting
+-- by user_id keeps each user's rows together in their partition.
+INSERT INTO applications (
+    id, user_id, company, job_title, applied_at, status, company_url,
+    salary_amount, salary_type, location_label, location_kind,
+    created_at, updated_at, sync_version
+)
+SELECT
+    id, user_id, company, job_title, applied_at, status, company_url,
+    salary_amount, salary_type, location_label, location_kind,
+    created_at, updated_at, sync_version
+FROM applications_unpartitioned
+ORDER BY user_id, applied_at;
+
+ALTER TABLE applications ADD CONSTRAINT applications_pkey PRIMARY KEY (user_id, id);
+CREATE INDEX applications_user_idx ON applications(user_id, status, applied_at);
+CREATE INDEX applications_user_sync_idx ON applications(user_id, sync_version);
+
+CREATE TRIGGER update_applications_updated_at BEFORE UPDATE ON applications
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+CREATE TRIGGER stamp_applications_sync_version
+    BEFORE INSERT OR UPDATE ON applications
+    FOR EACH ROW EXECUTE FUNCTION stamp_application_sync_version();
+
+CREATE TRIGGER record_applications_tombstone
+    AFTER DELETE ON applications
+    FOR EACH ROW EXECUTE FUNCTION record_application_tombstone();
+
+ALTER TABLE applications ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view own applications" ON applications
+    FOR SELECT USING (auth.uid() = user_id);
+
+CREATE POLICY "Users can insert own applications" ON applications
+    FOR INSERT WITH CHECK (auth.uid() = user_id);
+
+CREATE POLICY "Users can update own applications" ON applications
+    FOR UPDATE USING (auth.uid() = user_id);
+
+CREATE POLICY "Users can delete own applications" ON applications
+    FOR DELETE USING (auth.uid() = user_id);
+
+DROP TABLE applications_unpartitioned;
+
+ANALYZE applications;
@@ -0,0 +1,34 @@
+-- Indexes for the list query shapes listApplications generates: user_id =,
+-- optional status / location_kind / applied_at filters, ORDER BY one of the
+-- table's sortable columns with id as a tiebreaker, and keyset pages bounded
+-- on (sort column, id). scripts/perf/application-list-indexes.sql runs each
+-- shape with EXPLAIN ANALYZE against the old and new index sets.
+--
+-- Each index ends in id so a sorted page is read straight off the index,
+-- including later keyset pages. Every query selects all columns, so the
+-- indexes don't INCLUDE payload columns; index-only scans aren't possible
+-- for these shapes and the extra width would only slow writes.
+--
+-- Not indexed on purpose: location_kind has two values, so it is cheaper as
+-- a filter on the applied_at scan; salary sorting happens in memory; and
+-- the ilike search needs a trigram index, which is a separate change.
+
+-- Default list (newest first), applied_at date ranges, and their keyset pages
+CREATE INDEX applications_user_applied_idx
+    ON applications(user_id, applied_at DESC, id DESC);
+
+-- Sorting by company and by job title
+CREATE INDEX applications_user_company_idx
+    ON applications(user_id, company, id);
+CREATE INDEX applications_user_job_title_idx
+    ON applications(user_id, job_title, id);
+
+-- Replaces (user_id, status, applied_at): a status filter with the default
+-- order now pages off the index, sorting by status only needs an
+-- incremental sort on id within each status, and the stats query stays an
+-- index-only scan
+DROP INDEX applications_user_idx;
+CREATE INDEX applications_user_status_idx
+    ON applications(user_id, status, applied_at DESC, id DESC);
+
+ANALYZE applications;
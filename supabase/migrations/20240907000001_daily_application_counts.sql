@@ -0,0 +1,122 @@
+-- Per-user daily application counts by status, keyed on applied_at and kept
+-- in step with applications by statement-level triggers. A rolling window
+-- (last 7, 30 or 90 days, overall or by status) is a sum over at most
+-- days x statuses buckets instead of a scan of the user's applications.
+CREATE TABLE user_daily_application_counts (
+    user_id UUID NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    day DATE NOT NULL,
+    status TEXT NOT NULL,
+    n INTEGER NOT NULL CHECK (n > 0),
+    PRIMARY KEY (user_id, day, status)
+);
+
+INSERT INTO user_daily_application_counts (user_id, day, status, n)
+SELECT user_id, applied_at, status, COUNT(*)
+FROM applications
+GROUP BY user_id, applied_at, status;
+
+-- Transition tables let each statement apply one net delta per bucket, so
+-- bulk inserts and imports cost one write per (user, day, status) rather
+-- than one per row. Positive deltas upsert; negative ones only update or
+-- delete existing buckets, so a cascading profile delete never recreates
+-- rows for a user that is going away. The three writes touch disjoint
+-- buckets, so they can share one statement.
+CREATE OR REPLACE FUNCTION apply_daily_application_counts()
+RETURNS TRIGGER AS $$
+DECLARE
+    changed_rows TEXT;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        changed_rows := 'SELECT user_id, applied_at, status, 1 AS delta FROM new_rows';
+    ELSIF TG_OP = 'DELETE' THEN
+        changed_rows := 'SELECT user_id, applied_at, status, -1 AS delta FROM old_rows';
+    ELSE
+        -- Only rows that moved bucket; user_id never changes
+        changed_rows := '
+            SELECT o.user_id, d.applied_at, d.status, d.delta
+            FROM old_rows o
+            JOIN new_rows n ON n.id = o.id
+            CROSS JOIN LATERAL (VALUES
+                (o.applied_at, o.status, -1),
+                (n.applied_at, n.status, 1)
+            ) AS d(applied_at, status, delta)
+            WHERE (o.applied_at, o.status) IS DISTINCT FROM (n.applied_at, n.status)';
+    END IF;
+
+    EXECUTE format($sql$
+        WITH deltas AS (
+            SELECT user_id, applied_at AS day, status, SUM(delta)::INTEGER AS delta
+            FROM (%s) changed
+            GROUP BY user_id, applied_at, status
+            HAVING SUM(delta) <> 0
+        ),
+        incremented AS (
+            INSERT INTO user_daily_application_counts AS c (user_id, day, status, n)
+            SELECT user_id, day, status, delta FROM deltas WHERE delta > 0
+            ON CONFLICT (user_id, day, status) DO UPDATE SET n = c.n + EXCLUDED.n
+        ),
+        decremented AS (
+            UPDATE user_daily_application_counts c
+            SET n = c.n + d.delta
+            FROM deltas d
+            WHERE c.user_id = d.user_id AND c.day = d.day AND c.status = d.status
+                AND d.delta < 0 AND c.n + d.delta > 0
+        )
+        DELETE FROM user_daily_application_counts c
+        USING deltas d
+        WHERE c.user_id = d.user_id AND c.day = d.day AND c.status = d.status
+            AND d.delta < 0 AND c.n + d.delta <= 0
+    $sql$, changed_rows);
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE TRIGGER count_inserted_applications
+    AFTER INSERT ON applications
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_daily_application_counts();
+
+CREATE TRIGGER count_updated_applications
+    AFTER UPDATE ON applications
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_daily_application_counts();
+
+CREATE TRIGGER count_deleted_applications
+    AFTER DELETE ON applications
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_daily_application_counts();
+
+-- Leaderboard totals and window counts straight from the buckets, ranked by
+-- total and then by recent activity
+CREATE OR REPLACE FUNCTION leaderboard_counts(window_start DATE)
+RETURNS TABLE (
+    user_id UUID,
+    username TEXT,
+    total_applications INTEGER,
+    applications_in_window INTEGER,
+    rank INTEGER
+) AS $$
+    SELECT
+        c.user_id,
+        p.username,
+        c.total::INTEGER,
+        c.in_window::INTEGER,
+        ROW_NUMBER() OVER (ORDER BY c.total DESC, c.in_window DESC, p.username)::INTEGER
+    FROM (
+        SELECT
+            user_id,
+            SUM(n) AS total,
+            COALESCE(SUM(n) FILTER (WHERE day >= window_start), 0) AS in_window
+        FROM user_daily_application_counts
+        GROUP BY user_id
+    ) c
+    JOIN profiles p ON p.id = c.user_id
+    ORDER BY 5
+$$ LANGUAGE sql STABLE;
+
+-- Enable Row Level Security
+ALTER TABLE user_daily_application_counts ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view own daily counts" ON user_daily_application_counts
+    FOR SELECT USING (auth.uid() = user_id);
@@ -0,0 +1,104 @@
+-- Append-only leaderboard history for rank-over-time charts.
+--
+-- Each snapshot is one row. Every user who has ever been ranked gets a
+-- permanent slot number, and the row packs every slot's rank and total
+-- application count as 4-byte big-endian integers, so a snapshot of 100k
+-- users is ~800 kB instead of 100k narrow rows plus their index entries.
+-- The packed columns are stored uncompressed (EXTERNAL), which lets
+-- substring() fetch just the TOAST chunk holding one user's slot: reading a
+-- user's trajectory touches one chunk per snapshot, however many users
+-- there are.
+
+-- Identity values are never reused, so a deleted user's slot is never
+-- handed to someone else and old snapshots stay unambiguous
+CREATE TABLE leaderboard_slots (
+    user_id UUID PRIMARY KEY REFERENCES profiles(id) ON DELETE CASCADE,
+    slot INTEGER GENERATED ALWAYS AS IDENTITY UNIQUE
+);
+
+CREATE TABLE leaderboard_history (
+    snapshot_at TIMESTAMPTZ PRIMARY KEY DEFAULT now(),
+    ranked_users INTEGER NOT NULL,
+    -- Rank (0 = not ranked) and total applications for slots 1..n
+    ranks BYTEA NOT NULL,
+    totals BYTEA NOT NULL
+);
+
+ALTER TABLE leaderboard_history ALTER COLUMN ranks SET STORAGE EXTERNAL;
+ALTER TABLE leaderboard_history ALTER COLUMN totals SET STORAGE EXTERNAL;
+
+-- The integer stored for `slot` in a packed column
+CREATE OR REPLACE FUNCTION leaderboard_slot_value(packed BYTEA, slot INTEGER)
+RETURNS INTEGER AS $$
+    SELECT ('x' || encode(substring(packed FROM (slot - 1) * 4 + 1 FOR 4), 'hex'))::BIT(32)::INTEGER
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+-- Records the current leaderboard (same ranking as leaderboard_counts with
+-- the default 30-day tiebreaker window). Intended to run on a schedule,
+-- e.g. daily via pg_cron.
+CREATE OR REPLACE FUNCTION snapshot_leaderboard_history()
+RETURNS void AS $$
+BEGIN
+    CREATE TEMP TABLE snapshot_ranked ON COMMIT DROP AS
+    SELECT user_id, rank, total_applications
+    FROM leaderboard_counts(CURRENT_DATE - 29);
+
+    -- One snapshot writer at a time keeps slot assignment race-free
+    LOCK TABLE leaderboard_slots IN SHARE ROW EXCLUSIVE MODE;
+
+    INSERT INTO leaderboard_slots (user_id)
+    SELECT r.user_id
+    FROM snapshot_ranked r
+    WHERE NOT EXISTS (SELECT 1 FROM leaderboard_slots s WHERE s.user_id = r.user_id)
+    ORDER BY r.rank;
+
+    INSERT INTO leaderboard_history (snapshot_at, ranked_users, ranks, totals)
+    SELECT
+        now(),
+        (SELECT COUNT(*) FROM snapshot_ranked),
+        string_agg(int4send(COALESCE(r.rank, 0)), ''::BYTEA ORDER BY slots.slot),
+        string_agg(int4send(COALESCE(r.total_applications, 0)), ''::BYTEA ORDER BY slots.slot)
+    FROM generate_series(1, (SELECT COALESCE(MAX(slot), 0) FROM leaderboard_slots)) AS slots(slot)
+    LEFT JOIN leaderboard_slots s ON s.slot = slots.slot
+    LEFT JOIN snapshot_ranked r ON r.user_id = s.user_id
+    HAVING COUNT(*) > 0;
+
+    DROP TABLE snapshot_ranked;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- One user's rank and total at every snapshot since `since` in which they
+-- were ranked. octet_length() of an uncompressed TOAST value is read from
+-- its pointer, so snapshots taken before the user had a slot are skipped
+-- without fetching them.
+CREATE OR REPLACE FUNCTION leaderboard_rank_history(uid UUID, since TIMESTAMPTZ)
+RETURNS TABLE (
+    snapshot_at TIMESTAMPTZ,
+    rank INTEGER,
+    total_applications INTEGER,
+    ranked_users INTEGER
+) AS $$
+    SELECT snapshot_at, rank, total_applications, ranked_users
+    FROM (
+        SELECT
+            h.snapshot_at,
+            leaderboard_slot_value(h.ranks, s.slot) AS rank,
+            leaderboard_slot_value(h.totals, s.slot) AS total_applications,
+            h.ranked_users
+        FROM leaderboard_slots s
+        JOIN leaderboard_history h
+            ON h.snapshot_at >= since AND octet_length(h.ranks) >= s.slot * 4
+        WHERE s.user_id = uid
+    ) points
+    WHERE rank > 0
+    ORDER BY snapshot_at
+$$ LANGUAGE sql STABLE;
+
+-- Only reachable through the API routes, which pass the caller's own id
+REVOKE EXECUTE ON FUNCTION leaderboard_rank_history(UUID, TIMESTAMPTZ) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION snapshot_leaderboard_history() FROM PUBLIC, anon, authenticated;
+
+-- Enable Row Level Security; no policies, so only the service role reads
+-- these tables directly
+ALTER TABLE leaderboard_slots ENABLE ROW LEVEL SECURITY;
+ALTER TABLE leaderboard_history ENABLE ROW LEVEL SECURITY;
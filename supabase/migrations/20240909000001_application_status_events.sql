@@ -0,0 +1,148 @@
+-- Append-only log of application status changes, for pipeline analytics
+-- (time to interview, rejection and ghosting rates) that can't be derived
+-- from the current status alone.
+--
+-- Rows are narrow and never updated. A creation event (from_status NULL) is
+-- dated at the application's applied_at, so durations are measured from
+-- the day the user applied rather than the day they logged it; later
+-- transitions are dated when they happen. Events go away with their
+-- application so analytics reflect the applications a user still has.
+CREATE TABLE application_status_events (
+    user_id UUID NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    application_id UUID NOT NULL,
+    from_status TEXT,
+    to_status TEXT NOT NULL,
+    changed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Per-user analytics group a user's events by application
+CREATE INDEX application_status_events_user_idx
+    ON application_status_events(user_id, application_id, changed_at);
+
+-- Backfill. Only the current status is known for existing rows, so each
+-- gets a creation event as 'applied' on applied_at and, if it has moved on
+-- since, one transition dated at its last update.
+INSERT INTO application_status_events (user_id, application_id, from_status, to_status, changed_at)
+SELECT user_id, id, NULL, 'applied', applied_at::TIMESTAMPTZ
+FROM applications
+UNION ALL
+SELECT user_id, id, 'applied', status, COALESCE(updated_at, created_at, now())
+FROM applications
+WHERE status <> 'applied';
+
+CREATE OR REPLACE FUNCTION record_application_status_events()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO application_status_events (user_id, application_id, from_status, to_status, changed_at)
+        SELECT user_id, id, NULL, status, applied_at::TIMESTAMPTZ
+        FROM new_rows;
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO application_status_events (user_id, application_id, from_status, to_status)
+        SELECT n.user_id, n.id, o.status, n.status
+        FROM old_rows o
+        JOIN new_rows n ON n.id = o.id
+        WHERE n.status <> o.status;
+    ELSE
+        DELETE FROM application_status_events e
+        USING old_rows o
+        WHERE e.user_id = o.user_id AND e.application_id = o.id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE TRIGGER record_inserted_application_status
+    AFTER INSERT ON applications
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION record_application_status_events();
+
+CREATE TRIGGER record_updated_application_status
+    AFTER UPDATE ON applications
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION record_application_status_events();
+
+CREATE TRIGGER record_deleted_application_status
+    AFTER DELETE ON applications
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION record_application_status_events();
+
+-- Funnel for one user: how many applications reached each stage, that as a
+-- share of all applications (of those that interviewed, for offers), and
+-- the median days it took.
+--   applied       every application
+--   interviewing  reached interviewing (or went straight to an offer),
+--                 timed from applying
+--   offer         reached offer, as a share of those that interviewed,
+--                 timed from the first interview (or from applying)
+--   rejected      ever rejected, timed from applying
+--   ghosted       ever ghosted, timed from applying
+-- Runs with the caller's rights, so RLS limits it to their own events.
+CREATE OR REPLACE FUNCTION application_funnel(uid UUID)
+RETURNS TABLE (
+    stage TEXT,
+    reached INTEGER,
+    rate NUMERIC,
+    median_days NUMERIC
+) AS $$
+    WITH firsts AS (
+        SELECT
+            application_id,
+            MIN(changed_at) FILTER (WHERE from_status IS NULL) AS applied,
+            MIN(changed_at) FILTER (WHERE to_status = 'interviewing') AS interviewing,
+            MIN(changed_at) FILTER (WHERE to_status = 'offer') AS offer,
+            MIN(changed_at) FILTER (WHERE to_status = 'rejected') AS rejected,
+            MIN(changed_at) FILTER (WHERE to_status = 'ghosted') AS ghosted
+        FROM application_status_events
+        WHERE user_id = uid
+        GROUP BY application_id
+    ),
+    totals AS (
+        SELECT
+            COUNT(*) AS applied,
+            COUNT(*) FILTER (WHERE interviewing IS NOT NULL OR offer IS NOT NULL) AS interviewed
+        FROM firsts
+    ),
+    -- LEFT JOINs keep every stage when the user has no applications yet
+    stages AS (
+        SELECT 1 AS position, 'applied' AS stage, t.applied AS reached, t.applied AS base, NULL::DOUBLE PRECISION AS median_days
+        FROM totals t
+        UNION ALL
+        SELECT 2, 'interviewing', t.interviewed, t.applied,
+            percentile_cont(0.5) WITHIN GROUP (
+                ORDER BY extract(epoch FROM COALESCE(f.interviewing, f.offer) - f.applied) / 86400
+            )
+        FROM totals t LEFT JOIN firsts f ON true
+        GROUP BY t.interviewed, t.applied
+        UNION ALL
+        SELECT 3, 'offer', COUNT(f.offer), t.interviewed,
+            percentile_cont(0.5) WITHIN GROUP (
+                ORDER BY extract(epoch FROM f.offer - COALESCE(f.interviewing, f.applied)) / 86400
+            )
+        FROM totals t LEFT JOIN firsts f ON true
+        GROUP BY t.interviewed
+        UNION ALL
+        SELECT 4, 'rejected', COUNT(f.rejected), t.applied,
+            percentile_cont(0.5) WITHIN GROUP (ORDER BY extract(epoch FROM f.rejected - f.applied) / 86400)
+        FROM totals t LEFT JOIN firsts f ON true
+        GROUP BY t.applied
+        UNION ALL
+        SELECT 5, 'ghosted', COUNT(f.ghosted), t.applied,
+            percentile_cont(0.5) WITHIN GROUP (ORDER BY extract(epoch FROM f.ghosted - f.applied) / 86400)
+        FROM totals t LEFT JOIN firsts f ON true
+        GROUP BY t.applied
+    )
+    SELECT
+        stage,
+        reached::INTEGER,
+        CASE WHEN base > 0 THEN round(reached::NUMERIC / base, 4) END,
+        round(median_days::NUMERIC, 1)
+    FROM stages
+    ORDER BY position
+$$ LANGUAGE sql STABLE;
+
+-- Enable Row Level Security
+ALTER TABLE application_status_events ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view own status events" ON application_status_events
+    FOR SELECT USING (auth.uid() = user_id);
@@ -0,0 +1,60 @@
+-- Applications per week or month by status for one user, from the daily
+-- count buckets. The range scan runs on the buckets' (user_id, day, status)
+-- primary key, so it reads at most one row per active day and status, and
+-- empty periods are filled in so charts get a continuous series. Weeks
+-- start on Monday. Runs with the caller's rights, so RLS applies.
+--
+-- The function is reachable over RPC, so it checks its own arguments
+-- rather than relying on the API route: only week and month buckets, and
+-- ranges of at most 3660 days (the route's MAX_RANGE_DAYS), so a caller
+-- can't make generate_series produce an unbounded number of periods.
+CREATE OR REPLACE FUNCTION application_timeseries(
+    uid UUID,
+    bucket TEXT,
+    range_start DATE,
+    range_end DATE
+)
+RETURNS TABLE (
+    period DATE,
+    total INTEGER,
+    applied INTEGER,
+    interviewing INTEGER,
+    rejected INTEGER,
+    ghosted INTEGER,
+    offer INTEGER
+) AS $$
+#variable_conflict use_column
+BEGIN
+    IF bucket IS NULL OR bucket NOT IN ('week', 'month') THEN
+        RAISE EXCEPTION 'bucket must be week or month' USING ERRCODE = '22023';
+    END IF;
+    IF range_start IS NULL OR range_end IS NULL
+        OR range_end < range_start OR range_end - range_start > 3660 THEN
+        RAISE EXCEPTION 'range must be ordered and at most 3660 days' USING ERRCODE = '22023';
+    END IF;
+
+    RETURN QUERY
+    WITH counts AS (
+        SELECT date_trunc(bucket, day::TIMESTAMP)::DATE AS period, status, SUM(n) AS n
+        FROM user_daily_application_counts
+        WHERE user_id = uid AND day BETWEEN range_start AND range_end
+        GROUP BY 1, 2
+    )
+    SELECT
+        p.period::DATE,
+        COALESCE(SUM(c.n), 0)::INTEGER,
+        COALESCE(SUM(c.n) FILTER (WHERE c.status = 'applied'), 0)::INTEGER,
+        COALESCE(SUM(c.n) FILTER (WHERE c.status = 'interviewing'), 0)::INTEGER,
+        COALESCE(SUM(c.n) FILTER (WHERE c.status = 'rejected'), 0)::INTEGER,
+        COALESCE(SUM(c.n) FILTER (WHERE c.status = 'ghosted'), 0)::INTEGER,
+        COALESCE(SUM(c.n) FILTER (WHERE c.status = 'offer'), 0)::INTEGER
+    FROM generate_series(
+        date_trunc(bucket, range_start::TIMESTAMP),
+        date_trunc(bucket, range_end::TIMESTAMP),
+        ('1 ' || bucket)::INTERVAL
+    ) AS p(period)
+    LEFT JOIN counts c ON c.period = p.period::DATE
+    GROUP BY p.period
+    ORDER BY p.period;
+END;
+$$ LANGUAGE plpgsql STABLE;
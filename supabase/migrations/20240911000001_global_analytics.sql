@@ -0,0 +1,113 @@
+-- Aggregate insights across all users, served from materialized views so
+-- reads never touch the applications table. Each view has a unique index,
+-- which lets refresh_global_analytics() use REFRESH ... CONCURRENTLY:
+-- readers keep seeing the previous contents while a refresh runs instead of
+-- waiting on its exclusive lock.
+--
+-- Companies and job titles are grouped case- and whitespace-insensitively
+-- and only published once at least five different users have applied, so
+-- a row can't be traced back to one person's applications.
+
+-- Salary per year: hourly rates assume 40 hours a week, 52 weeks a year
+-- (the same conversion as getSalaryForComparison)
+CREATE OR REPLACE FUNCTION annualized_salary(amount NUMERIC, kind TEXT)
+RETURNS NUMERIC AS $$
+    SELECT CASE kind
+        WHEN 'salary' THEN amount
+        WHEN 'hourly' THEN amount * 40 * 52
+    END
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+CREATE MATERIALIZED VIEW global_company_insights AS
+SELECT
+    lower(btrim(company)) AS company_key,
+    -- The most common spelling
+    mode() WITHIN GROUP (ORDER BY btrim(company)) AS company,
+    COUNT(DISTINCT user_id)::INTEGER AS applicants,
+    COUNT(*)::INTEGER AS applications,
+    COUNT(*) FILTER (WHERE status = 'offer')::INTEGER AS offers,
+    round(COUNT(*) FILTER (WHERE status = 'offer')::NUMERIC / COUNT(*), 4) AS offer_rate
+FROM applications
+GROUP BY 1
+HAVING COUNT(DISTINCT user_id) >= 5;
+
+CREATE UNIQUE INDEX global_company_insights_key_idx ON global_company_insights(company_key);
+CREATE INDEX global_company_insights_applications_idx ON global_company_insights(applications DESC);
+
+CREATE MATERIALIZED VIEW global_job_title_insights AS
+SELECT
+    lower(btrim(job_title)) AS job_title_key,
+    mode() WITHIN GROUP (ORDER BY btrim(job_title)) AS job_title,
+    COUNT(DISTINCT user_id)::INTEGER AS applicants,
+    COUNT(*)::INTEGER AS applications,
+    COUNT(salary_amount)::INTEGER AS salary_samples,
+    round(percentile_cont(0.5) WITHIN GROUP (
+        ORDER BY annualized_salary(salary_amount, salary_type)
+    )::NUMERIC, 2) AS median_salary
+FROM applications
+GROUP BY 1
+HAVING COUNT(DISTINCT user_id) >= 5;
+
+CREATE UNIQUE INDEX global_job_title_insights_key_idx ON global_job_title_insights(job_title_key);
+CREATE INDEX global_job_title_insights_applications_idx ON global_job_title_insights(applications DESC);
+
+-- Onsite/remote split. Only two rows, so no anonymity threshold.
+CREATE MATERIALIZED VIEW global_location_insights AS
+SELECT
+    location_kind,
+    COUNT(*)::INTEGER AS applications,
+    round(COUNT(*)::NUMERIC / SUM(COUNT(*)) OVER (), 4) AS share
+FROM applications
+WHERE location_kind IS NOT NULL
+GROUP BY location_kind;
+
+CREATE UNIQUE INDEX global_location_insights_kind_idx ON global_location_insights(location_kind);
+
+-- One row per view refresh, for monitoring how long refreshes take as the
+-- applications table grows
+CREATE TABLE global_analytics_refreshes (
+    view_name TEXT NOT NULL,
+    refreshed_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    duration_ms NUMERIC NOT NULL,
+    PRIMARY KEY (view_name, refreshed_at)
+);
+
+-- Refreshes every view and records how long each took. Intended to run on
+-- a schedule, e.g. hourly via pg_cron:
+--   SELECT cron.schedule('refresh-global-analytics', '0 * * * *',
+--                        'SELECT refresh_global_analytics()');
+CREATE OR REPLACE FUNCTION refresh_global_analytics()
+RETURNS TABLE (view_name TEXT, duration_ms NUMERIC) AS $$
+DECLARE
+    started TIMESTAMPTZ;
+    target TEXT;
+BEGIN
+    FOREACH target IN ARRAY ARRAY['global_company_insights', 'global_job_title_insights', 'global_location_insights']
+    LOOP
+        started := clock_timestamp();
+        EXECUTE format('REFRESH MATERIALIZED VIEW CONCURRENTLY %I', target);
+        view_name := target;
+        duration_ms := round(extract(epoch FROM clock_timestamp() - started)::NUMERIC * 1000, 1);
+        INSERT INTO global_analytics_refreshes (view_name, refreshed_at, duration_ms)
+        VALUES (target, clock_timestamp(), duration_ms);
+        RETURN NEXT;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- Keeps the refresh log to the last 30 days
+CREATE OR REPLACE FUNCTION prune_global_analytics_refreshes()
+RETURNS void AS $$
+    DELETE FROM global_analytics_refreshes WHERE refreshed_at < now() - INTERVAL '30 days'
+$$ LANGUAGE sql SECURITY DEFINER;
+
+-- Materialized views can't have RLS, so they are only readable with the
+-- service role, through the API routes
+REVOKE ALL ON global_company_insights, global_job_title_insights, global_location_insights
+    FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION refresh_global_analytics() FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION prune_global_analytics_refreshes() FROM PUBLIC, anon, authenticated;
+
+-- Enable Row Level Security; no policies, so only the service role reads
+-- the refresh log
+ALTER TABLE global_analytics_refreshes ENABLE ROW LEVEL SECURITY;
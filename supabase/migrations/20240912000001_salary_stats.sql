@@ -0,0 +1,112 @@
+-- Salary distributions computed in the database. Hourly and yearly salaries
+-- are only comparable once annualized, so the annualized value is stored as
+-- a generated column: it can be indexed and read straight from the index,
+-- and percentile_cont() sorts index tuples instead of fetching heap rows.
+ALTER TABLE applications
+    ADD COLUMN annual_salary NUMERIC
+    GENERATED ALWAYS AS (annualized_salary(salary_amount, salary_type)) STORED;
+
+-- Per-user stats: partition pruning on user_id plus an index-only scan over
+-- just the user's salaried applications, already grouped and sorted
+CREATE INDEX applications_user_salary_idx
+    ON applications(user_id, location_kind, status, annual_salary)
+    WHERE annual_salary IS NOT NULL;
+
+-- Global stats read every salaried application, but only this index. The
+-- user id is included for the anonymity threshold.
+CREATE INDEX applications_salary_idx
+    ON applications(location_kind, status, annual_salary)
+    INCLUDE (user_id)
+    WHERE annual_salary IS NOT NULL;
+
+-- Annualized salary distribution of one user's applications by location
+-- kind and status. Applications without a salary are left out. Runs with
+-- the caller's rights, so RLS applies.
+CREATE OR REPLACE FUNCTION salary_stats(uid UUID)
+RETURNS TABLE (
+    location_kind TEXT,
+    status TEXT,
+    samples INTEGER,
+    min NUMERIC,
+    max NUMERIC,
+    mean NUMERIC,
+    p25 NUMERIC,
+    p50 NUMERIC,
+    p75 NUMERIC,
+    p90 NUMERIC
+) AS $$
+    SELECT
+        location_kind,
+        status,
+        samples,
+        min,
+        max,
+        mean,
+        round(pct[1]::NUMERIC, 2),
+        round(pct[2]::NUMERIC, 2),
+        round(pct[3]::NUMERIC, 2),
+        round(pct[4]::NUMERIC, 2)
+    FROM (
+        SELECT
+            location_kind,
+            status,
+            COUNT(*)::INTEGER AS samples,
+            MIN(annual_salary) AS min,
+            MAX(annual_salary) AS max,
+            round(AVG(annual_salary), 2) AS mean,
+            -- One sort per group for all four percentiles
+            percentile_cont(ARRAY[0.25, 0.5, 0.75, 0.9]) WITHIN GROUP (ORDER BY annual_salary) AS pct
+        FROM applications
+        WHERE user_id = uid AND annual_salary IS NOT NULL
+        GROUP BY location_kind, status
+    ) groups
+    ORDER BY location_kind, status
+$$ LANGUAGE sql STABLE;
+
+-- The same distribution across all users, anonymized: a group is only
+-- published once at least five different users have a salaried
+-- application in it, and every figure is rounded to the nearest thousand
+-- so no single application's salary can be read back out.
+CREATE OR REPLACE FUNCTION global_salary_stats()
+RETURNS TABLE (
+    location_kind TEXT,
+    status TEXT,
+    samples INTEGER,
+    min NUMERIC,
+    max NUMERIC,
+    mean NUMERIC,
+    p25 NUMERIC,
+    p50 NUMERIC,
+    p75 NUMERIC,
+    p90 NUMERIC
+) AS $$
+    SELECT
+        location_kind,
+        status,
+        samples,
+        round(min, -3),
+        round(max, -3),
+        round(mean, -3),
+        round(pct[1]::NUMERIC, -3),
+        round(pct[2]::NUMERIC, -3),
+        round(pct[3]::NUMERIC, -3),
+        round(pct[4]::NUMERIC, -3)
+    FROM (
+        SELECT
+            location_kind,
+            status,
+            COUNT(*)::INTEGER AS samples,
+            MIN(annual_salary) AS min,
+            MAX(annual_salary) AS max,
+            AVG(annual_salary) AS mean,
+            percentile_cont(ARRAY[0.25, 0.5, 0.75, 0.9]) WITHIN GROUP (ORDER BY annual_salary) AS pct
+        FROM applications
+        WHERE annual_salary IS NOT NULL
+        GROUP BY location_kind, status
+        HAVING COUNT(DISTINCT user_id) >= 5
+    ) groups
+    ORDER BY location_kind, status
+$$ LANGUAGE sql STABLE SECURITY DEFINER;
+
+-- Only reachable through the API route
+REVOKE EXECUTE ON FUNCTION global_salary_stats() FROM PUBLIC, anon, authenticated;
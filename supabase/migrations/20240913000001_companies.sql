@@ -0,0 +1,191 @@
+-- Canonical company dictionary. `company` stays free text as the user typed
+-- it, and each application also points at the companies row for its
+-- normalized name, so "Google", "google" and "Google LLC" share one
+-- company_id. Grouping, filtering and searching by company become integer
+-- joins on indexes instead of ILIKE over every application's raw string.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Lowercased, punctuation collapsed to single spaces and one trailing legal
+-- suffix dropped. Falls back to the lowercased name when nothing is left
+-- (e.g. a company called "Inc.").
+CREATE OR REPLACE FUNCTION normalize_company_name(name TEXT)
+RETURNS TEXT AS $$
+    SELECT COALESCE(
+        NULLIF(btrim(regexp_replace(
+            regexp_replace(lower(name), '[[:punct:][:space:]]+', ' ', 'g'),
+            ' (inc|llc|ltd|limited|corp|corporation|co|company|gmbh|plc|ag|sa) ?$',
+            ''
+        )), ''),
+        lower(btrim(name))
+    )
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+CREATE TABLE companies (
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    -- The first spelling seen
+    name TEXT NOT NULL,
+    normalized_key TEXT NOT NULL UNIQUE,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Substring and fuzzy (similarity) matching on the normalized name
+CREATE INDEX companies_normalized_key_trgm_idx
+    ON companies USING GIN (normalized_key gin_trgm_ops);
+
+INSERT INTO companies (name, normalized_key)
+SELECT DISTINCT ON (normalize_company_name(company)) btrim(company), normalize_company_name(company)
+FROM applications
+ORDER BY normalize_company_name(company), created_at;
+
+-- Nullable until backfill_application_companies() has caught up; new and
+-- edited rows get it from the trigger below
+ALTER TABLE applications ADD COLUMN company_id BIGINT REFERENCES companies(id);
+
+-- Serves both "applications at this company" across users and, with
+-- user_id, one user's applications at a company
+CREATE INDEX applications_company_user_idx ON applications(company_id, user_id);
+-- Lets the backfill find the rows it still has to do; empty afterwards
+CREATE INDEX applications_missing_company_idx ON applications(user_id, id) WHERE company_id IS NULL;
+
+-- The companies row for a name, created if it doesn't exist yet
+CREATE OR REPLACE FUNCTION company_id_for(name TEXT)
+RETURNS BIGINT AS $$
+DECLARE
+    normalized TEXT := normalize_company_name(name);
+    company BIGINT;
+BEGIN
+    SELECT id INTO company FROM companies WHERE normalized_key = normalized;
+    IF company IS NULL THEN
+        INSERT INTO companies (name, normalized_key)
+        VALUES (btrim(name), normalized)
+        ON CONFLICT (normalized_key) DO NOTHING
+        RETURNING id INTO company;
+        -- Lost a race with a concurrent insert of the same company
+        IF company IS NULL THEN
+            SELECT id INTO company FROM companies WHERE normalized_key = normalized;
+        END IF;
+    END IF;
+    RETURN company;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE OR REPLACE FUNCTION set_application_company()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.company_id = company_id_for(NEW.company);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE TRIGGER set_application_company
+    BEFORE INSERT OR UPDATE OF company ON applications
+    FOR EACH ROW EXECUTE FUNCTION set_application_company();
+
+-- Filling in company_id is not an edit by the user, so the backfill sets
+-- offerless.backfill for its transaction and both updated_at and the sync
+-- version are left alone: the user's data version, ETags and delta syncs
+-- don't change for it
+DROP TRIGGER update_applications_updated_at ON applications;
+CREATE TRIGGER update_applications_updated_at
+    BEFORE UPDATE ON applications
+    FOR EACH ROW
+    WHEN (current_setting('offerless.backfill', true) IS DISTINCT FROM 'on')
+    EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER stamp_applications_sync_version ON applications;
+CREATE TRIGGER stamp_applications_sync_version
+    BEFORE INSERT OR UPDATE ON applications
+    FOR EACH ROW
+    WHEN (current_setting('offerless.backfill', true) IS DISTINCT FROM 'on')
+    EXECUTE FUNCTION stamp_application_sync_version();
+
+-- Links up to batch_size applications without a company_id and returns how
+-- many it did; run until it returns 0 (see scripts/backfill-company-ids.ts).
+-- Small batches keep row locks short, and SKIP LOCKED steps around rows
+-- users are editing, which the trigger handles anyway.
+CREATE OR REPLACE FUNCTION backfill_application_companies(batch_size INTEGER DEFAULT 5000)
+RETURNS INTEGER AS $$
+DECLARE
+    linked INTEGER;
+BEGIN
+    PERFORM set_config('offerless.backfill', 'on', true);
+
+    -- Companies created by this statement aren't visible to its own join on
+    -- companies, so they're matched through the INSERT's RETURNING instead
+    WITH batch AS (
+        SELECT user_id, id, normalize_company_name(company) AS normalized, btrim(company) AS name
+        FROM applications
+        WHERE company_id IS NULL
+        LIMIT batch_size
+        FOR UPDATE SKIP LOCKED
+    ),
+    created AS (
+        INSERT INTO companies (name, normalized_key)
+        SELECT DISTINCT ON (normalized) name, normalized
+        FROM batch
+        ORDER BY normalized
+        ON CONFLICT (normalized_key) DO NOTHING
+        RETURNING id, normalized_key
+    )
+    UPDATE applications a
+    SET company_id = COALESCE(n.id, c.id)
+    FROM batch b
+    LEFT JOIN created n ON n.normalized_key = b.normalized
+    LEFT JOIN companies c ON c.normalized_key = b.normalized
+    WHERE a.user_id = b.user_id AND a.id = b.id
+        AND COALESCE(n.id, c.id) IS NOT NULL;
+    GET DIAGNOSTICS linked = ROW_COUNT;
+
+    PERFORM set_config('offerless.backfill', 'off', true);
+    RETURN linked;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- Companies one user has applied to whose name contains or resembles
+-- `query`, closest first. The trigram index finds the candidates and the
+-- (company_id, user_id) index keeps those the user has applications at.
+CREATE OR REPLACE FUNCTION search_companies(uid UUID, query TEXT, max_results INTEGER)
+RETURNS TABLE (
+    id BIGINT,
+    name TEXT,
+    applications INTEGER
+) AS $$
+    SELECT c.id, c.name, COUNT(*)::INTEGER
+    FROM companies c
+    JOIN applications a ON a.company_id = c.id AND a.user_id = uid
+    WHERE c.normalized_key LIKE '%' || normalize_company_name(query) || '%'
+        OR c.normalized_key % normalize_company_name(query)
+    GROUP BY c.id
+    ORDER BY similarity(c.normalized_key, normalize_company_name(query)) DESC, COUNT(*) DESC, c.name
+    LIMIT max_results
+$$ LANGUAGE sql STABLE SECURITY DEFINER;
+
+-- Group the global company insights by the same normalized name, so they
+-- agree with the dictionary ("Google LLC" counts as Google)
+DROP MATERIALIZED VIEW global_company_insights;
+CREATE MATERIALIZED VIEW global_company_insights AS
+SELECT
+    normalize_company_name(company) AS company_key,
+    -- The most common spelling
+    mode() WITHIN GROUP (ORDER BY btrim(company)) AS company,
+    COUNT(DISTINCT user_id)::INTEGER AS applicants,
+    COUNT(*)::INTEGER AS applications,
+    COUNT(*) FILTER (WHERE status = 'offer')::INTEGER AS offers,
+    round(COUNT(*) FILTER (WHERE status = 'offer')::NUMERIC / COUNT(*), 4) AS offer_rate
+FROM applications
+GROUP BY 1
+HAVING COUNT(DISTINCT user_id) >= 5;
+
+CREATE UNIQUE INDEX global_company_insights_key_idx ON global_company_insights(company_key);
+CREATE INDEX global_company_insights_applications_idx ON global_company_insights(applications DESC);
+REVOKE ALL ON global_company_insights FROM PUBLIC, anon, authenticated;
+
+-- Only reachable through the API routes and the backfill script, which use
+-- the service role
+REVOKE EXECUTE ON FUNCTION search_companies(UUID, TEXT, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION backfill_application_companies(INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION company_id_for(TEXT) FROM PUBLIC, anon, authenticated;
+
+-- Enable Row Level Security; no policies, so the dictionary (which spans
+-- every user's applications) is only read through the functions above
+ALTER TABLE companies ENABLE ROW LEVEL SECURITY;
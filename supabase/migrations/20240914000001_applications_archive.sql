@@ -0,0 +1,290 @@
+-- Cold tier for closed applications. Rejected and ghosted applications
+-- that haven't changed in a year are never edited again, but in the hot
+-- table they sit in every per-user index scan and in every one of its
+-- indexes. archive_closed_applications() moves them to
+-- applications_archive, which has just the primary key and the default
+-- list order, and the list endpoint reads both tables through
+-- applications_with_archive when asked for includeArchived=true.
+--
+-- Archived applications still count: the daily buckets (stats, leaderboard,
+-- timeseries) and the status events (funnel) are left as they were when a
+-- row is archived, and adjusted only when the user deletes it from the
+-- archive.
+CREATE TABLE applications_archive (
+    id UUID NOT NULL,
+    user_id UUID NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    company TEXT NOT NULL,
+    job_title TEXT NOT NULL,
+    applied_at DATE NOT NULL,
+    status TEXT NOT NULL,
+    company_url TEXT NOT NULL,
+    salary_amount NUMERIC(12,2),
+    salary_type TEXT,
+    location_label TEXT,
+    location_kind TEXT,
+    created_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ,
+    sync_version BIGINT NOT NULL,
+    -- Copied, not generated: archived rows don't change
+    annual_salary NUMERIC,
+    company_id BIGINT REFERENCES companies(id),
+    archived_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (user_id, id)
+);
+
+CREATE INDEX applications_archive_user_applied_idx
+    ON applications_archive(user_id, applied_at DESC, id DESC);
+
+-- Finds archivable rows without scanning every user's applications
+CREATE INDEX applications_archivable_idx
+    ON applications(applied_at)
+    WHERE status IN ('rejected', 'ghosted');
+
+-- Hot and archived applications together. security_invoker makes the
+-- underlying tables' RLS apply to whoever queries the view. Filters, sort
+-- and LIMIT are pushed into both branches, so a page is a merge of two
+-- index scans.
+CREATE VIEW applications_with_archive WITH (security_invoker = true) AS
+SELECT
+    id, user_id, company, job_title, applied_at, status, company_url,
+    salary_amount, salary_type, location_label, location_kind,
+    created_at, updated_at, sync_version, annual_salary, company_id,
+    NULL::TIMESTAMPTZ AS archived_at
+FROM applications
+UNION ALL
+SELECT
+    id, user_id, company, job_title, applied_at, status, company_url,
+    salary_amount, salary_type, location_label, location_kind,
+    created_at, updated_at, sync_version, annual_salary, company_id,
+    archived_at
+FROM applications_archive;
+
+-- Moving a row to the archive deletes it from applications. Its buckets and
+-- status events must survive that, so the delete triggers for both skip
+-- statements run by the archiving job. The tombstone trigger still fires:
+-- to delta sync clients the row has left the hot list. Lists that include
+-- archived rows can't tell that from a delete, so clients refetch them on
+-- any tombstone instead (see applyApplicationChanges).
+DROP TRIGGER count_deleted_applications ON applications;
+CREATE TRIGGER count_deleted_applications
+    AFTER DELETE ON applications
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    WHEN (current_setting('offerless.archiving', true) IS DISTINCT FROM 'on')
+    EXECUTE FUNCTION apply_daily_application_counts();
+
+DROP TRIGGER record_deleted_application_status ON applications;
+CREATE TRIGGER record_deleted_application_status
+    AFTER DELETE ON applications
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    WHEN (current_setting('offerless.archiving', true) IS DISTINCT FROM 'on')
+    EXECUTE FUNCTION record_application_status_events();
+
+-- Deleting from the archive is a real delete: same bookkeeping as for the
+-- hot table, including a version bump so cached stats revalidate
+CREATE TRIGGER count_deleted_archived_applications
+    AFTER DELETE ON applications_archive
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_daily_application_counts();
+
+CREATE TRIGGER record_deleted_archived_application_status
+    AFTER DELETE ON applications_archive
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION record_application_status_events();
+
+CREATE TRIGGER record_archived_applications_tombstone
+    AFTER DELETE ON applications_archive
+    FOR EACH ROW EXECUTE FUNCTION record_application_tombstone();
+
+-- Moves up to batch_size rejected or ghosted applications, applied for and
+-- last changed more than `older_than` ago, to the archive and returns how
+-- many it moved. Rows still waiting for the company backfill are left for
+-- a later run. Intended to run on a schedule, e.g. nightly via pg_cron
+-- until it returns 0.
+CREATE OR REPLACE FUNCTION archive_closed_applications(
+    older_than INTERVAL DEFAULT '1 year',
+    batch_size INTEGER DEFAULT 10000
+)
+RETURNS INTEGER AS $$
+DECLARE
+    archived INTEGER;
+BEGIN
+    PERFORM set_config('offerless.archiving', 'on', true);
+
+    WITH candidates AS (
+        SELECT user_id, id
+        FROM applications
+        WHERE status IN ('rejected', 'ghosted')
+            AND applied_at < CURRENT_DATE - older_than
+            AND COALESCE(updated_at, created_at) < now() - older_than
+            AND company_id IS NOT NULL
+        LIMIT batch_size
+        FOR UPDATE SKIP LOCKED
+    ),
+    moved AS (
+        DELETE FROM applications a
+        USING candidates c
+        WHERE a.user_id = c.user_id AND a.id = c.id
+        RETURNING a.*
+    )
+    INSERT INTO applications_archive (
+        id, user_id, company, job_title, applied_at, status, company_url,
+        salary_amount, salary_type, location_label, location_kind,
+        created_at, updated_at, sync_version, annual_salary, company_id
+    )
+    SELECT
+        id, user_id, company, job_title, applied_at, status, company_url,
+        salary_amount, salary_type, location_label, location_kind,
+        created_at, updated_at, sync_version, annual_salary, company_id
+    FROM moved;
+    GET DIAGNOSTICS archived = ROW_COUNT;
+
+    PERFORM set_config('offerless.archiving', 'off', true);
+    RETURN archived;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+REVOKE EXECUTE ON FUNCTION archive_closed_applications(INTERVAL, INTEGER) FROM PUBLIC, anon, authenticated;
+
+-- Salary stats and the global insights describe every application a user
+-- has, so they read through the view too
+CREATE OR REPLACE FUNCTION salary_stats(uid UUID)
+RETURNS TABLE (
+    location_kind TEXT,
+    status TEXT,
+    samples INTEGER,
+    min NUMERIC,
+    max NUMERIC,
+    mean NUMERIC,
+    p25 NUMERIC,
+    p50 NUMERIC,
+    p75 NUMERIC,
+    p90 NUMERIC
+) AS $$
+    SELECT
+        location_kind,
+        status,
+        samples,
+        min,
+        max,
+        mean,
+        round(pct[1]::NUMERIC, 2),
+        round(pct[2]::NUMERIC, 2),
+        round(pct[3]::NUMERIC, 2),
+        round(pct[4]::NUMERIC, 2)
+    FROM (
+        SELECT
+            location_kind,
+            status,
+            COUNT(*)::INTEGER AS samples,
+            MIN(annual_salary) AS min,
+            MAX(annual_salary) AS max,
+            round(AVG(annual_salary), 2) AS mean,
+            -- One sort per group for all four percentiles
+            percentile_cont(ARRAY[0.25, 0.5, 0.75, 0.9]) WITHIN GROUP (ORDER BY annual_salary) AS pct
+        FROM applications_with_archive
+        WHERE user_id = uid AND annual_salary IS NOT NULL
+        GROUP BY location_kind, status
+    ) groups
+    ORDER BY location_kind, status
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION global_salary_stats()
+RETURNS TABLE (
+    location_kind TEXT,
+    status TEXT,
+    samples INTEGER,
+    min NUMERIC,
+    max NUMERIC,
+    mean NUMERIC,
+    p25 NUMERIC,
+    p50 NUMERIC,
+    p75 NUMERIC,
+    p90 NUMERIC
+) AS $$
+    SELECT
+        location_kind,
+        status,
+        samples,
+        round(min, -3),
+        round(max, -3),
+        round(mean, -3),
+        round(pct[1]::NUMERIC, -3),
+        round(pct[2]::NUMERIC, -3),
+        round(pct[3]::NUMERIC, -3),
+        round(pct[4]::NUMERIC, -3)
+    FROM (
+        SELECT
+            location_kind,
+            status,
+            COUNT(*)::INTEGER AS samples,
+            MIN(annual_salary) AS min,
+            MAX(annual_salary) AS max,
+            AVG(annual_salary) AS mean,
+            percentile_cont(ARRAY[0.25, 0.5, 0.75, 0.9]) WITHIN GROUP (ORDER BY annual_salary) AS pct
+        FROM applications_with_archive
+        WHERE annual_salary IS NOT NULL
+        GROUP BY location_kind, status
+        HAVING COUNT(DISTINCT user_id) >= 5
+    ) groups
+    ORDER BY location_kind, status
+$$ LANGUAGE sql STABLE SECURITY DEFINER;
+
+DROP MATERIALIZED VIEW global_company_insights;
+CREATE MATERIALIZED VIEW global_company_insights AS
+SELECT
+    normalize_company_name(company) AS company_key,
+    -- The most common spelling
+    mode() WITHIN GROUP (ORDER BY btrim(company)) AS company,
+    COUNT(DISTINCT user_id)::INTEGER AS applicants,
+    COUNT(*)::INTEGER AS applications,
+    COUNT(*) FILTER (WHERE status = 'offer')::INTEGER AS offers,
+    round(COUNT(*) FILTER (WHERE status = 'offer')::NUMERIC / COUNT(*), 4) AS offer_rate
+FROM applications_with_archive
+GROUP BY 1
+HAVING COUNT(DISTINCT user_id) >= 5;
+
+CREATE UNIQUE INDEX global_company_insights_key_idx ON global_company_insights(company_key);
+CREATE INDEX global_company_insights_applications_idx ON global_company_insights(applications DESC);
+
+DROP MATERIALIZED VIEW global_job_title_insights;
+CREATE MATERIALIZED VIEW global_job_title_insights AS
+SELECT
+    lower(btrim(job_title)) AS job_title_key,
+    mode() WITHIN GROUP (ORDER BY btrim(job_title)) AS job_title,
+    COUNT(DISTINCT user_id)::INTEGER AS applicants,
+    COUNT(*)::INTEGER AS applications,
+    COUNT(salary_amount)::INTEGER AS salary_samples,
+    round(percentile_cont(0.5) WITHIN GROUP (ORDER BY annual_salary)::NUMERIC, 2) AS median_salary
+FROM applications_with_archive
+GROUP BY 1
+HAVING COUNT(DISTINCT user_id) >= 5;
+
+CREATE UNIQUE INDEX global_job_title_insights_key_idx ON global_job_title_insights(job_title_key);
+CREATE INDEX global_job_title_insights_applications_idx ON global_job_title_insights(applications DESC);
+
+DROP MATERIALIZED VIEW global_location_insights;
+CREATE MATERIALIZED VIEW global_location_insights AS
+SELECT
+    location_kind,
+    COUNT(*)::INTEGER AS applications,
+    round(COUNT(*)::NUMERIC / SUM(COUNT(*)) OVER (), 4) AS share
+FROM applications_with_archive
+WHERE location_kind IS NOT NULL
+GROUP BY location_kind;
+
+CREATE UNIQUE INDEX global_location_insights_kind_idx ON global_location_insights(location_kind);
+
+REVOKE ALL ON global_company_insights, global_job_title_insights, global_location_insights
+    FROM PUBLIC, anon, authenticated;
+
+-- Enable Row Level Security. Archived rows are read-only apart from
+-- deletion; they only get there through archive_closed_applications().
+ALTER TABLE applications_archive ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view own archived applications" ON applications_archive
+    FOR SELECT USING (auth.uid() = user_id);
+
+CREATE POLICY "Users can delete own archived applications" ON applications_archive
+    FOR DELETE USING (auth.uid() = user_id);